@@ -23,6 +23,16 @@ st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
 from interview_platform.ui.pages import landing, setup, interview, report, analytics
 
 
+@st.cache_resource
+def _warm_model_clients() -> int:
+    """Build the pooled Gemini clients once per process, not per rerun."""
+    from interview_platform.services import client_pool
+    return client_pool.warm_up(settings.gemini_api_key)
+
+
+_warm_model_clients()
+
+
 class _State:
     _DEFAULTS = {
         "screen":               "landing",
@@ -33,6 +43,7 @@ class _State:
         "current_question":     None,
         "answers":              [],
         "messages":             [],
+        "pending_evals":        [],     # background scorecards (pipelined turns)
         "max_questions_override": 8,
     }
 
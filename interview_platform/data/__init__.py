@@ -1 +1,2 @@
-from .question_bank import QUESTION_BANK, SKILLS, IDEAL_ANSWERS
+from .question_bank import QUESTION_BANK, SKILLS, IDEAL_ANSWERS, IDEAL_INDEX, question_hash
+from .profiles import ROLES, COMPANIES, EXPERIENCE
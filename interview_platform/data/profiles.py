@@ -0,0 +1,14 @@
+"""
+data/profiles.py — the categorical choices offered on the profile form.
+Shared by the setup page and the strategy precompute tool.
+"""
+
+from typing import List
+
+ROLES: List[str] = [
+    "ML Engineer", "Data Scientist", "AI Researcher",
+    "Deep Learning Engineer", "MLOps Engineer", "NLP Engineer",
+    "Computer Vision Engineer", "Data Engineer", "AI Product Manager",
+]
+COMPANIES:  List[str] = ["FAANG / Big Tech", "Startup", "Research Lab", "Mid-size Tech", "Finance / Quant"]
+EXPERIENCE: List[str] = ["Student", "Fresher / New Grad", "1-2 Years", "3-5 Years", "5+ Years"]
@@ -6,6 +6,8 @@ Each question is handcrafted for technical depth and interview realism.
 ─────────────────────────────────────────────────────────────
 """
 
+import hashlib
+import re
 from typing import Dict, List
 
 QUESTION_BANK: Dict[str, Dict[str, List[str]]] = {
@@ -155,7 +157,7 @@ SKILLS: List[str] = list(QUESTION_BANK.keys())
 
 
 # ── Pre-written ideal answers for common questions ────────────────
-# Key = first 80 chars of the question text
+# Key = full question text (look up via IDEAL_INDEX / question_hash)
 IDEAL_ANSWERS: dict = {
     "What is bias in machine learning? Provide a concrete real-world example.": (
         "Bias is the error introduced by approximating a complex real-world problem with a simplified model — "
@@ -197,3 +199,16 @@ IDEAL_ANSWERS: dict = {
         "making the computation O(parameters) rather than O(parameters²)."
     ),
 }
+
+
+# ── Stable question identity ──────────────────────────────────────
+_WS = re.compile(r"\s+")
+
+
+def question_hash(question: str) -> str:
+    """Whitespace-insensitive SHA-256 of the question text."""
+    norm = _WS.sub(" ", (question or "").strip())
+    return hashlib.sha256(norm.encode("utf-8")).hexdigest()
+
+
+IDEAL_INDEX: Dict[str, str] = {question_hash(q): a for q, a in IDEAL_ANSWERS.items()}
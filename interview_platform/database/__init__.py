@@ -1,2 +1,5 @@
-from .base import Base, engine, SessionLocal, init_db, get_db
-from .models import User, InterviewSession, Answer
+from .base import Base, engine, SessionLocal, init_db, get_db, enable_wal
+from .models import (
+    User, InterviewSession, Answer, EvalCacheEntry, IdealAnswer, StrategyVariant,
+    AnswerEvaluation, RescoreCheckpoint, EvalJob, EvalPassResult,
+)
@@ -3,6 +3,8 @@ database/base.py
 SQLAlchemy engine, session, and table initialisation.
 """
 
+import threading
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
@@ -27,6 +29,41 @@ def get_db() -> Session:
         db.close()
 
 
+_INIT_LOCK = threading.Lock()
+
+
 def init_db():
     from . import models  # noqa – registers all ORM classes
-    Base.metadata.create_all(bind=engine)
+    # Serialised: worker threads may all hit first use of a fresh database
+    with _INIT_LOCK:
+        Base.metadata.create_all(bind=engine)
+        _add_missing_columns(engine)
+
+
+def _add_missing_columns(bind) -> None:
+    """
+    create_all() never alters an existing table: add columns introduced
+    since the database was created (nullable, no default — old rows read
+    as NULL).
+    """
+    from sqlalchemy import inspect
+    insp = inspect(bind)
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not insp.has_table(table.name):
+                continue
+            have = {c["name"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name not in have:
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table.name} ADD COLUMN {col.name} "
+                        f"{col.type.compile(dialect=bind.dialect)}"
+                    )
+
+
+def enable_wal(bind=None) -> None:
+    """SQLite WAL: readers and one writer stop blocking each other (persists in the file)."""
+    bind = bind or engine
+    if bind.dialect.name == "sqlite":
+        with bind.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
@@ -1,13 +1,21 @@
 """
 database/models.py
 ORM models:  User → InterviewSession → Answer
+             EvalCacheEntry (evaluation cache)
+             IdealAnswer    (generated reference answers)
+             StrategyVariant (cached strategies per normalised profile)
+             AnswerEvaluation (versioned re-scores of answers)
+             RescoreCheckpoint (resume point of a re-scoring job)
+             EvalJob          (durable evaluation queue, services/job_queue.py)
+             EvalPassResult   (Pass 1 / Pass 2 output per evaluation attempt,
+                               services/pass_store.py)
 """
 
 from datetime import datetime
 
 from sqlalchemy import (
     Boolean, Column, DateTime, Float,
-    ForeignKey, Integer, JSON, String, Text,
+    ForeignKey, Integer, JSON, String, Text, UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 
@@ -65,6 +73,108 @@ class Answer(Base):
     ideal_answer      = Column(Text, nullable=True)
     follow_up_question = Column(Text, nullable=True)
     is_follow_up      = Column(Boolean, default=False)
+    degraded          = Column(Boolean, default=False)   # provisional score (deadline ran out)
     answered_at       = Column(DateTime, default=datetime.utcnow)
 
     session = relationship("InterviewSession", back_populates="answers")
+
+
+class EvalCacheEntry(Base):
+    """Content-addressed evaluation result (see services/eval_cache.py)."""
+    __tablename__ = "eval_cache"
+
+    cache_key      = Column(String(64), primary_key=True)
+    prompt_version = Column(String(16), index=True)
+    model          = Column(String(100))
+    result_json    = Column(JSON)
+    hit_count      = Column(Integer, default=0)
+    created_at     = Column(DateTime, default=datetime.utcnow)
+    last_hit_at    = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class IdealAnswer(Base):
+    """Generated expert answer, keyed by question_hash() of the question."""
+    __tablename__ = "ideal_answers"
+
+    question_hash = Column(String(64), primary_key=True)
+    skill         = Column(String(100), index=True)
+    question_text = Column(Text)
+    answer_text   = Column(Text)
+    model         = Column(String(100))
+    created_at    = Column(DateTime, default=datetime.utcnow)
+
+
+class StrategyVariant(Base):
+    """One stored strategy for a normalised profile (services/strategy_store.py)."""
+    __tablename__ = "strategy_cache"
+
+    profile_key    = Column(String(64), primary_key=True)
+    variant        = Column(Integer, primary_key=True)
+    prompt_version = Column(String(16), index=True)
+    profile_json   = Column(JSON)
+    strategy_json  = Column(JSON)
+    model          = Column(String(100))
+    created_at     = Column(DateTime, default=datetime.utcnow)
+
+
+class AnswerEvaluation(Base):
+    """One answer re-scored under one evaluation version (tools/rescore.py)."""
+    __tablename__ = "answer_evaluations"
+    __table_args__ = (UniqueConstraint("answer_id", "eval_version"),)
+
+    evaluation_id    = Column(Integer, primary_key=True, autoincrement=True)
+    answer_id        = Column(Integer, ForeignKey("answers.answer_id"), nullable=False, index=True)
+    eval_version     = Column(String(100), nullable=False, index=True)
+    prompt_version   = Column(String(16))
+    model            = Column(String(100))
+    passes           = Column(Integer)
+    overall_score    = Column(Float)
+    concept_score    = Column(Float)
+    clarity_score    = Column(Float)
+    confidence_score = Column(Float)
+    result_json      = Column(JSON)
+    created_at       = Column(DateTime, default=datetime.utcnow)
+
+
+class RescoreCheckpoint(Base):
+    """Progress of a re-scoring job; answers are processed in answer_id order."""
+    __tablename__ = "rescore_checkpoints"
+
+    eval_version   = Column(String(100), primary_key=True)
+    last_answer_id = Column(Integer, default=0)
+    processed      = Column(Integer, default=0)
+    failed         = Column(Integer, default=0)
+    started_at     = Column(DateTime, default=datetime.utcnow)
+    updated_at     = Column(DateTime, default=datetime.utcnow)
+    finished_at    = Column(DateTime, nullable=True)
+
+
+class EvalJob(Base):
+    """One queued answer evaluation; claimed and leased by tools/eval_worker.py."""
+    __tablename__ = "eval_jobs"
+
+    job_id       = Column(Integer, primary_key=True, autoincrement=True)
+    session_id   = Column(Integer, ForeignKey("interview_sessions.session_id"), index=True)
+    question_json = Column(JSON)            # question, skill, difficulty, is_follow_up
+    answer_text  = Column(Text)
+    skipped      = Column(Boolean, default=False)
+    status       = Column(String(10), default="queued", index=True)   # queued|running|done|failed
+    attempts     = Column(Integer, default=0)
+    worker       = Column(String(100), nullable=True)
+    lease_until  = Column(DateTime, nullable=True)
+    result_json  = Column(JSON, nullable=True)
+    error        = Column(Text, nullable=True)
+    created_at   = Column(DateTime, default=datetime.utcnow)
+    started_at   = Column(DateTime, nullable=True)
+    finished_at  = Column(DateTime, nullable=True)
+
+
+class EvalPassResult(Base):
+    """One finished pass of an evaluation attempt, kept until the attempt completes."""
+    __tablename__ = "eval_pass_results"
+
+    attempt_id     = Column(String(64), primary_key=True)
+    pass_name      = Column(String(16), primary_key=True)     # pass1 | pass2
+    prompt_version = Column(String(16))
+    result_json    = Column(JSON)
+    created_at     = Column(DateTime, default=datetime.utcnow, index=True)
@@ -1,12 +1,19 @@
 """
 engine/interview_engine.py — Adaptive interview orchestration
 FIX: submit_answer now accepts skipped=True flag, passes it to AI evaluator.
+Pipelined turns: submit_answer_async evaluates and stores on a background
+worker when the next question does not depend on the scorecard.
+With settings.eval_queue_enabled both submit paths enqueue the
+evaluation in eval_jobs for the worker processes (tools/eval_worker.py)
+instead of evaluating in-process; submit_answer polls for the result.
 """
 
 import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -16,12 +23,27 @@ from ..database.models import Answer, InterviewSession, User
 from ..services.ai_service import AIService
 from ..services.analytics_service import AnalyticsService
 
+# ── Background evaluations for pipelined turns ────────────────────
+_BACKGROUND: Optional[ThreadPoolExecutor] = None
+_BACKGROUND_LOCK = threading.Lock()
+
+
+def _background() -> ThreadPoolExecutor:
+    global _BACKGROUND
+    with _BACKGROUND_LOCK:
+        if _BACKGROUND is None:
+            _BACKGROUND = ThreadPoolExecutor(max_workers=settings.pipeline_workers,
+                                             thread_name_prefix="aiip-pipeline")
+        return _BACKGROUND
+
 
 class InterviewEngine:
 
-    def __init__(self, ai: AIService, db: Session):
+    def __init__(self, ai: AIService, db: Session,
+                 rng: Optional[random.Random] = None):
         self.ai  = ai
         self.db  = db
+        self.rng = rng or random        # seeded Random → reproducible question picks
         self.strategy:         Optional[dict] = None
         self.session_obj:      Optional[InterviewSession] = None
         self.answers:          List[dict] = []
@@ -87,33 +109,143 @@ class InterviewEngine:
         self.used_skills.append(skill)
         self.question_count += 1
         self.current_question = {
-            "question":     random.choice(pool),
+            "question":     self.rng.choice(pool),
             "skill":        skill,
             "difficulty":   diff,
             "is_follow_up": False,
         }
         return self.current_question
 
-    def submit_answer(self, answer_text: str, skipped: bool = False) -> dict:
+    def submit_answer(self, answer_text: str, skipped: bool = False,
+                      on_partial: Optional[Callable[[dict], None]] = None) -> dict:
         """
         Evaluate the answer. If skipped=True, passes that flag to AIService
         which returns honest 0/0/0/0 scores — never fakes good feedback.
+        on_partial receives the streamed scorecard as it is parsed.
         """
         if not self.current_question:
             raise ValueError("No active question — call next_question() first.")
 
+        if self._queued():
+            ev = self._await_job(answer_text, skipped)
+            self.answers.append({**ev, "skill_tested": self.current_question["skill"]})
+            return ev
+
         ev = self.ai.evaluate_answer(
             question   = self.current_question["question"],
             answer     = answer_text,
             skill      = self.current_question["skill"],
             difficulty = self.current_question["difficulty"],
             skipped    = skipped,
+            on_partial = on_partial,
+            draft_key  = self.draft_key(self.session_obj.session_id, self.question_count),
         )
-        rec = Answer(
-            session_id         = self.session_obj.session_id,
-            skill_tested       = self.current_question["skill"],
-            difficulty         = self.current_question["difficulty"],
-            question_text      = self.current_question["question"],
+        self.db.add(self.answer_row(self.session_obj.session_id, self.current_question,
+                                    answer_text, skipped, ev))
+        self.db.commit()
+        self.answers.append({**ev, "skill_tested": self.current_question["skill"]})
+        return ev
+
+    def can_pipeline(self) -> bool:
+        """True if next_question() cannot depend on the current answer's scorecard."""
+        q = self.current_question or {}
+        return (
+            not (self.strategy or {}).get("probing_enabled")
+            or q.get("is_follow_up", False)
+            or self.follow_up_count.get(q.get("skill"), 0) >= settings.max_follow_ups_per_skill
+        )
+
+    def submit_answer_async(self, answer_text: str, skipped: bool = False) -> "Future[dict]":
+        """
+        Like submit_answer, but evaluates and stores on a background worker
+        with its own DB session; the Future resolves to the scorecard. The
+        caller moves on to next_question() right away and adds the
+        scorecard to self.answers / the UI history once it is ready.
+        """
+        if not self.current_question:
+            raise ValueError("No active question — call next_question() first.")
+        if self._queued():
+            from ..services.job_queue import job_queue
+            return job_queue.handle(self._enqueue(answer_text, skipped))
+        question   = dict(self.current_question)
+        session_id = self.session_obj.session_id
+        draft_key  = self.draft_key(session_id, self.question_count)
+
+        def _run() -> dict:
+            from ..database.base import SessionLocal
+            ev = self.ai.evaluate_answer(
+                question   = question["question"],
+                answer     = answer_text,
+                skill      = question["skill"],
+                difficulty = question["difficulty"],
+                skipped    = skipped,
+                draft_key  = draft_key,
+            )
+            db = SessionLocal()
+            try:
+                db.add(self.answer_row(session_id, question, answer_text, skipped, ev))
+                db.commit()
+            finally:
+                db.close()
+            return ev
+
+        return _background().submit(_run)
+
+    @staticmethod
+    def draft_key(session_id: int, question_count: int) -> str:
+        """Names one question's answer draft for speculative Pass 1 (AIService)."""
+        return f"{session_id}:{question_count}"
+
+    def _queued(self) -> bool:
+        return settings.eval_queue_enabled and not self.ai.mock
+
+    def _enqueue(self, answer_text: str, skipped: bool) -> int:
+        from ..services.job_queue import job_queue
+        return job_queue.enqueue(self.session_obj.session_id, dict(self.current_question),
+                                 answer_text, skipped)
+
+    def _await_job(self, answer_text: str, skipped: bool) -> dict:
+        """
+        Enqueue and poll for the worker's scorecard. If no worker has
+        picked the job up within eval_job_wait_s, withdraw it and
+        evaluate in-process rather than leave the candidate waiting. A
+        worker that has it gets one lease (eval_job_lease_s) to finish;
+        after that the job is withdrawn too, so a stuck or dead worker
+        cannot block the page. A job that failed every attempt is also
+        evaluated inline, so the answer still gets its row.
+        """
+        from ..services.job_queue import JobFailed, job_queue
+        job_id = self._enqueue(answer_text, skipped)
+        handle = job_queue.handle(job_id)
+        try:
+            try:
+                return handle.result(timeout=settings.eval_job_wait_s)
+            except TimeoutError:
+                if not job_queue.cancel(job_id):
+                    try:
+                        return handle.result(timeout=settings.eval_job_lease_s)
+                    except TimeoutError:
+                        if not job_queue.cancel(job_id, running=True):
+                            return handle.result()  # finished just now
+        except JobFailed as exc:
+            print(f"[InterviewEngine] eval job {job_id} failed: {exc}")
+        print(f"[InterviewEngine] no eval worker finished job {job_id} — evaluating inline")
+        q  = self.current_question
+        ev = self.ai.evaluate_answer(q["question"], answer_text, q["skill"],
+                                     q["difficulty"], skipped=skipped)
+        self.db.add(self.answer_row(self.session_obj.session_id, q, answer_text, skipped, ev))
+        self.db.commit()
+        return ev
+
+    @staticmethod
+    def answer_row(session_id: int, question: dict, answer_text: str,
+                   skipped: bool, ev: dict) -> Answer:
+        """The `answers` row for one evaluated answer (not yet added to a session)."""
+        return Answer(
+            session_id         = session_id,
+            skill_tested       = question["skill"],
+            difficulty         = question["difficulty"],
+            question_text      = question["question"],
             answer_text        = answer_text if not skipped else "— skipped —",
             overall_score      = ev["overall_score"],
             concept_score      = ev["concept_score"],
@@ -125,12 +257,9 @@ class InterviewEngine:
             weak_skills        = ev.get("weak_skills", []),
             ideal_answer       = ev["ideal_answer"],
             follow_up_question = ev.get("follow_up_question"),
-            is_follow_up       = self.current_question.get("is_follow_up", False),
+            is_follow_up       = question.get("is_follow_up", False),
+            degraded           = bool(ev.get("degraded")),
         )
-        self.db.add(rec)
-        self.db.commit()
-        self.answers.append({**ev, "skill_tested": self.current_question["skill"]})
-        return ev
 
     def finalize(self) -> dict:
         report = AnalyticsService.full_report(
@@ -16,163 +16,297 @@ Three-Pass Evaluation Logic:
   Pass 3 — Scoring: Assign 0-10 per dimension using rubric anchors
             + generate specific, actionable feedback.
 
+settings.eval_passes = 1 selects the fused mode instead: one structured
+call does extraction, comparison and scoring (≈3× fewer calls/tokens),
+returning the same scorecard schema.
+
+Ideal-answer generation and Pass 1 do not depend on each other, so
+with settings.eval_concurrent they run side by side and Pass 2 starts
+as soon as both are back — one round trip off the critical path.
+
+Calls go out through a pluggable backend (backends.py): Gemini by
+default, or plain HTTP to the local stand-in server for offline load
+tests — settings.llm_backend.
+
+Every model call goes through the shared ModelRouter: slow primaries
+are hedged to settings.gemini_model_fallback, failures fail over to it
+immediately, and a circuit breaker sidelines a primary that keeps failing.
+Prompts (prompts.py) are a static prefix + per-call body, the prefix
+first so the provider's implicit prefix cache can serve it (prompt_cache.py).
+Each call leases the least-loaded healthy key from a pool of API keys
+(key_pool.py) — keys hitting quota errors cool down. Underneath, the
+process-wide CallGovernor rate-limits each key and caps calls in
+flight, queueing sessions FIFO. Identical calls already in
+flight (same prompt hash) are coalesced into one (single_flight.py).
+Opt-in micro-batching (batcher.py) packs concurrent sessions' Pass 1
+(and optionally Pass 2) items into one multi-item request. Opt-in
+speculation (speculation.py) runs Pass 1 on the draft answer while the
+candidate is still typing and reuses it if the submitted text matches.
+
+settings.async_ai moves all of this onto one shared asyncio event loop
+(async_ai.py): AsyncAIService awaits the backends' async calls, and
+shared() hands out a blocking wrapper with this class's API.
+
+Each evaluation runs against an end-to-end budget (settings.eval_deadline_s,
+deadline.py) handed to every pass as the remaining time. When it runs
+out, the passes that finished yield a provisional scorecard marked
+"degraded" — scored from Pass 2 or Pass 1 alone, with the stored ideal
+answer — instead of keeping the candidate waiting.
+
+Pass 1 and Pass 2 results are stored per evaluation attempt as they
+return (pass_store.py). If the evaluation then fails or runs out of
+time, the next attempt at the same answer — a re-submission, a queue
+retry — resumes after the last stored pass instead of paying for it again.
+
+Structured calls request native JSON output constrained to the typed
+result models in schemas.py; a reply that does not validate counts as a
+failed call (so the router can fail over) rather than silently scoring
+0. A reply cut off at max_output_tokens is finished with a short
+continuation request instead of being re-run from scratch.
+
 Model: gemini-2.5-pro-preview (best reasoning, best instruction-follow)
 Temperature: 0.0 for evaluation (fully deterministic)
              0.5 for strategy (creative, personalised)
 ═══════════════════════════════════════════════════════════════
 """
 
+import hashlib
 import json
-import time
+import queue
 import random
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 from ..config import settings
-from ..data.question_bank import SKILLS, IDEAL_ANSWERS
-
-try:
-    import google.generativeai as genai
-    _SDK_OK = True
-except ImportError:
-    _SDK_OK = False
-
-
-# ── Scoring rubric anchors (same for every call) ──────────────────
-RUBRIC = """
-SCORING RUBRIC — apply these criteria strictly:
-
-OVERALL / CONCEPT SCORE:
-  9-10: Precise definition + correct math/derivation + production example + trade-offs discussed
-  7-8:  Correct concepts + good depth + minor gaps in math or examples
-  5-6:  Mostly correct but missing depth, equations, or real examples
-  3-4:  Partially correct, notable conceptual errors, or surface-level only
-  1-2:  Mostly wrong, buzzwords without substance, or off-topic
-  0:    No answer, single word, or complete nonsense
-
-CLARITY SCORE:
-  9-10: Perfect structure (define→explain→example→trade-off), precise language, no ambiguity
-  7-8:  Clear and well-organised with minor structure issues
-  5-6:  Understandable but rambling or lacks clear flow
-  3-4:  Hard to follow, jumps around, or contradicts itself
-  1-2:  Very unclear or incoherent
-  0:    Cannot be evaluated
-
-CONFIDENCE SCORE:
-  9-10: Decisive statements, uses technical vocabulary correctly, no unjustified hedging
-  7-8:  Mostly confident with occasional unnecessary qualification
-  5-6:  Mix of confident and uncertain statements
-  3-4:  Frequent hedging without justification ("I think maybe…")
-  1-2:  Highly uncertain or apologetic throughout
-  0:    Cannot be evaluated
-
-IMPORTANT: Do NOT round up. A 5 means average. A 7 means genuinely good.
-A 9 or 10 should be rare — only for truly exceptional answers.
-"""
+from ..data.question_bank import SKILLS
+from . import client_pool
+from .backends import make_backend
+from .batcher import MicroBatcher
+from .deadline import Deadline, DeadlineExceeded
+from .eval_cache import EvalCache
+from .ideal_store import ideal_store
+from .json_stream import IncrementalJSONParser
+from .key_pool import KeyPool, resolve_keys
+from .model_router import router
+from .pass_store import PassStore
+from .prompts import (  # noqa – RUBRIC re-exported for existing importers
+    FUSED, IDEAL, PASS1, PASS1_BATCH, PASS2, PASS2_BATCH, PASS3, PROMPT_VERSION, RUBRIC,
+    STRATEGY, BatchTemplate, Prompt, PromptTemplate, continuation,
+)
+from .rate_limiter import governor
+from .schemas import (
+    BATCH_ITEM_TYPES, RESULT_TYPES, batch_schema, response_schema, validate, validate_batch,
+)
+from .single_flight import single_flight
+from .speculation import SpeculativeExtractions
+from .strategy_store import StrategyStore, profile_key
+
+
+# ── Shared worker pool for overlapping independent passes ─────────
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=settings.eval_max_workers,
+                thread_name_prefix="aiip-eval",
+            )
+        return _EXECUTOR
+
+
+_SHARED: dict = {}
+_SHARED_LOCK = threading.Lock()
+_TOPPING_UP: set = set()          # profile keys with a background variant call running
 
 
 class AIService:
 
-    def __init__(self, api_key: Optional[str] = None, mock: bool = False):
-        self.mock = mock
-        self._eval_model     = None
-        self._strategy_model = None
-        key = api_key or settings.gemini_api_key
-
-        if not mock and key:
-            if _SDK_OK:
-                genai.configure(api_key=key)
-                # Evaluation: fully deterministic
-                self._eval_model = genai.GenerativeModel(
-                    model_name=settings.gemini_model_eval,
-                    generation_config=genai.GenerationConfig(
-                        temperature=0.0,
-                        max_output_tokens=1800,
-                    ),
-                )
-                # Strategy: creative & personalised
-                self._strategy_model = genai.GenerativeModel(
-                    model_name=settings.gemini_model_strategy,
-                    generation_config=genai.GenerationConfig(
-                        temperature=0.5,
-                        max_output_tokens=800,
-                    ),
+    def __init__(self, api_key: Optional[str] = None, mock: bool = False,
+                 rng: Optional[random.Random] = None):
+        self.mock    = mock
+        self.backend = None
+        self._rng    = rng or random        # strategy variant picks and fallbacks
+        self._cache  = EvalCache(PROMPT_VERSION) if settings.eval_cache_enabled else None
+        self._strategies = StrategyStore(PROMPT_VERSION, rng=rng) \
+            if settings.strategy_cache_enabled else None
+        self._passes = PassStore(PROMPT_VERSION) if settings.eval_resume_enabled else None
+        self._speculative = SpeculativeExtractions() if settings.speculative_extraction else None
+        self._batchers: dict = {}       # pass → MicroBatcher, when batching is enabled
+        for name, on, batch, single in (("pass1", settings.batch_extraction, PASS1_BATCH, PASS1),
+                                        ("pass2", settings.batch_comparison, PASS2_BATCH, PASS2)):
+            if on:
+                self._batchers[name] = MicroBatcher(
+                    lambda items, b=batch, t=single: self._run_batch(b, t, items),
+                    settings.batch_max_wait_ms / 1000.0, settings.batch_max_items, name,
                 )
-            else:
-                print("[AIService] google-generativeai not installed.")
+        specs = resolve_keys(api_key)
+        self.api_key = specs[0][0] or None
+        self.keys    = KeyPool(specs)
+        self._backends: dict = {}       # api key → backend bound to it
+
+        if not mock:
+            for key, _ in specs:
+                backend = make_backend(key or None)
+                if backend is not None:
+                    self._backends[key] = backend
+            if not self._backends:
+                print(f"[AIService] {settings.llm_backend} backend unavailable — using mock.")
                 self.mock = True
-        elif not mock:
-            self.mock = True
+            else:
+                self.keys    = KeyPool([s for s in specs if s[0] in self._backends])
+                self.backend = next(iter(self._backends.values()))
+
+    @classmethod
+    def shared(cls, api_key: Optional[str] = None, mock: bool = False) -> "AIService":
+        """
+        Process-wide instance per (api_key, mock) — safe across reruns and
+        sessions. With settings.async_ai, the blocking wrapper around
+        AsyncAIService (async_ai.py), which has the same API.
+        """
+        key = (api_key or settings.gemini_api_key, bool(mock))
+        with _SHARED_LOCK:
+            svc = _SHARED.get(key)
+            if svc is None:
+                if settings.async_ai and cls is AIService:
+                    from .async_ai import BlockingAIService
+                    svc = BlockingAIService(api_key=api_key, mock=mock)
+                else:
+                    svc = cls(api_key=api_key, mock=mock)
+                _SHARED[key] = svc
+            return svc
 
     # ═══════════════════════════════════════════════════════════════
     #  PUBLIC API
     # ═══════════════════════════════════════════════════════════════
 
     def generate_strategy(self, profile: dict) -> dict:
-        """Generate a personalised interview strategy."""
+        """
+        Personalised interview strategy. Served from the strategy cache
+        (one of the stored variants for this normalised profile) when
+        possible; a pool that is not yet full is topped up in the
+        background, so only a profile's very first session waits.
+        """
         if self.mock:
             return self._mock_strategy()
-
-        prompt = f"""
-You are a principal ML interview architect at a top tech company.
-Analyse this candidate profile and build a targeted interview strategy.
-Return ONLY valid JSON — no markdown, no explanation.
-
-CANDIDATE:
-  Role target:    {profile['role']}
-  Company type:   {profile['company_type']}
-  Experience:     {profile['experience']}
-  Self-reported weak areas: {', '.join(profile.get('weak_areas', [])) or 'none'}
-  Career goal:    {profile.get('career_goal', '') or 'not specified'}
-
-AVAILABLE SKILLS: {', '.join(SKILLS)}
-
-CALIBRATION RULES:
-  FAANG / Big Tech → hard difficulty, deep theory, math derivations required
-  Startup          → medium, applied ML, system design, MLOps
-  Research Lab     → hard, optimisation theory, paper-level depth
-  Finance / Quant  → hard, statistics, probability, risk
-  Student/Fresher  → easy-medium, strong fundamentals, conceptual clarity
-  1-2 Years        → medium, applied knowledge, some depth
-  3-5 Years        → hard, design decisions, production experience
-  5+ Years         → hard, architecture, leadership, edge cases
-
-RULES:
-- Prioritise self-reported weak areas as focus skills
-- Pick exactly 4 focus skills most relevant to their target role
-- interview_style must match the company type
-- style_reason must be 1 specific, actionable sentence
-
-Return EXACTLY:
-{{
-  "focus_skills":    ["s1","s2","s3","s4"],
-  "difficulty":      "easy|medium|hard",
-  "interview_style": "conceptual|research|applied|system-design",
-  "probing_enabled": true,
-  "style_reason":    "One specific sentence explaining this strategy."
-}}"""
-
-        raw = self._call_json(prompt, model="strategy")
+        if not self._strategies:
+            return self.fresh_strategy(profile)[0]
+
+        cached, stored = self._strategies.sample(profile)
+        if cached is None:
+            strategy, ok = self.fresh_strategy(profile)
+            if ok:
+                self._strategies.put(profile, strategy, settings.gemini_model_strategy)
+            return strategy
+        if stored < self._strategies.pool_size:
+            key = profile_key(profile)
+            with _SHARED_LOCK:
+                start = key not in _TOPPING_UP
+                _TOPPING_UP.add(key)
+            if start:
+                _executor().submit(self._add_strategy_variant, key, dict(profile))
+        return cached
+
+    def _add_strategy_variant(self, key: str, profile: dict) -> None:
+        try:
+            strategy, ok = self.fresh_strategy(profile)
+            if ok:
+                self._strategies.put(profile, strategy, settings.gemini_model_strategy)
+        finally:
+            with _SHARED_LOCK:
+                _TOPPING_UP.discard(key)
+
+    def fresh_strategy(self, profile: dict) -> Tuple[dict, bool]:
+        """(strategy, ok) from a new model call; ok is False if defaults were used."""
+        raw = self._call_json(self._strategy_prompt(profile), model="strategy")
+        return self._strategy_from(raw)
+
+    def _strategy_prompt(self, profile: dict) -> Prompt:
+        # With the strategy cache on, a strategy is shared by every
+        # candidate with the same categorical profile, so the free-text
+        # career goal (not part of the cache key) is never sent.
+        goal = '' if self._strategies else profile.get('career_goal', '')
+        return STRATEGY.render(
+            role         = profile['role'],
+            company_type = profile['company_type'],
+            experience   = profile['experience'],
+            weak_areas   = ', '.join(profile.get('weak_areas', [])) or 'none',
+            career_goal  = goal or 'not specified',
+            skills       = ', '.join(SKILLS),
+        )
+
+    def _strategy_from(self, raw: dict) -> Tuple[dict, bool]:
         valid = [s for s in raw.get("focus_skills", []) if s in SKILLS]
         return {
-            "focus_skills":    valid[:4] if valid else random.sample(SKILLS, 4),
+            "focus_skills":    valid[:4] if valid else self._rng.sample(SKILLS, 4),
             "difficulty":      raw.get("difficulty",      "medium"),
             "interview_style": raw.get("interview_style", "applied"),
             "probing_enabled": bool(raw.get("probing_enabled", True)),
             "style_reason":    raw.get("style_reason",    "Balanced strategy based on your profile."),
-        }
+        }, bool(valid)
 
     def evaluate_answer(self, question: str, answer: str,
                         skill: str, difficulty: str,
-                        skipped: bool = False) -> dict:
+                        skipped: bool = False,
+                        on_partial: Optional[Callable[[dict], None]] = None,
+                        deadline_s: Optional[float] = None,
+                        draft_key: Optional[str] = None) -> dict:
         """
         Three-pass evaluation:
           Pass 1 → Extract what candidate said
           Pass 2 → Compare against ideal answer
           Pass 3 → Score + feedback
+
+        on_partial, if given, is called with the partially parsed Pass 3
+        JSON as it streams in (scores first, then the text fields filling
+        in). The returned dict is always the complete, clamped scorecard.
+
+        deadline_s bounds the whole call (default settings.eval_deadline_s,
+        0 = no limit); past it the scorecard is provisional and carries
+        "degraded": True.
+
+        draft_key names the draft offered to speculate_extraction(); its
+        Pass 1 result is reused when the submitted text still matches. If
+        the text changed slightly since, the scorecard is not cached and
+        its passes are not stored for resume.
         """
+        budget   = settings.eval_deadline_s if deadline_s is None else deadline_s
+        deadline = Deadline(budget) if budget and budget > 0 else None
+
         # ── Hard gates ────────────────────────────────────────────
+        clean = answer.strip()
+        if skipped or len(clean) < 25:
+            return self._gated(skill, self._ideal_within(question, skill, deadline), skipped)
+
+        if self.mock:
+            return self._mock_evaluation(skill)
+
+        passes    = self._pass_count()
+        cache_key = None
+        if self._cache:
+            cache_key = self._cache.make_key(
+                question, clean, skill, difficulty, settings.gemini_model_eval, passes
+            )
+            hit = self._cache.get(cache_key)
+            if hit:
+                return hit
+
+        if passes == 1:
+            return self._fused_evaluate(question, clean, skill, difficulty,
+                                        cache_key=cache_key, on_partial=on_partial,
+                                        deadline=deadline)
+        return self._three_pass_evaluate(question, clean, skill, difficulty,
+                                         cache_key=cache_key, on_partial=on_partial,
+                                         deadline=deadline, draft_key=draft_key)
+
+    @staticmethod
+    def _gated(skill: str, ideal: str, skipped: bool) -> dict:
+        """Scorecard for a skipped or too-short answer — no model call."""
         if skipped:
-            ideal = self._get_ideal(question, skill)
             return {
                 "overall_score": 0.0, "concept_score": 0.0,
                 "clarity_score": 0.0, "confidence_score": 0.0,
@@ -184,149 +318,133 @@ Return EXACTLY:
                 "follow_up_question": None,
                 "reasoning":         "Skipped — no evaluation performed.",
             }
+        return {
+            "overall_score": 0.5, "concept_score": 0.5,
+            "clarity_score": 0.0, "confidence_score": 0.0,
+            "strengths":         "An attempt was made.",
+            "weaknesses":        "Answer is too short to evaluate. Minimum 2-3 full sentences required.",
+            "improvement_tips":  "Write a complete answer: define the concept, explain it, give an equation or example.",
+            "weak_skills":       [skill],
+            "ideal_answer":      ideal,
+            "follow_up_question": None,
+            "reasoning":         "Too short to evaluate.",
+        }
 
-        clean = answer.strip()
-        if len(clean) < 25:
-            ideal = self._get_ideal(question, skill)
-            return {
-                "overall_score": 0.5, "concept_score": 0.5,
-                "clarity_score": 0.0, "confidence_score": 0.0,
-                "strengths":         "An attempt was made.",
-                "weaknesses":        "Answer is too short to evaluate. Minimum 2-3 full sentences required.",
-                "improvement_tips":  "Write a complete answer: define the concept, explain it, give an equation or example.",
-                "weak_skills":       [skill],
-                "ideal_answer":      ideal,
-                "follow_up_question": None,
-                "reasoning":         "Too short to evaluate.",
-            }
+    # ═══════════════════════════════════════════════════════════════
+    #  THREE-PASS EVALUATION ENGINE
+    # ═══════════════════════════════════════════════════════════════
 
-        if self.mock:
-            return self._mock_evaluation(skill)
+    def _three_pass_evaluate(self, question: str, answer: str,
+                              skill: str, difficulty: str,
+                              cache_key: Optional[str] = None,
+                              on_partial: Optional[Callable[[dict], None]] = None,
+                              deadline: Optional[Deadline] = None,
+                              draft_key: Optional[str] = None) -> dict:
+        # Passes stored by an earlier attempt at the same answer that failed
+        attempt = self._passes.attempt_id(question, answer, skill, difficulty,
+                                          settings.gemini_model_eval) if self._passes else None
+        saved   = self._passes.load(attempt) if attempt else {}
+        ideal   = None
+        extracted, comparison = saved.get("pass1"), saved.get("pass2")
+        try:
+            # ── Ideal answer ‖ Pass 1 (independent — overlap them) ────
+            if extracted is not None:
+                ideal = self._within(deadline, self._get_ideal, question, skill)
+            elif settings.eval_concurrent:
+                ideal_future = _executor().submit(self._get_ideal, question, skill)
+                extracted, exact = self._extract(question, answer, skill, deadline, draft_key)
+                if not exact:
+                    attempt = cache_key = None  # a near-match draft's Pass 1 — store nothing
+                self._keep(attempt, "pass1", extracted)
+                ideal        = deadline.wait(ideal_future) if deadline else ideal_future.result()
+            else:
+                ideal     = self._within(deadline, self._get_ideal, question, skill)
+                extracted, exact = self._extract(question, answer, skill, deadline, draft_key)
+                if not exact:
+                    attempt = cache_key = None
+                self._keep(attempt, "pass1", extracted)
+
+            # ── Pass 2: Compare against ideal answer ──────────────────
+            if comparison is None:
+                comparison = self._eval_pass("pass2", PASS2, dict(
+                    question=question, skill=skill, difficulty=difficulty,
+                    ideal=ideal, answer=answer,
+                    extracted=json.dumps(extracted, indent=2),
+                ), deadline)
+                self._keep(attempt, "pass2", comparison)
+
+            # ── Pass 3: Score and generate feedback ───────────────────
+            pass3_prompt = self._pass3_prompt(question, skill, difficulty, ideal, answer, comparison)
+
+            if on_partial and settings.stream_evaluation:
+                result = self._stream_within(pass3_prompt, on_partial, deadline)
+            else:
+                result = self._within(deadline, self._call_json, pass3_prompt, "eval", deadline)
+        except DeadlineExceeded:
+            return self._degraded(question, skill, ideal, extracted, comparison, deadline)
 
-        return self._three_pass_evaluate(question, clean, skill, difficulty)
+        ev = self._scorecard(result, skill, ideal, cache_key)
+        if attempt and not ev.get("failed"):
+            self._passes.clear(attempt)
+        return ev
+
+    def _keep(self, attempt: Optional[str], pass_name: str, result: dict) -> None:
+        """Store a pass that came back, so a retry of this attempt can skip it."""
+        if attempt and result:
+            self._passes.save(attempt, pass_name, result)
 
     # ═══════════════════════════════════════════════════════════════
-    #  THREE-PASS EVALUATION ENGINE
+    #  FUSED (SINGLE-CALL) EVALUATION
     # ═══════════════════════════════════════════════════════════════
 
-    def _three_pass_evaluate(self, question: str, answer: str,
-                              skill: str, difficulty: str) -> dict:
-        ideal = self._get_ideal(question, skill)
-
-        # ── Pass 1: Extract what the candidate actually said ──────
-        pass1_prompt = f"""
-You are extracting factual claims from a candidate's interview answer.
-Be objective. Do not evaluate quality yet — just extract.
-
-QUESTION: {question}
-SKILL: {skill}
-CANDIDATE ANSWER: "{answer}"
-
-List every distinct technical claim, definition, formula, or example the candidate mentioned.
-Be precise and literal. If they said something wrong, still list it.
-
-Return JSON:
-{{
-  "claimed_facts": ["fact1", "fact2", ...],
-  "mentioned_equations": ["eq1", ...],
-  "mentioned_examples": ["ex1", ...],
-  "answer_length": "short|medium|long",
-  "has_structure": true|false
-}}"""
-
-        extracted = self._call_json(pass1_prompt, model="eval")
-
-        # ── Pass 2: Compare against ideal answer ──────────────────
-        pass2_prompt = f"""
-You are a senior ML expert comparing a candidate's answer to the ideal answer.
-
-QUESTION: {question}
-SKILL: {skill}  
-DIFFICULTY: {difficulty}
-
-IDEAL ANSWER (expert level):
-{ideal}
-
-WHAT CANDIDATE CLAIMED:
-{json.dumps(extracted, indent=2)}
-
-FULL CANDIDATE ANSWER: "{answer}"
-
-Analyse the gap between candidate and ideal:
-
-Return JSON:
-{{
-  "correct_points":   ["things they got right"],
-  "missing_concepts": ["important concepts they omitted"],
-  "wrong_statements": ["factual errors if any"],
-  "depth_assessment": "surface|basic|intermediate|deep|expert",
-  "has_math":         true|false,
-  "has_real_example": true|false,
-  "covers_tradeoffs": true|false
-}}"""
-
-        comparison = self._call_json(pass2_prompt, model="eval")
-
-        # ── Pass 3: Score and generate feedback ───────────────────
-        pass3_prompt = f"""
-You are a strict senior ML interviewer. Score this answer using the rubric below.
-Return ONLY valid JSON.
-
-{RUBRIC}
-
-CONTEXT:
-  Question:   {question}
-  Skill:      {skill}
-  Difficulty: {difficulty}
-  
-IDEAL ANSWER:
-{ideal}
-
-EVALUATION SUMMARY:
-  Correct points:   {comparison.get('correct_points', [])}
-  Missing concepts: {comparison.get('missing_concepts', [])}
-  Wrong statements: {comparison.get('wrong_statements', [])}
-  Depth:            {comparison.get('depth_assessment', 'basic')}
-  Has math:         {comparison.get('has_math', False)}
-  Has real example: {comparison.get('has_real_example', False)}
-  Covers tradeoffs: {comparison.get('covers_tradeoffs', False)}
-
-FULL CANDIDATE ANSWER: "{answer}"
-
-SCORING ADJUSTMENT RULES:
-- difficulty=hard → be 1 point stricter (harder to earn high scores)
-- Missing all key concepts from ideal → concept_score max 4
-- No math when math is expected → concept_score max 6  
-- No real example → clarity_score capped at 7
-- Has wrong statements → subtract 1-2 points from concept_score
-- Short answer (1-2 sentences) → overall max 4
-
-FOLLOW-UP LOGIC:
-  overall < 4  → ask for clarification on the weakest concept they mentioned
-  4-6          → ask them to give a concrete production example
-  7-8          → push deeper with math or edge case
-  9-10         → challenge with an adversarial scenario
-  wrong answer → null (correct it in ideal_answer instead)
-
-Return EXACTLY this JSON:
-{{
-  "overall_score":      <0.0-10.0, one decimal>,
-  "concept_score":      <0.0-10.0, one decimal>,
-  "clarity_score":      <0.0-10.0, one decimal>,
-  "confidence_score":   <0.0-10.0, one decimal>,
-  "strengths":          "Specific things done well (2-3 sentences)",
-  "weaknesses":         "Specific gaps or errors (2-3 sentences, be direct)",
-  "improvement_tips":   "3 concrete actionable steps to improve",
-  "weak_skills":        ["specific sub-skill 1", "specific sub-skill 2"],
-  "ideal_answer":       "Complete 3-5 sentence expert answer to this question",
-  "follow_up_question": "Specific follow-up question or null",
-  "reasoning":          "1 sentence explaining your overall score"
-}}"""
-
-        result = self._call_json(pass3_prompt, model="eval")
+    def _fused_evaluate(self, question: str, answer: str,
+                        skill: str, difficulty: str,
+                        cache_key: Optional[str] = None,
+                        on_partial: Optional[Callable[[dict], None]] = None,
+                        deadline: Optional[Deadline] = None) -> dict:
+        """Extraction, comparison and scoring in one structured call."""
+        ideal = None
+        try:
+            ideal  = self._within(deadline, self._get_ideal, question, skill)
+            prompt = FUSED.render(
+                question=question, skill=skill,
+                difficulty=difficulty, ideal=ideal, answer=answer,
+            )
+            if on_partial and settings.stream_evaluation:
+                result = self._stream_within(prompt, on_partial, deadline)
+            else:
+                result = self._within(deadline, self._call_json, prompt, "eval", deadline)
+        except DeadlineExceeded:
+            return self._degraded(question, skill, ideal, None, None, deadline)
+        return self._scorecard(result, skill, ideal, cache_key)
+
+    @staticmethod
+    def _pass3_prompt(question: str, skill: str, difficulty: str, ideal: str,
+                      answer: str, comparison: dict) -> Prompt:
+        return PASS3.render(
+            question=question, skill=skill,
+            difficulty=difficulty, ideal=ideal, answer=answer,
+            correct_points   = comparison.get('correct_points', []),
+            missing_concepts = comparison.get('missing_concepts', []),
+            wrong_statements = comparison.get('wrong_statements', []),
+            depth_assessment = comparison.get('depth_assessment', 'basic'),
+            has_math         = comparison.get('has_math', False),
+            has_real_example = comparison.get('has_real_example', False),
+            covers_tradeoffs = comparison.get('covers_tradeoffs', False),
+        )
 
+    @staticmethod
+    def _pass_count() -> int:
+        if settings.eval_passes in (1, 3):
+            return settings.eval_passes
+        print(f"[AIService] eval_passes={settings.eval_passes} unsupported — using 3")
+        return 3
+
+    def _scorecard(self, result: dict, skill: str, ideal: str,
+                   cache_key: Optional[str]) -> dict:
+        """Final-pass JSON → the dict InterviewEngine.submit_answer persists."""
         c = self._clamp
-        return {
+        ev = {
             "overall_score":      c(result.get("overall_score",    0)),
             "concept_score":      c(result.get("concept_score",    0)),
             "clarity_score":      c(result.get("clarity_score",    0)),
@@ -339,17 +457,174 @@ Return EXACTLY this JSON:
             "follow_up_question": result.get("follow_up_question"),
             "reasoning":          result.get("reasoning",          ""),
         }
+        # Only cache a real scorecard — never the defaults from a failed final pass
+        if not result:
+            ev["failed"] = True         # defaults only; batch jobs skip / retry these
+        elif cache_key:
+            self._cache.put(cache_key, ev, settings.gemini_model_eval)
+        return ev
+
+    def _degraded(self, question: str, skill: str, ideal: Optional[str],
+                  extracted: Optional[dict], comparison: Optional[dict],
+                  deadline: Deadline) -> dict:
+        """
+        Provisional scorecard from the passes that finished within the
+        budget — Pass 2's comparison if it came back, else Pass 1's
+        extraction. Never cached; marked "degraded" (and "failed" when
+        not even Pass 1 finished).
+        """
+        ideal = ideal or ideal_store.get(question) or \
+            f"A thorough understanding of {skill} concepts is required to answer this question well."
+        spent = f"The {deadline.budget_s:.0f}s evaluation budget ran out"
+        if comparison:
+            base = {"basic": 4.0, "intermediate": 6.0, "deep": 7.5}.get(
+                comparison.get("depth_assessment"), 4.0)
+            base += 0.5 * sum(bool(comparison.get(k))
+                              for k in ("has_math", "has_real_example", "covers_tradeoffs"))
+            base -= min(2.0, 0.5 * len(comparison.get("missing_concepts") or []))
+            base -= min(3.0, 1.0 * len(comparison.get("wrong_statements") or []))
+            missing = comparison.get("missing_concepts") or []
+            result = {
+                "overall_score": base, "concept_score": base,
+                "clarity_score": base, "confidence_score": base - 0.5,
+                "strengths":  "Covered: " + ("; ".join(comparison.get("correct_points") or [])
+                                             or "part of the core idea") + ".",
+                "weaknesses": "Missing: " + ("; ".join(missing) or "no major gaps found") + ".",
+                "improvement_tips": ("Review " + ", ".join(missing) + ".") if missing else
+                                    "Compare your answer with the model answer below.",
+                "reasoning": f"Provisional score. {spent} before final scoring; "
+                             f"based on the comparison with the model answer.",
+            }
+        elif extracted:
+            length = {"short": 3.0, "medium": 5.0, "long": 6.0}.get(extracted.get("answer_length"), 4.0)
+            depth  = length + 0.5 * bool(extracted.get("mentioned_equations")) \
+                            + 0.5 * bool(extracted.get("mentioned_examples"))
+            clarity = length + (1.0 if extracted.get("has_structure") else 0.0)
+            result = {
+                "overall_score": depth, "concept_score": depth,
+                "clarity_score": clarity, "confidence_score": length,
+                "strengths":  f"Made {len(extracted.get('claimed_facts') or [])} distinct point(s).",
+                "weaknesses": "Not yet compared against the model answer.",
+                "improvement_tips": "Compare your answer with the model answer below.",
+                "reasoning": f"Provisional score. {spent} after extraction; "
+                             f"based on what the answer covers, not its correctness.",
+            }
+        else:
+            result = {}
+        ev = self._scorecard(result, skill, ideal, None)
+        ev["degraded"] = True
+        if not result:
+            ev["reasoning"] = f"{spent} before any pass finished."
+        return ev
+
+    def _extract(self, question: str, answer: str, skill: str,
+                 deadline: Optional[Deadline] = None,
+                 draft_key: Optional[str] = None) -> Tuple[dict, bool]:
+        """
+        Pass 1: extract what the candidate actually said. (result, exact):
+        exact is False when it came from a draft that differs slightly
+        from the submitted answer.
+        """
+        taken = self._speculative.take(draft_key, answer) \
+            if draft_key and self._speculative else None
+        if taken is not None:
+            speculative, exact = taken
+            try:
+                hit = deadline.wait(speculative) if deadline else speculative.result()
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:
+                print(f"[AIService] speculative extraction failed: {exc}")
+                hit = None
+            if hit:
+                return hit, exact
+        return self._eval_pass("pass1", PASS1,
+                               dict(question=question, skill=skill, answer=answer), deadline), True
+
+    def _eval_pass(self, name: str, template: PromptTemplate, fields: dict,
+                   deadline: Optional[Deadline] = None) -> dict:
+        """One eval pass — through the micro-batcher when it is enabled for it."""
+        batcher = self._batchers.get(name)
+        if batcher is None:
+            return self._within(deadline, self._call_json, template.render(**fields), "eval", deadline)
+        fut = batcher.submit(fields)
+        return deadline.wait(fut) if deadline else fut.result()
+
+    @staticmethod
+    def _within(deadline: Optional[Deadline], fn: Callable, *args):
+        """fn(*args), waiting no longer than the deadline allows."""
+        return deadline.run(fn, *args) if deadline else fn(*args)
+
+    def _ideal_within(self, question: str, skill: str, deadline: Optional[Deadline]) -> str:
+        try:
+            return self._within(deadline, self._get_ideal, question, skill)
+        except DeadlineExceeded:
+            return ideal_store.get(question) or \
+                f"A thorough understanding of {skill} concepts is required to answer this question well."
+
+    def _stream_within(self, prompt: Prompt, on_partial: Callable[[dict], None],
+                       deadline: Optional[Deadline]) -> dict:
+        """
+        _stream_json under a deadline. The stream runs on a worker; partials
+        are relayed back so on_partial still runs on the calling thread.
+        """
+        if deadline is None:
+            return self._stream_json(prompt, on_partial, None)
+        partials: queue.Queue = queue.Queue()
+        fut = deadline.start(self._stream_json, prompt, partials.put, deadline)
+        while not fut.done():
+            if deadline.expired:
+                raise DeadlineExceeded(f"{deadline.budget_s:.0f}s budget spent")
+            try:
+                on_partial(partials.get(timeout=min(0.1, deadline.remaining())))
+            except queue.Empty:
+                pass
+        while not partials.empty():
+            on_partial(partials.get_nowait())
+        return fut.result()
+
+    def _run_batch(self, batch: BatchTemplate, single: PromptTemplate,
+                   items: List[dict]) -> List[dict]:
+        """
+        Send a window of items as one multi-item request; items the reply
+        leaves out or gets wrong are retried on their own, one after the
+        other on the flushing thread. (Not on _executor(): its workers may
+        be the very callers blocked on this batch.)
+        """
+        if len(items) == 1:
+            return [self._call_json(single.render(**items[0]), model="eval")]
+        prompt  = batch.render(items)
+        cls     = BATCH_ITEM_TYPES[batch.name]
+        results = self._route("eval", prompt,
+                              lambda text: validate_batch(cls, self._parse(text), len(items)),
+                              default=None, config=self._json_config(prompt))
+        results = results or [None] * len(items)
+        missing = [i for i, r in enumerate(results) if r is None]
+        for i in missing:
+            results[i] = self._call_json(single.render(**items[i]), model="eval")
+        return results
 
     # ═══════════════════════════════════════════════════════════════
     #  IDEAL ANSWER GENERATOR
     # ═══════════════════════════════════════════════════════════════
 
     def _get_ideal(self, question: str, skill: str) -> str:
-        # Check pre-written bank first
-        key = question.strip()[:80]
-        if key in IDEAL_ANSWERS:
-            return IDEAL_ANSWERS[key]
+        # Hand-written bank, then answers generated earlier in this deployment
+        stored = ideal_store.get(question)
+        if stored:
+            return stored
+
+        text = self.generate_ideal(question, skill)
+        if text is None:
+            return f"A thorough understanding of {skill} concepts is required to answer this question well."
+        if not text:
+            return f"See {skill} fundamentals for a complete answer."
+        if not self.mock:
+            ideal_store.put(question, skill, text, settings.gemini_model_strategy)
+        return text
 
+    def generate_ideal(self, question: str, skill: str) -> Optional[str]:
+        """Ask the model for a fresh expert answer. None if the call failed."""
         if self.mock:
             return (
                 f"A complete answer defines the concept precisely, provides the key equation "
@@ -357,46 +632,136 @@ Return EXACTLY this JSON:
                 f"failure modes relevant to {skill}."
             )
 
-        prompt = f"""
-You are a principal ML engineer at a top company.
-Write a complete, expert-level answer to this interview question.
+        prompt = IDEAL.render(question=question, skill=skill)
+        return self._route("strategy", prompt,
+                           lambda text: text.strip()[:800], default=None)
 
-Question: "{question}"
-Skill area: {skill}
+    def speculate_extraction(self, draft_key: str, question: str,
+                             answer: str, skill: str) -> bool:
+        """
+        Start Pass 1 on a draft answer in the background (opt-in,
+        settings.speculative_extraction). True if a speculation started.
+        The ideal answer is fetched alongside — it runs in parallel with
+        Pass 1 anyway, so it would otherwise stay on the critical path.
+        """
+        if self.mock or self._speculative is None or self._pass_count() != 3:
+            return False
+        draft = answer.strip()
 
-Requirements:
-- Start with a precise definition
-- Include the key equation or mathematical formulation if relevant
-- Give a concrete real-world example
-- Mention at least one trade-off or limitation
-- 3-5 sentences maximum, dense and precise
+        def _start():
+            _executor().submit(self._get_ideal, question, skill)
+            # The Future must resolve to the Pass 1 dict itself — _extract()
+            # returns (result, exact) and would nest when the draft is taken
+            return _executor().submit(self._eval_pass, "pass1", PASS1,
+                                      dict(question=question, skill=skill, answer=draft))
 
-Write ONLY the answer, no labels, no JSON."""
-
-        try:
-            resp = self._strategy_model.generate_content(prompt)
-            text = resp.text.strip()
-            return text[:800] if text else f"See {skill} fundamentals for a complete answer."
-        except Exception:
-            return f"A thorough understanding of {skill} concepts is required to answer this question well."
+        return self._speculative.offer(draft_key, draft, _start)
 
     # ═══════════════════════════════════════════════════════════════
     #  INTERNAL HELPERS
     # ═══════════════════════════════════════════════════════════════
 
-    def _call_json(self, prompt: str, model: str = "eval") -> dict:
-        m = self._eval_model if model == "eval" else self._strategy_model
-        retries = 2
-        for attempt in range(retries):
-            try:
-                resp = m.generate_content(prompt)
-                return self._parse(resp.text)
-            except Exception as exc:
-                if attempt == retries - 1:
-                    print(f"[AIService] Gemini error after {retries} attempts: {exc}")
-                    return {}
-                time.sleep(1.5)
-        return {}
+    def _call_json(self, prompt: Prompt, model: str = "eval",
+                   deadline: Optional[Deadline] = None) -> dict:
+        cls = RESULT_TYPES.get(prompt.name)
+        if cls is None:
+            return self._route(model, prompt, self._parse, default={}, deadline=deadline)
+        return self._route(model, prompt,
+                           lambda text: validate(cls, self._parse(text)),
+                           default={}, config=self._json_config(prompt), deadline=deadline)
+
+    @staticmethod
+    def _json_config(prompt: Prompt) -> Optional[dict]:
+        """Per-call generation_config asking for schema-constrained JSON."""
+        if not settings.structured_output:
+            return None
+        if prompt.name in BATCH_ITEM_TYPES:
+            schema = batch_schema(BATCH_ITEM_TYPES[prompt.name])
+        elif prompt.name in RESULT_TYPES:
+            schema = response_schema(RESULT_TYPES[prompt.name])
+        else:
+            return None
+        return {"response_mime_type": "application/json", "response_schema": schema}
+
+    def _stream_json(self, prompt: Prompt, on_partial: Callable[[dict], None],
+                     deadline: Optional[Deadline] = None) -> dict:
+        """
+        Stream the eval model's JSON, reporting each parsed prefix to on_partial.
+        Streams are not hedged; if the stream fails or does not parse, the
+        prompt is re-sent through the normal routed path.
+        """
+        parser = IncrementalJSONParser()
+        try:
+            with self.keys.lease() as key, governor.slot(key):
+                for text in self._backends[key].stream("eval", settings.gemini_model_eval,
+                                                       prompt, self._json_config(prompt)):
+                    on_partial(parser.feed(text))
+            result = parser.fields if parser.done else self._parse(parser.buf)
+            cls = RESULT_TYPES.get(prompt.name)
+            if cls is not None:
+                result = validate(cls, result)
+            if result:
+                return result
+        except Exception as exc:
+            print(f"[AIService] stream failed, falling back: {exc}")
+        return self._call_json(prompt, model="eval", deadline=deadline)
+
+    def _route(self, role: str, prompt: Prompt, extract, default,
+               config: Optional[dict] = None, deadline: Optional[Deadline] = None):
+        """
+        Send prompt to the role's primary model through the shared router:
+        hedged to / failed over to the fallback model by latency & health.
+        `extract` turns the reply text into a value; falsy values count as failures.
+        With a deadline the router starts no retry or hedge it cannot wait for.
+        """
+        primary_name = getattr(settings, client_pool.MODEL_ROLES[role][0])
+        fb_name      = settings.gemini_model_fallback
+
+        def _call():
+            return router.call(
+                (primary_name, lambda: extract(self._generate(role, primary_name, prompt, config))),
+                (fb_name, lambda: extract(self._generate(role, fb_name, prompt, config)))
+                if fb_name and fb_name != primary_name else None,
+                default=default,
+                deadline=deadline.at if deadline else None,
+            )
+
+        if not settings.single_flight_enabled:
+            return _call()
+        return single_flight.do(self._flight_key(role, prompt, config), _call)
+
+    @staticmethod
+    def _flight_key(role: str, prompt: Prompt, config: Optional[dict]) -> str:
+        payload = json.dumps([role, prompt.name, prompt.prefix, prompt.body,
+                              bool(config)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _generate(self, role: str, model_name: str, prompt: Prompt,
+                  config: Optional[dict] = None) -> str:
+        """
+        Returns the reply text; a reply truncated at max_output_tokens is
+        completed by up to settings.max_continuations follow-up calls.
+        """
+        reply = self._generate_once(role, model_name, prompt, config)
+        text  = reply.text
+        for _ in range(settings.max_continuations):
+            if not reply.truncated:
+                break
+            # Free-form: a schema would make the model start a new object
+            reply = self._generate_once(role, model_name, continuation(prompt, text), None)
+            if not reply.text:
+                break
+            text += reply.text
+        return text
+
+    def _generate_once(self, role: str, model_name: str, prompt: Prompt,
+                       config: Optional[dict]):
+        """
+        The single place a backend is actually called — on a leased key,
+        under the shared governor. Quota errors cool the key down (key_pool.py).
+        """
+        with self.keys.lease() as key, governor.slot(key):
+            return self._backends[key].generate(role, model_name, prompt, config)
 
     @staticmethod
     def _parse(text: str) -> dict:
@@ -14,6 +14,11 @@ from ..config import settings
 
 class AnalyticsService:
 
+    @staticmethod
+    def scored(answers: List[dict]) -> List[dict]:
+        """Answers with a full score — provisional ("degraded") ones are left out."""
+        return [a for a in answers if not a.get("degraded")]
+
     # ── Readiness ─────────────────────────────────────────────────
 
     @staticmethod
@@ -27,6 +32,7 @@ class AnalyticsService:
           [4, 7)  → Intermediate
           [7, 10] → Interview Ready
         """
+        answers = AnalyticsService.scored(answers)
         if not answers:
             return {"score": 0.0, "level": "Beginner", "composite": {}}
 
@@ -72,7 +78,7 @@ class AnalyticsService:
     @staticmethod
     def skill_breakdown(answers: List[dict]) -> Dict[str, dict]:
         buckets: Dict[str, dict] = {}
-        for a in answers:
+        for a in AnalyticsService.scored(answers):
             sk = a.get("skill_tested", "Unknown")
             b  = buckets.setdefault(sk, {"o": [], "c": [], "cl": [], "cf": []})
             b["o"].append(a.get("overall_score",   0))
@@ -104,9 +110,10 @@ class AnalyticsService:
         readiness = AnalyticsService.compute_readiness(answers)
         breakdown = AnalyticsService.skill_breakdown(answers)
         weak      = AnalyticsService.weak_skill_clusters(answers)
+        scored    = AnalyticsService.scored(answers)
         avg_ov    = (
-            round(sum(a.get("overall_score", 0) for a in answers) / len(answers), 2)
-            if answers else 0.0
+            round(sum(a.get("overall_score", 0) for a in scored) / len(scored), 2)
+            if scored else 0.0
         )
         return {
             "profile":             profile,
@@ -115,6 +122,7 @@ class AnalyticsService:
             "skill_breakdown":     breakdown,
             "weak_skill_clusters": weak,
             "total_questions":     len(answers),
+            "provisional":         len(answers) - len(scored),
             "avg_overall":         avg_ov,
             "generated_at":        datetime.utcnow().isoformat(),
         }
@@ -0,0 +1,446 @@
+"""
+services/async_ai.py
+─────────────────────────────────────────────────────────────
+Asyncio-native evaluation for high-concurrency serving.
+
+AIService waits on model calls with OS threads — every pass in flight
+holds one, plus the router, deadline and executor threads around it.
+AsyncAIService runs the same pipeline as coroutines, every model call
+an awaited backend.agenerate() / astream() (backends.py), so one
+process keeps hundreds of evaluations in flight on a single thread:
+
+  await aio.generate_strategy(profile)
+  await aio.evaluate_answer(question, answer, skill, difficulty, ...)
+  await aio._get_ideal(question, skill)
+
+It wraps an AIService for everything that is not waiting on a model —
+prompts, parsing, scorecards, caches, key pool, backends — so both
+paths score identically. Routing (router.acall), rate limiting
+(governor.aslot) and key leasing share the process-wide state of the
+threaded path. Database lookups (caches, stores) go to the loop's
+default executor — including the stored Pass 1 / Pass 2 results a
+failed attempt resumes from (pass_store.py); micro-batched passes and
+speculative Pass 1 results are threaded Futures and are awaited as such.
+
+All coroutines run on one event loop per process, started on a daemon
+thread when first needed (event_loop()). BlockingAIService is the
+synchronous face for everything that is not async — the Streamlit
+pages, InterviewEngine, the tools — with AIService's methods and
+signatures, each a run_sync() into the loop. settings.async_ai makes
+AIService.shared() return one.
+
+Deadlines are asyncio timeouts: a pass past the budget is no longer
+awaited; calls already sent finish in the background, as on the
+threaded path, so their latency still reaches the router.
+─────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import copy
+import json
+import queue
+import random
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from ..config import settings
+from . import client_pool
+from .ai_service import AIService
+from .deadline import Deadline, DeadlineExceeded
+from .ideal_store import ideal_store
+from .json_stream import IncrementalJSONParser
+from .model_router import router
+from .prompts import FUSED, IDEAL, PASS1, PASS2, Prompt, PromptTemplate, continuation
+from .rate_limiter import governor
+from .schemas import RESULT_TYPES, validate
+from .single_flight import single_flight
+from .strategy_store import profile_key
+
+T = TypeVar("T")
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def event_loop() -> asyncio.AbstractEventLoop:
+    """The process's shared event loop, running on a daemon thread."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="aiip-asyncio",
+                             daemon=True).start()
+        return _LOOP
+
+
+def submit(coro: Awaitable[T]) -> "Future[T]":
+    """Schedule coro on the shared loop; a concurrent Future for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, event_loop())
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run coro on the shared loop and block the calling thread for its result."""
+    try:
+        on_loop = asyncio.get_running_loop() is _LOOP
+    except RuntimeError:
+        on_loop = False
+    if on_loop:
+        coro.close()
+        raise RuntimeError("run_sync() on the event loop thread would deadlock — await instead")
+    return submit(coro).result(timeout)
+
+
+def _fallback_ideal(skill: str) -> str:
+    return f"A thorough understanding of {skill} concepts is required to answer this question well."
+
+
+class AsyncAIService:
+
+    def __init__(self, api_key: Optional[str] = None, mock: bool = False,
+                 core: Optional[AIService] = None, rng: Optional[random.Random] = None):
+        self.core = core or AIService(api_key=api_key, mock=mock, rng=rng)
+        self._flights: Dict[str, asyncio.Task] = {}     # single-flight, loop-confined
+        self._topping_up: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def mock(self) -> bool:
+        return self.core.mock
+
+    # ═══════════════════════════════════════════════════════════════
+    #  PUBLIC API — AIService's, awaitable
+    # ═══════════════════════════════════════════════════════════════
+
+    async def generate_strategy(self, profile: dict) -> dict:
+        core = self.core
+        if core.mock:
+            return core._mock_strategy()
+        store = core._strategies
+        if not store:
+            return (await self.fresh_strategy(profile))[0]
+
+        cached, stored = await asyncio.to_thread(store.sample, profile)
+        if cached is None:
+            strategy, ok = await self.fresh_strategy(profile)
+            if ok:
+                await asyncio.to_thread(store.put, profile, strategy, settings.gemini_model_strategy)
+            return strategy
+        key = profile_key(profile)
+        if stored < store.pool_size and key not in self._topping_up:
+            self._topping_up.add(key)
+            self._spawn(self._add_strategy_variant(key, dict(profile)))
+        return cached
+
+    async def _add_strategy_variant(self, key: str, profile: dict) -> None:
+        try:
+            strategy, ok = await self.fresh_strategy(profile)
+            if ok:
+                await asyncio.to_thread(self.core._strategies.put, profile, strategy,
+                                        settings.gemini_model_strategy)
+        finally:
+            self._topping_up.discard(key)
+
+    async def fresh_strategy(self, profile: dict) -> Tuple[dict, bool]:
+        raw = await self._call_json(self.core._strategy_prompt(profile), model="strategy")
+        return self.core._strategy_from(raw)
+
+    async def evaluate_answer(self, question: str, answer: str,
+                              skill: str, difficulty: str,
+                              skipped: bool = False,
+                              on_partial: Optional[Callable[[dict], None]] = None,
+                              deadline_s: Optional[float] = None,
+                              draft_key: Optional[str] = None) -> dict:
+        """AIService.evaluate_answer as a coroutine; on_partial is called on the loop."""
+        core     = self.core
+        budget   = settings.eval_deadline_s if deadline_s is None else deadline_s
+        deadline = Deadline(budget) if budget and budget > 0 else None
+
+        clean = answer.strip()
+        if skipped or len(clean) < 25:
+            return core._gated(skill, await self._ideal_within(question, skill, deadline), skipped)
+        if core.mock:
+            return core._mock_evaluation(skill)
+
+        passes    = core._pass_count()
+        cache_key = None
+        if core._cache:
+            cache_key = core._cache.make_key(
+                question, clean, skill, difficulty, settings.gemini_model_eval, passes
+            )
+            hit = await asyncio.to_thread(core._cache.get, cache_key)
+            if hit:
+                return hit
+
+        attempt = saved = None
+        if passes == 3 and core._passes:
+            attempt = core._passes.attempt_id(question, clean, skill, difficulty,
+                                              settings.gemini_model_eval)
+            saved   = await asyncio.to_thread(core._passes.load, attempt)
+        saved = saved or {}
+        ideal = None
+        extracted, comparison = saved.get("pass1"), saved.get("pass2")
+        try:
+            if passes == 1:
+                ideal  = await self._within(deadline, self._get_ideal(question, skill))
+                prompt = FUSED.render(question=question, skill=skill,
+                                      difficulty=difficulty, ideal=ideal, answer=clean)
+            else:
+                if extracted is not None:
+                    ideal = await self._within(deadline, self._get_ideal(question, skill))
+                elif settings.eval_concurrent:
+                    ideal_task = self._spawn(self._get_ideal(question, skill))
+                    extracted, exact = await self._extract(question, clean, skill, deadline,
+                                                           draft_key)
+                    if not exact:
+                        attempt = cache_key = None  # a near-match draft's Pass 1 — store nothing
+                    await self._keep(attempt, "pass1", extracted)
+                    ideal      = await self._within(deadline, asyncio.shield(ideal_task))
+                else:
+                    ideal     = await self._within(deadline, self._get_ideal(question, skill))
+                    extracted, exact = await self._extract(question, clean, skill, deadline,
+                                                           draft_key)
+                    if not exact:
+                        attempt = cache_key = None
+                    await self._keep(attempt, "pass1", extracted)
+                if comparison is None:
+                    comparison = await self._eval_pass("pass2", PASS2, dict(
+                        question=question, skill=skill, difficulty=difficulty,
+                        ideal=ideal, answer=clean,
+                        extracted=json.dumps(extracted, indent=2),
+                    ), deadline)
+                    await self._keep(attempt, "pass2", comparison)
+                prompt = core._pass3_prompt(question, skill, difficulty, ideal, clean, comparison)
+
+            if on_partial and settings.stream_evaluation:
+                result = await self._within(deadline, self._stream_json(prompt, on_partial, deadline))
+            else:
+                result = await self._within(deadline, self._call_json(prompt, "eval", deadline))
+        except DeadlineExceeded:
+            return await asyncio.to_thread(core._degraded, question, skill, ideal,
+                                           extracted, comparison, deadline)
+        ev = await asyncio.to_thread(core._scorecard, result, skill, ideal, cache_key)
+        if attempt and not ev.get("failed"):
+            await asyncio.to_thread(core._passes.clear, attempt)
+        return ev
+
+    async def _keep(self, attempt: Optional[str], pass_name: str, result: dict) -> None:
+        if attempt and result:
+            await asyncio.to_thread(self.core._passes.save, attempt, pass_name, result)
+
+    async def _get_ideal(self, question: str, skill: str) -> str:
+        stored = await asyncio.to_thread(ideal_store.get, question)
+        if stored:
+            return stored
+
+        text = await self.generate_ideal(question, skill)
+        if text is None:
+            return _fallback_ideal(skill)
+        if not text:
+            return f"See {skill} fundamentals for a complete answer."
+        if not self.mock:
+            await asyncio.to_thread(ideal_store.put, question, skill, text,
+                                    settings.gemini_model_strategy)
+        return text
+
+    async def generate_ideal(self, question: str, skill: str) -> Optional[str]:
+        if self.mock:
+            return self.core.generate_ideal(question, skill)
+        return await self._route("strategy", IDEAL.render(question=question, skill=skill),
+                                 lambda text: text.strip()[:800], default=None)
+
+    # ═══════════════════════════════════════════════════════════════
+    #  PASSES
+    # ═══════════════════════════════════════════════════════════════
+
+    async def _extract(self, question: str, answer: str, skill: str,
+                       deadline: Optional[Deadline] = None,
+                       draft_key: Optional[str] = None) -> Tuple[dict, bool]:
+        spec  = self.core._speculative
+        taken = spec.take(draft_key, answer) if draft_key and spec else None
+        if taken is not None:
+            speculative, exact = taken
+            try:
+                hit = await self._within(deadline, asyncio.shield(asyncio.wrap_future(speculative)))
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:
+                print(f"[AsyncAIService] speculative extraction failed: {exc}")
+                hit = None
+            if hit:
+                return hit, exact
+        return await self._eval_pass("pass1", PASS1,
+                                     dict(question=question, skill=skill, answer=answer),
+                                     deadline), True
+
+    async def _eval_pass(self, name: str, template: PromptTemplate, fields: dict,
+                         deadline: Optional[Deadline] = None) -> dict:
+        batcher = self.core._batchers.get(name)
+        if batcher is None:
+            return await self._within(deadline, self._call_json(template.render(**fields),
+                                                                "eval", deadline))
+        # Shielded: timing out must not cancel a Future the whole batch shares
+        return await self._within(deadline, asyncio.shield(asyncio.wrap_future(batcher.submit(fields))))
+
+    @staticmethod
+    async def _within(deadline: Optional[Deadline], aw: Awaitable[T]) -> T:
+        """await aw, no longer than the deadline allows."""
+        if deadline is None:
+            return await aw
+        if deadline.expired:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+            raise DeadlineExceeded(f"{deadline.budget_s:.0f}s budget spent")
+        try:
+            return await asyncio.wait_for(aw, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"{deadline.budget_s:.0f}s budget spent") from None
+
+    async def _ideal_within(self, question: str, skill: str,
+                            deadline: Optional[Deadline]) -> str:
+        try:
+            # Shielded: a late ideal is still stored for the next session
+            return await self._within(deadline, asyncio.shield(
+                self._spawn(self._get_ideal(question, skill))))
+        except DeadlineExceeded:
+            return await asyncio.to_thread(ideal_store.get, question) or _fallback_ideal(skill)
+
+    # ═══════════════════════════════════════════════════════════════
+    #  MODEL CALLS
+    # ═══════════════════════════════════════════════════════════════
+
+    async def _call_json(self, prompt: Prompt, model: str = "eval",
+                         deadline: Optional[Deadline] = None) -> dict:
+        parse = self.core._parse
+        cls   = RESULT_TYPES.get(prompt.name)
+        if cls is None:
+            return await self._route(model, prompt, parse, default={}, deadline=deadline)
+        return await self._route(model, prompt, lambda text: validate(cls, parse(text)),
+                                 default={}, config=self.core._json_config(prompt),
+                                 deadline=deadline)
+
+    async def _stream_json(self, prompt: Prompt, on_partial: Callable[[dict], None],
+                           deadline: Optional[Deadline] = None) -> dict:
+        core   = self.core
+        parser = IncrementalJSONParser()
+        try:
+            with core.keys.lease() as key:
+                async with governor.aslot(key):
+                    async for text in core._backends[key].astream(
+                            "eval", settings.gemini_model_eval, prompt, core._json_config(prompt)):
+                        on_partial(parser.feed(text))
+            result = parser.fields if parser.done else core._parse(parser.buf)
+            cls = RESULT_TYPES.get(prompt.name)
+            if cls is not None:
+                result = validate(cls, result)
+            if result:
+                return result
+        except Exception as exc:
+            print(f"[AsyncAIService] stream failed, falling back: {exc}")
+        return await self._call_json(prompt, model="eval", deadline=deadline)
+
+    async def _route(self, role: str, prompt: Prompt, extract, default,
+                     config: Optional[dict] = None, deadline: Optional[Deadline] = None):
+        """AIService._route on router.acall; identical calls in flight are coalesced."""
+        primary_name = getattr(settings, client_pool.MODEL_ROLES[role][0])
+        fb_name      = settings.gemini_model_fallback
+
+        def _attempt(name: str):
+            async def _go():
+                return extract(await self._generate(role, name, prompt, config))
+            return name, _go
+
+        async def _call():
+            return await router.acall(
+                _attempt(primary_name),
+                _attempt(fb_name) if fb_name and fb_name != primary_name else None,
+                default=default,
+                deadline=deadline.at if deadline else None,
+            )
+
+        if not settings.single_flight_enabled:
+            return await _call()
+        key    = self.core._flight_key(role, prompt, config)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = self._spawn(_call())
+            single_flight.started()
+
+            def _landed(_) -> None:
+                self._flights.pop(key, None)
+                single_flight.finished()
+            flight.add_done_callback(_landed)
+        else:
+            single_flight.joined()
+        # Shielded: one caller's deadline must not cancel the others' call
+        return copy.deepcopy(await asyncio.shield(flight))
+
+    async def _generate(self, role: str, model_name: str, prompt: Prompt,
+                        config: Optional[dict] = None) -> str:
+        reply = await self._generate_once(role, model_name, prompt, config)
+        text  = reply.text
+        for _ in range(settings.max_continuations):
+            if not reply.truncated:
+                break
+            reply = await self._generate_once(role, model_name, continuation(prompt, text), None)
+            if not reply.text:
+                break
+            text += reply.text
+        return text
+
+    async def _generate_once(self, role: str, model_name: str, prompt: Prompt,
+                             config: Optional[dict]):
+        with self.core.keys.lease() as key:
+            async with governor.aslot(key):
+                return await self.core._backends[key].agenerate(role, model_name, prompt, config)
+
+    def _spawn(self, coro: Awaitable[T]) -> "asyncio.Task[T]":
+        """A task nobody may await to the end — kept referenced until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+
+class BlockingAIService:
+    """
+    AIService's synchronous API, run on the shared event loop. Attributes
+    not wrapped here (mock, keys, backend, speculate_extraction, …) are
+    the underlying AIService's own.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, mock: bool = False,
+                 rng: Optional[random.Random] = None):
+        self.aio = AsyncAIService(api_key=api_key, mock=mock, rng=rng)
+
+    def __getattr__(self, name: str):
+        return getattr(self.aio.core, name)
+
+    def generate_strategy(self, profile: dict) -> dict:
+        return run_sync(self.aio.generate_strategy(profile))
+
+    def fresh_strategy(self, profile: dict) -> Tuple[dict, bool]:
+        return run_sync(self.aio.fresh_strategy(profile))
+
+    def generate_ideal(self, question: str, skill: str) -> Optional[str]:
+        return run_sync(self.aio.generate_ideal(question, skill))
+
+    def evaluate_answer(self, question: str, answer: str,
+                        skill: str, difficulty: str,
+                        skipped: bool = False,
+                        on_partial: Optional[Callable[[dict], None]] = None,
+                        deadline_s: Optional[float] = None,
+                        draft_key: Optional[str] = None) -> dict:
+        """on_partial still runs on the calling thread — partials are relayed back."""
+        if on_partial is None:
+            return run_sync(self.aio.evaluate_answer(question, answer, skill, difficulty,
+                                                     skipped, None, deadline_s, draft_key))
+        partials: queue.Queue = queue.Queue()
+        fut = submit(self.aio.evaluate_answer(question, answer, skill, difficulty,
+                                              skipped, partials.put, deadline_s, draft_key))
+        while not fut.done() or not partials.empty():
+            try:
+                on_partial(partials.get(timeout=0.05))
+            except queue.Empty:
+                pass
+        return fut.result()
@@ -0,0 +1,361 @@
+"""
+services/backends.py
+─────────────────────────────────────────────────────────────
+The wire behind AIService: one small protocol for "send this prompt
+to this model, give me the text back", with two implementations.
+
+  GeminiBackend — google-generativeai, pooled clients (client_pool.py);
+                  prefix / cached-token accounting in prompt_cache.py
+  HTTPBackend   — plain JSON over HTTP; speaks to the local stand-in
+                  server (tools/standin_server.py) or anything else
+                  that implements the same request/response shape
+
+Each has a blocking side (generate / stream, for AIService) and an
+asyncio side (agenerate / astream, for AsyncAIService in async_ai.py):
+the SDK's generate_content_async for Gemini, a minimal HTTP/1.1 client
+on asyncio streams for HTTP — no thread is held while a call waits.
+
+Selected by settings.llm_backend ("gemini" | "http"); settings.llm_cassette
+wraps either in a record/replay cassette (cassette.py). Routing, rate
+limiting, structured-output validation and continuations stay in
+AIService, so they are exercised identically over either backend.
+
+HTTP wire format (POST {llm_backend_url}/v1/generate, x-api-key header):
+  request  {"model", "role", "kind", "prefix", "body", "temperature",
+            "max_output_tokens", "response_schema", "stream"}
+           kind = prompt name: strategy, pass1_extract, pass2_compare,
+                  pass3_score, fused, ideal (+ "_cont" continuations)
+  response {"text", "finish_reason"}            ("STOP" | "MAX_TOKENS")
+  stream   newline-delimited {"text"} chunks, then {"finish_reason"}
+  errors   HTTP status + {"error"}; 429 = quota exhausted
+─────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import AsyncIterator, Dict, Iterator, NamedTuple, Optional, Protocol
+
+from ..config import settings
+from . import client_pool
+from .prompt_cache import prompt_cache
+from .prompts import Prompt
+
+
+class Reply(NamedTuple):
+    text:      str
+    truncated: bool     # stopped at max_output_tokens
+
+
+class LLMBackend(Protocol):
+    name: str
+
+    def available(self) -> bool:
+        """False if this backend cannot make calls at all (no SDK, no key)."""
+
+    def generate(self, role: str, model_name: str, prompt: Prompt,
+                 config: Optional[dict] = None) -> Reply:
+        """One blocking call. Raises on transport / provider errors."""
+
+    def stream(self, role: str, model_name: str, prompt: Prompt,
+               config: Optional[dict] = None, finish: Optional[dict] = None) -> Iterator[str]:
+        """
+        Yield reply text chunks as they arrive. When the stream ends,
+        finish (if given) gets "truncated": stopped at max_output_tokens.
+        """
+
+    async def agenerate(self, role: str, model_name: str, prompt: Prompt,
+                        config: Optional[dict] = None) -> Reply:
+        """generate() as a coroutine, on the running event loop."""
+
+    def astream(self, role: str, model_name: str, prompt: Prompt,
+                config: Optional[dict] = None,
+                finish: Optional[dict] = None) -> AsyncIterator[str]:
+        """stream() as an async iterator."""
+
+
+class BackendError(RuntimeError):
+    """Non-2xx reply from an HTTP backend; str() starts with the status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status} {message}")
+        self.status = status
+
+
+# ── Gemini (google-generativeai) ──────────────────────────────────
+
+class GeminiBackend:
+    name = "gemini"
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self._models: Dict[tuple, object] = {}      # (role, model name) → pooled client
+        if self.available():
+            # Pooled per (key, model, config) — no per-request construction
+            for role in client_pool.MODEL_ROLES:
+                self._model(role, getattr(settings, client_pool.MODEL_ROLES[role][0]))
+                self._model(role, settings.gemini_model_fallback)
+
+    def available(self) -> bool:
+        return client_pool.sdk_available() and bool(self.api_key)
+
+    def generate(self, role: str, model_name: str, prompt: Prompt,
+                 config: Optional[dict] = None) -> Reply:
+        model = self._model(role, model_name)
+        resp  = (model.generate_content(prompt.text, generation_config=config)
+                 if config else model.generate_content(prompt.text))
+        prompt_cache.record(prompt, resp)
+        return Reply(_text(resp), _truncated(resp))
+
+    def stream(self, role: str, model_name: str, prompt: Prompt,
+               config: Optional[dict] = None, finish: Optional[dict] = None) -> Iterator[str]:
+        model  = self._model(role, model_name)
+        chunks = (model.generate_content(prompt.text, stream=True, generation_config=config)
+                  if config else model.generate_content(prompt.text, stream=True))
+        chunk  = None
+        for chunk in chunks:
+            text = _text(chunk)
+            if text:
+                yield text
+        prompt_cache.record(prompt, chunk)          # usage rides on the last chunk
+        if finish is not None:
+            finish["truncated"] = _truncated(chunk)
+
+    async def agenerate(self, role: str, model_name: str, prompt: Prompt,
+                        config: Optional[dict] = None) -> Reply:
+        model = self._model(role, model_name)
+        resp  = await (model.generate_content_async(prompt.text, generation_config=config)
+                       if config else model.generate_content_async(prompt.text))
+        prompt_cache.record(prompt, resp)
+        return Reply(_text(resp), _truncated(resp))
+
+    async def astream(self, role: str, model_name: str, prompt: Prompt,
+                      config: Optional[dict] = None,
+                      finish: Optional[dict] = None) -> AsyncIterator[str]:
+        model  = self._model(role, model_name)
+        chunks = await (model.generate_content_async(prompt.text, stream=True, generation_config=config)
+                        if config else model.generate_content_async(prompt.text, stream=True))
+        chunk  = None
+        async for chunk in chunks:
+            text = _text(chunk)
+            if text:
+                yield text
+        prompt_cache.record(prompt, chunk)
+        if finish is not None:
+            finish["truncated"] = _truncated(chunk)
+
+    def _model(self, role: str, model_name: str):
+        model = self._models.get((role, model_name))
+        if model is None:
+            model = self._models[(role, model_name)] = \
+                client_pool.get_role_model(self.api_key, role, model_name)
+        return model
+
+
+def _text(resp) -> str:
+    """resp.text, or "" for a reply/chunk without text parts."""
+    try:
+        return resp.text or ""
+    except Exception:
+        return ""
+
+
+def _truncated(resp) -> bool:
+    try:
+        reason = resp.candidates[0].finish_reason
+    except Exception:
+        return False
+    return getattr(reason, "name", None) == "MAX_TOKENS" or reason == 2
+
+
+# ── Plain HTTP (local stand-in, proxies) ──────────────────────────
+
+class HTTPBackend:
+    name = "http"
+
+    def __init__(self, api_key: str, url: Optional[str] = None,
+                 timeout_s: Optional[float] = None):
+        self.api_key = api_key or "local"
+        self.url     = (url or settings.llm_backend_url).rstrip("/")
+        self.timeout = timeout_s or settings.llm_http_timeout_s
+
+    def available(self) -> bool:
+        return bool(self.url)
+
+    def generate(self, role: str, model_name: str, prompt: Prompt,
+                 config: Optional[dict] = None) -> Reply:
+        with self._post(role, model_name, prompt, config, stream=False) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+        return Reply(data.get("text") or "", data.get("finish_reason") == "MAX_TOKENS")
+
+    def stream(self, role: str, model_name: str, prompt: Prompt,
+               config: Optional[dict] = None, finish: Optional[dict] = None) -> Iterator[str]:
+        with self._post(role, model_name, prompt, config, stream=True) as resp:
+            for line in resp:
+                chunk = _chunk(line)
+                if chunk.get("text"):
+                    yield chunk["text"]
+                _note_finish(chunk, finish)
+
+    async def agenerate(self, role: str, model_name: str, prompt: Prompt,
+                        config: Optional[dict] = None) -> Reply:
+        reader, writer, headers = await self._apost(role, model_name, prompt, config, stream=False)
+        try:
+            raw = b"".join([piece async for piece in _body(reader, headers, self.timeout)])
+        finally:
+            writer.close()
+        data = json.loads(raw.decode("utf-8"))
+        return Reply(data.get("text") or "", data.get("finish_reason") == "MAX_TOKENS")
+
+    async def astream(self, role: str, model_name: str, prompt: Prompt,
+                      config: Optional[dict] = None,
+                      finish: Optional[dict] = None) -> AsyncIterator[str]:
+        reader, writer, headers = await self._apost(role, model_name, prompt, config, stream=True)
+        try:
+            buf = b""
+            async for piece in _body(reader, headers, self.timeout):
+                *lines, buf = (buf + piece).split(b"\n")
+                for line in lines:
+                    chunk = _chunk(line)
+                    if chunk.get("text"):
+                        yield chunk["text"]
+                    _note_finish(chunk, finish)
+            chunk = _chunk(buf)
+            if chunk.get("text"):
+                yield chunk["text"]
+            _note_finish(chunk, finish)
+        finally:
+            writer.close()
+
+    def _payload(self, role: str, model_name: str, prompt: Prompt,
+                 config: Optional[dict], stream: bool) -> bytes:
+        _, temperature, max_tokens = client_pool.MODEL_ROLES[role]
+        return json.dumps({
+            "model":             model_name,
+            "role":              role,
+            "kind":              prompt.name,
+            "prefix":            prompt.prefix,
+            "body":              prompt.body,
+            "temperature":       temperature,
+            "max_output_tokens": max_tokens,
+            "response_schema":   (config or {}).get("response_schema"),
+            "stream":            stream,
+        }).encode("utf-8")
+
+    def _post(self, role: str, model_name: str, prompt: Prompt,
+              config: Optional[dict], stream: bool):
+        req = urllib.request.Request(
+            self.url + "/v1/generate",
+            data=self._payload(role, model_name, prompt, config, stream),
+            headers={"Content-Type": "application/json", "x-api-key": self.api_key},
+            method="POST",
+        )
+        try:
+            return urllib.request.urlopen(req, timeout=self.timeout)
+        except urllib.error.HTTPError as exc:
+            try:
+                message = json.loads(exc.read().decode("utf-8")).get("error", exc.reason)
+            except Exception:
+                message = exc.reason
+            raise BackendError(exc.code, str(message)) from None
+
+    async def _apost(self, role: str, model_name: str, prompt: Prompt,
+                     config: Optional[dict], stream: bool):
+        """
+        POST on a fresh connection (Connection: close) and read the status
+        line and headers. Returns (reader, writer, headers); the body is
+        left for _body().
+        """
+        url  = urllib.parse.urlsplit(self.url + "/v1/generate")
+        tls  = url.scheme == "https"
+        body = self._payload(role, model_name, prompt, config, stream)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(
+            url.hostname, url.port or (443 if tls else 80), ssl=tls or None), self.timeout)
+        try:
+            head = (f"POST {url.path} HTTP/1.1\r\nHost: {url.netloc}\r\n"
+                    f"Content-Type: application/json\r\nx-api-key: {self.api_key}\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+            writer.write(head.encode("latin-1") + body)
+            await writer.drain()
+
+            status  = int((await asyncio.wait_for(reader.readline(), self.timeout)).split()[1])
+            headers = {}
+            while True:
+                line = (await asyncio.wait_for(reader.readline(), self.timeout)).decode("latin-1")
+                if not line.strip():
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if status >= 400:
+                try:
+                    raw = b"".join([p async for p in _body(reader, headers, self.timeout)])
+                    message = json.loads(raw.decode("utf-8")).get("error") or "HTTP error"
+                except Exception:
+                    message = "HTTP error"
+                raise BackendError(status, str(message))
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer, headers
+
+
+async def _body(reader: asyncio.StreamReader, headers: dict,
+                timeout: float) -> AsyncIterator[bytes]:
+    """Response body pieces — chunked, Content-Length or up to EOF; timeout per read."""
+    read = lambda aw: asyncio.wait_for(aw, timeout)
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size = int((await read(reader.readline())).split(b";")[0].strip() or b"0", 16)
+            if not size:
+                return
+            yield await read(reader.readexactly(size))
+            await read(reader.readline())
+    elif "content-length" in headers:
+        yield await read(reader.readexactly(int(headers["content-length"])))
+    else:
+        while True:
+            piece = await read(reader.read(65536))
+            if not piece:
+                return
+            yield piece
+
+
+def _chunk(line: bytes) -> dict:
+    """One newline-delimited stream object ({"text"} or {"finish_reason"}); {} for a blank line."""
+    line = line.strip()
+    return json.loads(line.decode("utf-8")) if line else {}
+
+
+def _note_finish(chunk: dict, finish: Optional[dict]) -> None:
+    if finish is not None and "finish_reason" in chunk:
+        finish["truncated"] = chunk["finish_reason"] == "MAX_TOKENS"
+
+
+# ── Selection ─────────────────────────────────────────────────────
+
+def make_backend(api_key: Optional[str], kind: Optional[str] = None) -> Optional[LLMBackend]:
+    """Backend for settings.llm_backend (or kind); None if it cannot be used."""
+    if settings.llm_cassette:
+        from .cassette import open_cassette
+        mode  = settings.llm_cassette_mode
+        inner = _live_backend(api_key, kind) if mode == "record" else None
+        if mode == "record" and inner is None:
+            return None
+        backend = open_cassette(settings.llm_cassette, mode, inner,
+                                settings.llm_cassette_time_scale)
+        return backend if backend.available() else None
+    return _live_backend(api_key, kind)
+
+
+def _live_backend(api_key: Optional[str], kind: Optional[str]) -> Optional[LLMBackend]:
+    kind = (kind or settings.llm_backend).lower()
+    if kind == "http":
+        backend = HTTPBackend(api_key)
+    elif kind == "gemini":
+        backend = GeminiBackend(api_key)
+    else:
+        print(f"[backends] unknown llm_backend={kind!r}")
+        return None
+    return backend if backend.available() else None
@@ -0,0 +1,100 @@
+"""
+services/batcher.py
+─────────────────────────────────────────────────────────────
+Micro-batching for small independent model calls.
+
+submit(item) parks the item and returns a Future. The first item of a
+window starts a timer; when it fires after max_wait_s — or as soon as
+max_items are waiting — the whole window is handed to run_batch() in
+one go and each Future gets its own result. The added latency per item
+is therefore bounded by max_wait_s (plus the larger request itself).
+
+run_batch(items) returns one result per item, in order; if it raises,
+every Future in the batch gets the exception. Futures are marked running
+as soon as they are handed out, so a caller giving up on its item
+(a deadline) cannot cancel it and strand the rest of its batch.
+
+Used by AIService for Pass 1 (and optionally Pass 2) when
+settings.batch_extraction / batch_comparison is on: dozens of sessions
+submitting within the same second share one request and one quota unit.
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+
+    def __init__(self, run_batch: Callable[[List[T]], Sequence[R]],
+                 max_wait_s: float, max_items: int, name: str = "batch"):
+        self.run_batch  = run_batch
+        self.max_wait_s = max_wait_s
+        self.max_items  = max(1, max_items)
+        self.name       = name
+        self._lock      = threading.Lock()
+        self._pending: List[Tuple[T, Future]] = []
+        self._timer: threading.Timer = None
+        self._stats     = {"batches": 0, "items": 0, "largest": 0}
+
+    def submit(self, item: T) -> Future:
+        fut: Future = Future()
+        fut.set_running_or_notify_cancel()      # shared with the batch — not cancellable
+        with self._lock:
+            self._pending.append((item, fut))
+            if len(self._pending) >= self.max_items:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_wait_s, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            # Window is full — the caller that filled it sends it right away
+            self._run(batch)
+        return fut
+
+    def metrics(self) -> dict:
+        with self._lock:
+            b = self._stats["batches"]
+            return {**self._stats, "pending": len(self._pending),
+                    "avg_size": round(self._stats["items"] / b, 2) if b else 0.0}
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _take(self) -> List[Tuple[T, Future]]:
+        """Detach the current window (caller holds the lock)."""
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if batch:
+            self._stats["batches"] += 1
+            self._stats["items"]   += len(batch)
+            self._stats["largest"]  = max(self._stats["largest"], len(batch))
+        return batch
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(batch)
+
+    def _run(self, batch: List[Tuple[T, Future]]) -> None:
+        try:
+            results = list(self.run_batch([item for item, _ in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(f"{self.name}: {len(results)} results for {len(batch)} items")
+        except BaseException as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
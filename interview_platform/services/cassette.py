@@ -0,0 +1,260 @@
+"""
+services/cassette.py
+─────────────────────────────────────────────────────────────
+Record / replay backend for reproducible evaluation benchmarks.
+
+record — wraps a live backend (backends.py); every call's prompt,
+         reply, truncation flag and timing (streamed chunks with
+         their offsets) is appended to a gzip-compressed JSONL file.
+replay — answers from the file alone, no SDK, key or network needed.
+         Sleeps for the recorded latency × time_scale (1.0 = original
+         timings, 0 = as fast as possible). A prompt that was never
+         recorded raises CassetteMiss, which the router treats like
+         any other failed call.
+
+Entries are keyed by a hash of the prompt (kind, prefix, body and
+whether a response schema was requested) — not the model — so a
+replayed call matches whether the router sent it to the primary or
+the fallback. Repeated prompts replay their recordings in order.
+
+There is one CassetteBackend per (file, mode, inner backend, time
+scale) — with a key pool, every key records through its own live
+backend — and all of them share the file's _Tape (recordings, replay
+cursors, writer, stats), so writers never interleave.
+
+Selected with settings.llm_cassette (+ llm_cassette_mode,
+llm_cassette_time_scale); see tools/benchmark.py.
+─────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from .backends import LLMBackend, Reply
+from .prompts import Prompt
+
+
+class CassetteMiss(LookupError):
+    """Replay asked for a prompt the cassette never recorded."""
+
+
+def prompt_key(prompt: Prompt, config: Optional[dict]) -> str:
+    structured = bool(config and config.get("response_schema"))
+    payload = json.dumps([prompt.name, prompt.prefix, prompt.body, structured],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Tape:
+    """One cassette file: its recordings, replay cursors, writer and stats."""
+
+    def __init__(self, path: str):
+        self.path     = path
+        self.lock     = threading.Lock()
+        self.entries: Dict[str, List[dict]] = {}
+        self.cursor:  Dict[str, int] = {}
+        self.out      = None
+        self.loaded   = False
+        self.stats    = {"hits": 0, "misses": 0, "recorded": 0}
+
+
+class CassetteBackend:
+
+    def __init__(self, path: str, mode: str = "replay",
+                 inner: Optional[LLMBackend] = None, time_scale: float = 1.0,
+                 tape: Optional[_Tape] = None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"cassette mode must be record or replay, not {mode!r}")
+        if mode == "record" and inner is None:
+            raise ValueError("recording needs a live backend to wrap")
+        self.path       = path
+        self.mode       = mode
+        self.inner      = inner
+        self.time_scale = time_scale
+        self.name       = f"cassette:{mode}"
+        self.tape       = tape or _Tape(path)
+        self.stats      = self.tape.stats
+        if mode == "replay":
+            self._load()
+
+    def available(self) -> bool:
+        if self.mode == "replay":
+            return bool(self.tape.entries)
+        return self.inner.available()
+
+    # ── Backend protocol ──────────────────────────────────────────
+
+    def generate(self, role: str, model_name: str, prompt: Prompt,
+                 config: Optional[dict] = None) -> Reply:
+        key = prompt_key(prompt, config)
+        if self.mode == "replay":
+            entry = self._next(key, prompt)
+            self._sleep(entry["latency_s"])
+            return Reply(entry["text"], entry["truncated"])
+
+        t0    = time.perf_counter()
+        reply = self.inner.generate(role, model_name, prompt, config)
+        self._record(key, prompt, model_name, {
+            "text": reply.text, "truncated": reply.truncated,
+            "latency_s": round(time.perf_counter() - t0, 4),
+        })
+        return reply
+
+    def stream(self, role: str, model_name: str, prompt: Prompt,
+               config: Optional[dict] = None, finish: Optional[dict] = None) -> Iterator[str]:
+        key = prompt_key(prompt, config)
+        if self.mode == "replay":
+            entry = self._next(key, prompt)
+            # Non-streamed recordings replay as one chunk at the end
+            chunks = entry.get("chunks") or [[entry["latency_s"], entry["text"]]]
+            elapsed = 0.0
+            for offset, text in chunks:
+                self._sleep(offset - elapsed)
+                elapsed = offset
+                yield text
+            if finish is not None:
+                finish["truncated"] = entry["truncated"]
+            return
+
+        t0, chunks, end = time.perf_counter(), [], {}
+        for text in self.inner.stream(role, model_name, prompt, config, end):
+            chunks.append([round(time.perf_counter() - t0, 4), text])
+            yield text
+        self._record(key, prompt, model_name, {
+            "text": "".join(t for _, t in chunks), "truncated": end.get("truncated", False),
+            "latency_s": round(time.perf_counter() - t0, 4), "chunks": chunks,
+        })
+        if finish is not None:
+            finish.update(end)
+
+    async def agenerate(self, role: str, model_name: str, prompt: Prompt,
+                        config: Optional[dict] = None) -> Reply:
+        key = prompt_key(prompt, config)
+        if self.mode == "replay":
+            entry = self._next(key, prompt)
+            await self._asleep(entry["latency_s"])
+            return Reply(entry["text"], entry["truncated"])
+
+        t0    = time.perf_counter()
+        reply = await self.inner.agenerate(role, model_name, prompt, config)
+        self._record(key, prompt, model_name, {
+            "text": reply.text, "truncated": reply.truncated,
+            "latency_s": round(time.perf_counter() - t0, 4),
+        })
+        return reply
+
+    async def astream(self, role: str, model_name: str, prompt: Prompt,
+                      config: Optional[dict] = None,
+                      finish: Optional[dict] = None) -> AsyncIterator[str]:
+        key = prompt_key(prompt, config)
+        if self.mode == "replay":
+            entry = self._next(key, prompt)
+            chunks = entry.get("chunks") or [[entry["latency_s"], entry["text"]]]
+            elapsed = 0.0
+            for offset, text in chunks:
+                await self._asleep(offset - elapsed)
+                elapsed = offset
+                yield text
+            if finish is not None:
+                finish["truncated"] = entry["truncated"]
+            return
+
+        t0, chunks, end = time.perf_counter(), [], {}
+        async for text in self.inner.astream(role, model_name, prompt, config, end):
+            chunks.append([round(time.perf_counter() - t0, 4), text])
+            yield text
+        self._record(key, prompt, model_name, {
+            "text": "".join(t for _, t in chunks), "truncated": end.get("truncated", False),
+            "latency_s": round(time.perf_counter() - t0, 4), "chunks": chunks,
+        })
+        if finish is not None:
+            finish.update(end)
+
+    # ── File ──────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        tape = self.tape
+        with tape.lock:
+            if tape.loaded:
+                return
+            tape.loaded = True
+            if not os.path.exists(self.path):
+                print(f"[Cassette] {self.path} not found — nothing to replay")
+                return
+            with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        entry = json.loads(line)
+                        tape.entries.setdefault(entry["key"], []).append(entry)
+
+    def _record(self, key: str, prompt: Prompt, model_name: str, data: dict) -> None:
+        line = json.dumps({"key": key, "kind": prompt.name, "model": model_name, **data},
+                          ensure_ascii=False)
+        tape = self.tape
+        with tape.lock:
+            if tape.out is None:
+                # Append: a second recording session adds a new gzip member
+                tape.out = gzip.open(self.path, "at", encoding="utf-8")
+                atexit.register(self.close)
+            tape.out.write(line + "\n")
+            tape.out.flush()
+            tape.stats["recorded"] += 1
+
+    def close(self) -> None:
+        tape = self.tape
+        with tape.lock:
+            if tape.out is not None:
+                tape.out.close()
+                tape.out = None
+
+    # ── Replay ────────────────────────────────────────────────────
+
+    def _next(self, key: str, prompt: Prompt) -> dict:
+        tape = self.tape
+        with tape.lock:
+            entries = tape.entries.get(key)
+            if not entries:
+                tape.stats["misses"] += 1
+                raise CassetteMiss(f"no recording for {prompt.name} prompt {key[:12]}")
+            i = tape.cursor.get(key, 0)
+            tape.cursor[key] = i + 1
+            tape.stats["hits"] += 1
+            return entries[i % len(entries)]
+
+    def _sleep(self, seconds: float) -> None:
+        if self.time_scale > 0 and seconds > 0:
+            time.sleep(seconds * self.time_scale)
+
+    async def _asleep(self, seconds: float) -> None:
+        if self.time_scale > 0 and seconds > 0:
+            await asyncio.sleep(seconds * self.time_scale)
+
+
+_OPEN: Dict[tuple, CassetteBackend] = {}
+_TAPES: Dict[str, _Tape] = {}
+_OPEN_LOCK = threading.Lock()
+
+
+def open_cassette(path: str, mode: str, inner: Optional[LLMBackend] = None,
+                  time_scale: float = 1.0) -> CassetteBackend:
+    """
+    One CassetteBackend per (path, mode, inner backend's key, time_scale)
+    per process; all of a path's backends share one _Tape, so writers
+    never interleave.
+    """
+    path_key = os.path.abspath(path)
+    key = (path_key, mode, getattr(inner, "name", None), getattr(inner, "api_key", None),
+           time_scale)
+    with _OPEN_LOCK:
+        cassette = _OPEN.get(key)
+        if cassette is None:
+            tape     = _TAPES.setdefault(path_key, _Tape(path))
+            cassette = _OPEN[key] = CassetteBackend(path, mode, inner, time_scale, tape)
+        return cassette
@@ -0,0 +1,117 @@
+"""
+services/client_pool.py
+─────────────────────────────────────────────────────────────
+Process-wide registry of Gemini GenerativeModel clients.
+
+Keyed by (api_key, model name, generation config) so every Streamlit
+rerun, session and AIService instance in the process reuses the same
+client objects — and with them the SDK's pooled HTTP connections —
+instead of calling genai.configure() and rebuilding models per submit.
+
+genai.configure() is process-global, so a model is bound to its key's
+transport at build time (under the lock); later configure() calls for
+other keys do not affect models already in the pool.
+
+warm_up() builds the standard roles once at process start.
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from ..config import settings
+
+try:
+    import google.generativeai as genai
+    from google.generativeai import client as _genai_client
+    _SDK_OK = True
+except ImportError:
+    _SDK_OK = False
+
+
+# role → (settings attribute holding the model name, temperature, max_output_tokens)
+MODEL_ROLES: Dict[str, Tuple[str, float, int]] = {
+    "eval":     ("gemini_model_eval",     0.0, 1800),   # fully deterministic
+    "strategy": ("gemini_model_strategy", 0.5,  800),   # creative & personalised
+}
+
+_MODELS: Dict[tuple, object] = {}
+_LOCK = threading.RLock()
+_configured_key: Optional[str] = None
+
+
+def sdk_available() -> bool:
+    return _SDK_OK
+
+
+def get_model(api_key: str, model_name: str,
+              temperature: float, max_output_tokens: int):
+    """Return the pooled client for this (key, model, config), building it once."""
+    if not _SDK_OK:
+        raise RuntimeError("google-generativeai not installed")
+    key = (api_key, model_name, float(temperature), int(max_output_tokens))
+    with _LOCK:
+        model = _MODELS.get(key)
+        if model is None:
+            model = _build(api_key, model_name, temperature, max_output_tokens)
+            _MODELS[key] = model
+        return model
+
+
+def get_role_model(api_key: str, role: str, model_name: Optional[str] = None):
+    """Pooled client for a standard role; model_name overrides the role default."""
+    attr, temperature, max_tokens = MODEL_ROLES[role]
+    return get_model(api_key, model_name or getattr(settings, attr),
+                     temperature, max_tokens)
+
+
+def warm_up(api_key: Optional[str] = None) -> int:
+    """Build every standard role client for api_key. Returns the pool size."""
+    api_key = api_key or settings.gemini_api_key
+    if not (_SDK_OK and api_key):
+        return 0
+    for role in MODEL_ROLES:
+        try:
+            get_role_model(api_key, role)
+        except Exception as exc:
+            print(f"[client_pool] warm-up failed for {role}: {exc}")
+    return len(_MODELS)
+
+
+def size() -> int:
+    with _LOCK:
+        return len(_MODELS)
+
+
+@contextmanager
+def configured(api_key: str):
+    """Hold the pool lock with the SDK's global config pointing at api_key."""
+    global _configured_key
+    with _LOCK:
+        if _configured_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_key = api_key
+        yield
+
+
+def _build(api_key: str, model_name: str, temperature: float, max_output_tokens: int):
+    with configured(api_key):
+        return bind_transport(genai.GenerativeModel(
+            model_name=model_name,
+            generation_config=genai.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_output_tokens,
+            ),
+        ))
+
+
+def bind_transport(model):
+    # Pin the transport for the currently configured key now; the SDK
+    # would otherwise resolve it lazily from whatever key was configured last.
+    try:
+        model._client = _genai_client.get_default_generative_client()
+    except Exception:
+        pass
+    return model
+
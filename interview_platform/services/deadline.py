@@ -0,0 +1,70 @@
+"""
+services/deadline.py
+─────────────────────────────────────────────────────────────
+End-to-end time budget for one evaluation.
+
+A Deadline is created when evaluate_answer starts and handed to every
+pass; each pass waits only for deadline.remaining(). run() executes a
+blocking call on a thread of its own (start() without waiting) and stops
+waiting when the budget is spent — the call itself is abandoned, not
+interrupted, and its late result is dropped. There is no shared pool:
+abandoned calls against a slow provider hold only their own threads, so
+they cannot use up capacity that later evaluations need. wait() does the same for
+a Future that already exists (a batched pass, a concurrent ideal
+lookup).
+
+Both raise DeadlineExceeded, which AIService turns into a degraded
+scorecard built from whatever passes finished in time.
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """The evaluation's time budget ran out before a pass finished."""
+
+
+class Deadline:
+
+    def __init__(self, budget_s: float):
+        self.budget_s = budget_s
+        self.at       = time.monotonic() + budget_s
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        if self.expired:
+            raise DeadlineExceeded(f"{self.budget_s:.0f}s budget spent")
+        return self.wait(self.start(fn, *args, **kwargs))
+
+    def start(self, fn: Callable[..., T], *args, **kwargs) -> Future:
+        """fn on its own daemon thread; wait() for its result."""
+        fut: Future = Future()
+        fut.set_running_or_notify_cancel()
+
+        def _run():
+            try:
+                fut.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                fut.set_exception(exc)
+
+        threading.Thread(target=_run, name="aiip-deadline", daemon=True).start()
+        return fut
+
+    def wait(self, fut: Future) -> T:
+        try:
+            return fut.result(timeout=self.remaining())
+        except FutureTimeout:
+            raise DeadlineExceeded(f"{self.budget_s:.0f}s budget spent") from None
@@ -0,0 +1,131 @@
+"""
+services/eval_cache.py
+─────────────────────────────────────────────────────────────
+Persistent, content-addressed cache in front of evaluate_answer.
+
+Evaluation runs at temperature 0.0, so the same
+  (question, normalised answer, skill, difficulty, model, pass count,
+   prompt version)
+always yields the same scorecard. Rows live in the `eval_cache` table
+next to `answers`.
+
+Invalidation: the key embeds PROMPT_VERSION (a hash of RUBRIC and every
+prompt template), so editing either silently retires old rows; prune()
+then deletes them.
+Eviction:     rows older than eval_cache_ttl_hours are dropped, and the
+              table is trimmed to eval_cache_max_entries by last hit (LRU).
+─────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..config import settings
+
+_WS = re.compile(r"\s+")
+
+
+def normalise_answer(answer: str) -> str:
+    """Collapse whitespace so re-pasted answers hit the same key."""
+    return _WS.sub(" ", (answer or "").strip())
+
+
+class EvalCache:
+
+    def __init__(self, version: str, session_factory=None,
+                 max_entries: Optional[int] = None,
+                 ttl_hours: Optional[float] = None):
+        self.version      = version
+        self.max_entries  = max_entries or settings.eval_cache_max_entries
+        self.ttl          = timedelta(hours=ttl_hours or settings.eval_cache_ttl_hours)
+        self._factory     = session_factory
+
+    # ── Keys ──────────────────────────────────────────────────────
+
+    def make_key(self, question: str, answer: str, skill: str,
+                 difficulty: str, model: str, passes: int = 3) -> str:
+        payload = json.dumps(
+            [self.version, model, passes, question.strip(), normalise_answer(answer),
+             skill, difficulty],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ── Read / write ──────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[dict]:
+        from ..database.models import EvalCacheEntry
+        db = self._session()
+        try:
+            row = db.get(EvalCacheEntry, key)
+            if row is None or row.prompt_version != self.version:
+                return None
+            now = datetime.utcnow()
+            if row.created_at and now - row.created_at > self.ttl:
+                db.delete(row)
+                db.commit()
+                return None
+            row.hit_count   = (row.hit_count or 0) + 1
+            row.last_hit_at = now
+            db.commit()
+            return dict(row.result_json or {})
+        except Exception as exc:
+            print(f"[EvalCache] lookup failed: {exc}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def put(self, key: str, result: dict, model: str) -> None:
+        from ..database.models import EvalCacheEntry
+        db = self._session()
+        try:
+            now = datetime.utcnow()
+            db.merge(EvalCacheEntry(
+                cache_key      = key,
+                prompt_version = self.version,
+                model          = model,
+                result_json    = result,
+                hit_count      = 0,
+                created_at     = now,
+                last_hit_at    = now,
+            ))
+            db.commit()
+            self.prune(db)
+        except Exception as exc:
+            print(f"[EvalCache] store failed: {exc}")
+            db.rollback()
+        finally:
+            db.close()
+
+    # ── Eviction ──────────────────────────────────────────────────
+
+    def prune(self, db) -> int:
+        """Drop stale-version and expired rows, then trim to max_entries (LRU)."""
+        from ..database.models import EvalCacheEntry
+        q = db.query(EvalCacheEntry)
+        removed  = q.filter(EvalCacheEntry.prompt_version != self.version) \
+                    .delete(synchronize_session=False)
+        removed += q.filter(EvalCacheEntry.created_at < datetime.utcnow() - self.ttl) \
+                    .delete(synchronize_session=False)
+        overflow = q.count() - self.max_entries
+        if overflow > 0:
+            oldest = [k for (k,) in db.query(EvalCacheEntry.cache_key)
+                                     .order_by(EvalCacheEntry.last_hit_at.asc())
+                                     .limit(overflow)]
+            removed += q.filter(EvalCacheEntry.cache_key.in_(oldest)) \
+                        .delete(synchronize_session=False)
+        db.commit()
+        return removed
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _session(self):
+        if self._factory is None:
+            from ..database.base import SessionLocal, init_db
+            init_db()
+            self._factory = SessionLocal
+        return self._factory()
@@ -0,0 +1,85 @@
+"""
+services/ideal_store.py
+─────────────────────────────────────────────────────────────
+Ideal-answer index keyed by question_hash().
+
+Lookup order:
+  1. IDEAL_INDEX   — hand-written answers from data/question_bank.py
+  2. process memo  — answers already seen by this process
+  3. ideal_answers — answers generated once and written back to SQLite
+
+Anything the model generates is put() here, so each question's ideal
+answer is generated at most once per deployment.
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+from typing import Dict, Optional
+
+from ..data.question_bank import IDEAL_INDEX, question_hash
+
+
+class IdealAnswerStore:
+
+    def __init__(self, session_factory=None):
+        self._factory = session_factory
+        self._memo: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, question: str) -> Optional[str]:
+        key = question_hash(question)
+        if key in IDEAL_INDEX:
+            return IDEAL_INDEX[key]
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+
+        from ..database.models import IdealAnswer
+        db = self._session()
+        try:
+            row  = db.get(IdealAnswer, key)
+            text = row.answer_text if row else None
+        except Exception as exc:
+            print(f"[IdealAnswerStore] lookup failed: {exc}")
+            text = None
+        finally:
+            db.close()
+
+        if text:
+            with self._lock:
+                self._memo[key] = text
+        return text
+
+    def put(self, question: str, skill: str, text: str, model: str) -> None:
+        from ..database.models import IdealAnswer
+        key = question_hash(question)
+        with self._lock:
+            self._memo[key] = text
+        db = self._session()
+        try:
+            if db.get(IdealAnswer, key) is None:
+                db.add(IdealAnswer(
+                    question_hash = key,
+                    skill         = skill,
+                    question_text = question.strip(),
+                    answer_text   = text,
+                    model         = model,
+                ))
+                db.commit()
+        except Exception as exc:
+            # Lost an insert race with another worker — theirs is as good
+            print(f"[IdealAnswerStore] store failed: {exc}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _session(self):
+        if self._factory is None:
+            from ..database.base import SessionLocal, init_db
+            init_db()
+            self._factory = SessionLocal
+        return self._factory()
+
+
+# Process-wide instance — the memo is shared by every AIService
+ideal_store = IdealAnswerStore()
@@ -0,0 +1,259 @@
+"""
+services/job_queue.py
+─────────────────────────────────────────────────────────────
+Durable evaluation queue in the app's own database (table eval_jobs),
+so no broker is needed. The web tier enqueues; worker processes
+(tools/eval_worker.py) claim, evaluate and complete:
+
+  enqueue(...)      → job_id
+  claim(worker)     — oldest queued job, or a running one whose lease
+                      ran out (its worker died), moved to running and
+                      leased for eval_job_lease_s. Compare-and-set on
+                      the row, so two workers never get the same job.
+  complete(...)     — result plus any rows to store (the Answer) in
+                      one transaction, only while the worker holds the job
+  fail(job_id, worker, err)
+                    — back to queued until eval_job_max_attempts, then
+                      failed; only while the worker holds the job
+  cancel(job_id)    — withdraw a job no worker has claimed yet
+                      (running=True: also one a worker is running —
+                      its complete() is then refused)
+  handle(job_id)    — Future-like done() / result() polling the row;
+                      what the interview page keeps for a pending answer
+
+Workers use their own configured API keys (GEMINI_API_KEYS); keys
+typed into the UI never reach the database.
+─────────────────────────────────────────────────────────────
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, or_, update
+
+from ..config import settings
+
+
+class JobFailed(RuntimeError):
+    """The job ran out of attempts (or was cancelled); str() is its last error."""
+
+
+class JobHandle:
+    """
+    done() / result(timeout) over one eval_jobs row — duck-types a Future.
+    A job id that does not exist (never did, or was purged) is finished
+    and failed.
+    """
+
+    def __init__(self, queue: "JobQueue", job_id: int):
+        self.queue  = queue
+        self.job_id = job_id
+        self._final = None              # (status, result, error) once finished
+
+    def done(self) -> bool:
+        if self._final is None:
+            status, result, error = self.queue.status(self.job_id)
+            if status is None:
+                status = "failed"
+            if status in ("done", "failed"):
+                self._final = (status, result, error)
+        return self._final is not None
+
+    def result(self, timeout: Optional[float] = None) -> dict:
+        t_end = None if timeout is None else time.monotonic() + timeout
+        while not self.done():
+            if t_end is not None and time.monotonic() >= t_end:
+                raise TimeoutError(f"eval job {self.job_id} not finished after {timeout:.0f}s")
+            time.sleep(settings.eval_queue_poll_s)
+        status, result, error = self._final
+        if status == "failed":
+            raise JobFailed(error or "evaluation job failed")
+        return result
+
+
+class JobQueue:
+
+    def __init__(self, session_factory=None):
+        self._factory = session_factory
+
+    # ── Producer side ─────────────────────────────────────────────
+
+    def enqueue(self, session_id: int, question: dict, answer_text: str,
+                skipped: bool = False) -> int:
+        from ..database.models import EvalJob
+        db = self._session()
+        try:
+            job = EvalJob(session_id=session_id, question_json=question,
+                          answer_text=answer_text, skipped=skipped)
+            db.add(job)
+            db.commit()
+            return job.job_id
+        finally:
+            db.close()
+
+    def handle(self, job_id: int) -> JobHandle:
+        return JobHandle(self, job_id)
+
+    def status(self, job_id: int):
+        """(status, result_json, error) — status None for an unknown job."""
+        from ..database.models import EvalJob
+        db = self._session()
+        try:
+            job = db.get(EvalJob, job_id)
+            if job is None:
+                return None, None, f"no eval job {job_id}"
+            return job.status, job.result_json, job.error
+        finally:
+            db.close()
+
+    def cancel(self, job_id: int, running: bool = False) -> bool:
+        """
+        True if the job was still queued (or, with running=True, queued or
+        running) and is now withdrawn. False once it has finished.
+        """
+        from ..database.models import EvalJob
+        open_ = ("queued", "running") if running else ("queued",)
+        db = self._session()
+        try:
+            n = db.execute(
+                update(EvalJob)
+                .where(EvalJob.job_id == job_id, EvalJob.status.in_(open_))
+                .values(status="failed", error="cancelled", finished_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            return n == 1
+        finally:
+            db.close()
+
+    # ── Worker side ───────────────────────────────────────────────
+
+    def claim(self, worker: str) -> Optional[dict]:
+        from ..database.models import EvalJob
+        now = datetime.utcnow()
+        db  = self._session()
+        try:
+            # Leases that ran out on their last attempt: give up on those jobs
+            db.execute(
+                update(EvalJob)
+                .where(EvalJob.status == "running", EvalJob.lease_until < now,
+                       EvalJob.attempts >= settings.eval_job_max_attempts)
+                .values(status="failed", finished_at=now,
+                        error="worker lost on the last attempt")
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            claimable = or_(EvalJob.status == "queued",
+                            and_(EvalJob.status == "running", EvalJob.lease_until < now))
+            for _ in range(5):
+                job_id = db.query(EvalJob.job_id).filter(claimable) \
+                           .order_by(EvalJob.job_id).limit(1).scalar()
+                if job_id is None:
+                    return None
+                won = db.execute(
+                    update(EvalJob)
+                    .where(EvalJob.job_id == job_id, claimable)
+                    .values(status="running", worker=worker, attempts=EvalJob.attempts + 1,
+                            started_at=now,
+                            lease_until=now + timedelta(seconds=settings.eval_job_lease_s))
+                    .execution_options(synchronize_session=False)
+                ).rowcount == 1
+                db.commit()
+                if won:
+                    job = db.get(EvalJob, job_id)
+                    return {
+                        "job_id":      job.job_id,
+                        "session_id":  job.session_id,
+                        "question":    job.question_json or {},
+                        "answer_text": job.answer_text or "",
+                        "skipped":     bool(job.skipped),
+                        "attempts":    job.attempts,
+                    }
+            return None                 # lost every race — let the caller poll again
+        finally:
+            db.close()
+
+    def complete(self, job_id: int, worker: str, result: dict, rows: Iterable = ()) -> bool:
+        """
+        Store the result (and rows) if this worker still holds the job.
+        False if its lease ran out and another worker took the job over.
+        """
+        from ..database.models import EvalJob
+        db = self._session()
+        try:
+            held = db.execute(
+                update(EvalJob)
+                .where(EvalJob.job_id == job_id, EvalJob.worker == worker,
+                       EvalJob.status == "running")
+                .values(status="done", result_json=result, error=None,
+                        lease_until=None, finished_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount == 1
+            if not held:
+                db.rollback()
+                return False
+            for row in rows:
+                db.add(row)
+            db.commit()
+            return True
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        """
+        Give the job back (queued for another attempt, or failed after the
+        last one). False if this worker no longer holds it.
+        """
+        from ..database.models import EvalJob
+        from sqlalchemy import case
+        db = self._session()
+        try:
+            held = db.execute(
+                update(EvalJob)
+                .where(EvalJob.job_id == job_id, EvalJob.worker == worker,
+                       EvalJob.status == "running")
+                .values(
+                    error       = error[:2000],
+                    lease_until = None,
+                    status      = case((EvalJob.attempts >= settings.eval_job_max_attempts,
+                                        "failed"), else_="queued"),
+                    finished_at = case((EvalJob.attempts >= settings.eval_job_max_attempts,
+                                        datetime.utcnow()), else_=None),
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount == 1
+            db.commit()
+            return held
+        finally:
+            db.close()
+
+    def metrics(self) -> dict:
+        from sqlalchemy import func
+        from ..database.models import EvalJob
+        db = self._session()
+        try:
+            counts = dict(db.query(EvalJob.status, func.count()).group_by(EvalJob.status).all())
+            oldest = db.query(func.min(EvalJob.created_at)) \
+                       .filter(EvalJob.status == "queued").scalar()
+        finally:
+            db.close()
+        return {
+            **{s: counts.get(s, 0) for s in ("queued", "running", "done", "failed")},
+            "oldest_queued_s": round((datetime.utcnow() - oldest).total_seconds(), 1)
+                               if oldest else 0.0,
+        }
+
+    def _session(self):
+        if self._factory is None:
+            from ..database.base import SessionLocal, init_db
+            init_db()
+            self._factory = SessionLocal
+        return self._factory()
+
+
+# Process-wide queue on the app database
+job_queue = JobQueue()
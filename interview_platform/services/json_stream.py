@@ -0,0 +1,113 @@
+"""
+services/json_stream.py
+─────────────────────────────────────────────────────────────
+Incremental parser for a single streamed JSON object.
+
+Feed it text chunks as they arrive; after every feed() it reports
+  • fields   — top-level keys whose values are complete
+  • partial  — (key, text so far) for a string value still streaming
+
+so a scorecard can render each score the moment its value closes and
+let long text fields (strengths, ideal_answer, …) fill in live.
+Leading chatter or markdown fences before the first "{" are ignored.
+─────────────────────────────────────────────────────────────
+"""
+
+import json
+from typing import Optional, Tuple
+
+
+class IncrementalJSONParser:
+
+    def __init__(self):
+        self.buf     = ""
+        self.fields: dict = {}
+        self.done    = False
+        self._pos    = 0
+        self._depth  = 0
+        self._in_str = False
+        self._esc    = False
+        self._state  = "start"      # start | key | key_str | colon | value | in_value
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._val_start: Optional[int] = None
+
+    # ── Public ────────────────────────────────────────────────────
+
+    def feed(self, chunk: str) -> dict:
+        """Consume a chunk; return the current best view of the object."""
+        self.buf += chunk or ""
+        while self._pos < len(self.buf) and not self.done:
+            self._step(self.buf[self._pos])
+            self._pos += 1
+        return self.snapshot()
+
+    @property
+    def partial(self) -> Optional[Tuple[str, str]]:
+        if not (self._state == "in_value" and self._in_str and self._depth == 1
+                and self._val_start is not None and self.buf[self._val_start] == '"'):
+            return None
+        raw = self.buf[self._val_start + 1:self._pos].rstrip("\\")
+        try:
+            return self._key, json.loads(f'"{raw}"')
+        except ValueError:
+            return self._key, raw
+
+    def snapshot(self) -> dict:
+        view = dict(self.fields)
+        part = self.partial
+        if part and part[0] is not None:
+            view[part[0]] = part[1]
+        return view
+
+    # ── Scanner ───────────────────────────────────────────────────
+
+    def _step(self, ch: str) -> None:
+        if self._state == "start":
+            if ch == "{":
+                self._depth, self._state = 1, "key"
+            return
+
+        if self._in_str:
+            if self._esc:
+                self._esc = False
+            elif ch == "\\":
+                self._esc = True
+            elif ch == '"':
+                self._in_str = False
+                if self._state == "key_str":
+                    self._key   = json.loads(self.buf[self._key_start:self._pos + 1])
+                    self._state = "colon"
+            return
+
+        top = self._depth == 1
+        if ch == '"':
+            self._in_str = True
+            if top and self._state == "key":
+                self._key_start, self._state = self._pos, "key_str"
+            elif top and self._state == "value":
+                self._val_start, self._state = self._pos, "in_value"
+        elif ch in "{[":
+            if top and self._state == "value":
+                self._val_start, self._state = self._pos, "in_value"
+            self._depth += 1
+        elif ch in "}]":
+            if top:
+                self._commit()
+                self.done = True
+            self._depth -= 1
+        elif top and ch == ":" and self._state == "colon":
+            self._state = "value"
+        elif top and ch == ",":
+            self._commit()
+            self._state = "key"
+        elif top and self._state == "value" and not ch.isspace():
+            self._val_start, self._state = self._pos, "in_value"
+
+    def _commit(self) -> None:
+        if self._key is not None and self._val_start is not None:
+            try:
+                self.fields[self._key] = json.loads(self.buf[self._val_start:self._pos].strip())
+            except ValueError:
+                pass
+        self._key, self._val_start = None, None
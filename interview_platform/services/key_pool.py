@@ -0,0 +1,164 @@
+"""
+services/key_pool.py
+─────────────────────────────────────────────────────────────
+A pool of API keys, each with its own quota budget and health.
+
+A single key's per-minute quota is the hard ceiling on how many
+interviews one deployment can run at once. GEMINI_API_KEYS lists
+several keys, optionally with their own budget ("key:rpm", default
+settings.rate_limit_rpm), and every model call leases one:
+
+  lease()  — the healthy key with the least load: its token-bucket
+             backlog plus its calls in flight, in seconds of its own
+             budget. If every key is cooling down, the one that
+             recovers first.
+             A quota error cools the key down for quota_backoff_s,
+             doubling on consecutive 429s up to key_cooldown_max_s,
+             and pushes its governor bucket back by the same amount;
+             a successful call clears the strikes.
+
+Each key's budget is its CallGovernor bucket (rate_limiter.py): the
+pool decides *which* key, the governor still does the waiting. Health
+is process-wide per key, like the governor. A key typed on the landing
+page that is not part of the deployment pool is used on its own.
+metrics() reports per-key load and health (keys shown by their tail).
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..config import settings
+from .rate_limiter import governor, is_quota_error
+
+KeySpec = Tuple[str, Optional[float]]       # (key, rpm or None for the default)
+
+
+def parse_keys(spec: Optional[str]) -> List[KeySpec]:
+    """
+    "k1, k2:30" → [("k1", None), ("k2", 30.0)] — blanks and repeats dropped.
+    A per-key rate that is not a positive number is logged and ignored
+    (the key keeps the default rpm).
+    """
+    out, seen = [], set()
+    for entry in (spec or "").split(","):
+        key, _, rpm = entry.strip().partition(":")
+        key = key.strip()
+        if key and key not in seen:
+            seen.add(key)
+            out.append((key, _rpm(key, rpm.strip())))
+    return out
+
+
+def _rpm(key: str, text: str) -> Optional[float]:
+    if not text:
+        return None
+    try:
+        rpm = float(text)
+    except ValueError:
+        rpm = 0.0
+    if not rpm > 0 or rpm == float("inf"):
+        print(f"[KeyPool] key …{key[-4:]}: bad rate {text!r} — using the default rpm")
+        return None
+    return rpm
+
+
+def resolve_keys(api_key: Optional[str] = None) -> List[KeySpec]:
+    """The keys an AIService for api_key should draw from."""
+    deployment = parse_keys(settings.gemini_api_keys) or parse_keys(settings.gemini_api_key)
+    own = parse_keys(api_key)
+    if own and not {k for k, _ in own} <= {k for k, _ in deployment}:
+        return own
+    return deployment or [("", None)]
+
+
+class _KeyState:
+
+    def __init__(self, key: str, rpm: float):
+        self.key          = key
+        self.rpm          = rpm
+        self.in_flight    = 0
+        self.cool_until   = 0.0
+        self.strikes      = 0
+        self.calls        = 0
+        self.quota_errors = 0
+
+    def load(self) -> float:
+        return governor.backlog(self.key) + self.in_flight * 60.0 / max(self.rpm, 1e-9)
+
+
+_STATES: Dict[str, _KeyState] = {}
+_LOCK = threading.Lock()
+
+
+class KeyPool:
+
+    def __init__(self, keys: Sequence[KeySpec]):
+        if not keys:
+            raise ValueError("KeyPool needs at least one key")
+        self._states: List[_KeyState] = []
+        with _LOCK:
+            for key, rpm in keys:
+                st = _STATES.get(key)
+                if st is None:
+                    st = _STATES[key] = _KeyState(key, rpm or settings.rate_limit_rpm)
+                    if rpm:
+                        governor.configure_key(key, rpm)
+                self._states.append(st)
+
+    @property
+    def keys(self) -> List[str]:
+        return [st.key for st in self._states]
+
+    @contextmanager
+    def lease(self) -> Iterator[str]:
+        """Pick a key for one call and track it in flight; yields the key."""
+        st = self._pick()
+        try:
+            yield st.key
+        except Exception as exc:
+            if is_quota_error(exc):
+                self._cool_down(st)
+            raise
+        else:
+            with _LOCK:
+                st.strikes = 0
+        finally:
+            with _LOCK:
+                st.in_flight -= 1
+
+    def metrics(self) -> List[dict]:
+        now = time.monotonic()
+        with _LOCK:
+            return [{
+                "key":          "…" + st.key[-4:] if st.key else "(none)",
+                "rpm":          st.rpm,
+                "in_flight":    st.in_flight,
+                "backlog_s":    round(governor.backlog(st.key), 3),
+                "cooling_s":    round(max(0.0, st.cool_until - now), 1),
+                "calls":        st.calls,
+                "quota_errors": st.quota_errors,
+            } for st in self._states]
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _pick(self) -> _KeyState:
+        now = time.monotonic()
+        with _LOCK:
+            healthy = [st for st in self._states if st.cool_until <= now]
+            st = (min(healthy, key=_KeyState.load) if healthy
+                  else min(self._states, key=lambda s: s.cool_until))
+            st.in_flight += 1
+            st.calls     += 1
+            return st
+
+    def _cool_down(self, st: _KeyState) -> None:
+        with _LOCK:
+            st.strikes      += 1
+            st.quota_errors += 1
+            seconds = min(settings.quota_backoff_s * 2 ** (st.strikes - 1),
+                          settings.key_cooldown_max_s)
+            st.cool_until = max(st.cool_until, time.monotonic() + seconds)
+        governor.penalize(st.key, seconds)
@@ -0,0 +1,366 @@
+"""
+services/model_router.py
+─────────────────────────────────────────────────────────────
+Latency-aware routing between a primary and a fallback model.
+
+Per model the router keeps a rolling window of call latencies and
+outcomes (p50 / p95 / error rate) plus a circuit breaker.
+
+call(primary, fallback):
+  • breaker open on primary  → go straight to the fallback
+  • primary answers in time  → use it
+  • primary fails / unusable → fallback immediately (no blind sleep)
+  • primary exceeds its hedge delay → fire a hedged request at the
+    fallback and take whichever usable response lands first
+  • fallback's breaker open too → no call to it: the default, or the
+    primary's own answer when it is already running
+
+A breaker past its cooldown lets exactly one probe call through; the
+rest are refused until that probe's outcome closes or reopens it.
+
+Hedge delay = p95 of the primary clamped to
+[route_hedge_min_s, route_latency_budget_s]; until enough samples
+exist the full budget is used.
+
+An optional deadline (time.monotonic() value) bounds the whole call:
+no retry or fallback is started after it, and waits stop at it with
+the default returned.
+
+acall() is the same policy for coroutines (AsyncAIService): attempts
+are zero-arg coroutine functions run as tasks on the caller's loop,
+sharing the latency windows and breakers with call().
+─────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ..config import settings
+
+Attempt = Tuple[str, Callable[[], Any]]     # (model name, zero-arg call)
+AsyncAttempt = Tuple[str, Callable[[], Awaitable[Any]]]
+
+_MIN_SAMPLES = 10
+
+# Admission tokens — CircuitBreaker.allow() hands one out, and the call
+# returns it to record() so only the probe itself ends the probe
+CALL, PROBE = "call", "probe"
+
+
+class ModelStats:
+
+    def __init__(self, window: int):
+        self._lat  = deque(maxlen=window)
+        self._ok   = deque(maxlen=window)
+        self.calls = 0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self._lat.append(latency)
+        self._ok.append(ok)
+        self.calls += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._lat:
+            return None
+        xs = sorted(self._lat)
+        return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+    @property
+    def samples(self) -> int:
+        return len(self._lat)
+
+    @property
+    def error_rate(self) -> float:
+        return (1 - sum(self._ok) / len(self._ok)) if self._ok else 0.0
+
+
+class CircuitBreaker:
+    """closed → (N consecutive failures) → open → (cooldown) → half-open probe."""
+
+    def __init__(self, failures: int, cooldown_s: float):
+        self.failures    = failures
+        self.cooldown_s  = cooldown_s
+        self.consecutive = 0
+        self.opened_at: Optional[float] = None
+        self.probing     = False        # the half-open probe is out
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown_s else "open"
+
+    def allow(self) -> Optional[str]:
+        """
+        May a call go out now? CALL when closed, PROBE once when half-open,
+        None otherwise. (Caller holds the lock.)
+        """
+        state = self.state
+        if state == "closed":
+            return CALL
+        if state == "half-open" and not self.probing:
+            self.probing = True
+            return PROBE
+        return None
+
+    def record(self, ok: bool, token: str = CALL) -> None:
+        # A call admitted before the breaker opened may finish while the
+        # probe is out — it must not free the probe slot
+        probe = token == PROBE
+        if probe:
+            self.probing = False
+        if ok:
+            self.consecutive, self.opened_at = 0, None
+            return
+        self.consecutive += 1
+        if self.consecutive >= self.failures or probe:
+            self.opened_at = time.monotonic()
+
+
+class ModelRouter:
+
+    def __init__(self):
+        self._lock     = threading.RLock()
+        self._stats:    Dict[str, ModelStats]     = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters = {"hedged": 0, "fallback_used": 0, "fallback_won": 0,
+                          "fallback_blocked": 0}
+        self._pool     = ThreadPoolExecutor(max_workers=settings.route_max_workers,
+                                            thread_name_prefix="aiip-route")
+        self._tasks: Set[asyncio.Task] = set()     # abandoned attempts still finishing
+
+    # ── Public ────────────────────────────────────────────────────
+
+    def call(self, primary: Attempt, fallback: Optional[Attempt] = None,
+             default: Any = None, accept: Callable[[Any], bool] = bool,
+             deadline: Optional[float] = None) -> Any:
+        if fallback and fallback[0] == primary[0]:
+            fallback = None
+        left = (lambda: None) if deadline is None else \
+               (lambda: max(0.0, deadline - time.monotonic()))
+
+        if fallback is None:
+            # Nowhere to route — one quick jittered retry on the same model
+            for attempt in range(2):
+                ok, value = self._run(primary, accept)
+                if ok:
+                    return value
+                pause = random.uniform(0.2, 0.8)
+                if attempt == 0 and (deadline is None or left() > pause):
+                    time.sleep(pause)
+                else:
+                    break
+            return default
+
+        token = self._admit(primary[0])
+        if token is None:
+            return self._fall_back(fallback, accept, default)
+
+        first = self._pool.submit(self._run, primary, accept, token)
+        delay = self.hedge_delay(primary[0])
+        done, _ = wait([first], timeout=delay if deadline is None else min(delay, left()))
+        if done:
+            ok, value = first.result()
+            if ok or deadline is not None and not left():
+                return value if ok else default
+            return self._fall_back(fallback, accept, default)
+
+        if deadline is not None and not left():
+            return default
+
+        token = self._admit(fallback[0])
+        if token is None:
+            # Nothing to hedge to — wait the primary out
+            self._bump("fallback_blocked")
+            done, _ = wait([first], timeout=left())
+            ok, value = first.result() if done else (False, None)
+            return value if ok else default
+
+        # Primary is slow — hedge and take whichever usable answer lands first
+        self._bump("hedged")
+        second  = self._pool.submit(self._run, fallback, accept, token)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, timeout=left(), return_when=FIRST_COMPLETED)
+            if not done:
+                return default          # deadline reached — abandon both
+            for fut in done:
+                ok, value = fut.result()
+                if ok:
+                    if fut is second:
+                        self._bump("fallback_won")
+                    return value
+        return default
+
+    async def acall(self, primary: AsyncAttempt, fallback: Optional[AsyncAttempt] = None,
+                    default: Any = None, accept: Callable[[Any], bool] = bool,
+                    deadline: Optional[float] = None) -> Any:
+        if fallback and fallback[0] == primary[0]:
+            fallback = None
+        left = (lambda: None) if deadline is None else \
+               (lambda: max(0.0, deadline - time.monotonic()))
+
+        if fallback is None:
+            for attempt in range(2):
+                ok, value = await self._arun(primary, accept)
+                if ok:
+                    return value
+                pause = random.uniform(0.2, 0.8)
+                if attempt == 0 and (deadline is None or left() > pause):
+                    await asyncio.sleep(pause)
+                else:
+                    break
+            return default
+
+        token = self._admit(primary[0])
+        if token is None:
+            return await self._afall_back(fallback, accept, default)
+
+        first = self._spawn(self._arun(primary, accept, token))
+        delay = self.hedge_delay(primary[0])
+        done, _ = await asyncio.wait([first], timeout=delay if deadline is None else min(delay, left()))
+        if done:
+            ok, value = first.result()
+            if ok or deadline is not None and not left():
+                return value if ok else default
+            return await self._afall_back(fallback, accept, default)
+
+        if deadline is not None and not left():
+            return default
+
+        token = self._admit(fallback[0])
+        if token is None:
+            self._bump("fallback_blocked")
+            done, _ = await asyncio.wait([first], timeout=left())
+            ok, value = first.result() if done else (False, None)
+            return value if ok else default
+
+        self._bump("hedged")
+        second  = self._spawn(self._arun(fallback, accept, token))
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=left(),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                return default
+            for task in done:
+                ok, value = task.result()
+                if ok:
+                    if task is second:
+                        self._bump("fallback_won")
+                    return value
+        return default
+
+    def hedge_delay(self, model: str) -> float:
+        budget = settings.route_latency_budget_s
+        with self._lock:
+            st = self._stats_for(model)
+            if st.samples < _MIN_SAMPLES:
+                return budget
+            return max(settings.route_hedge_min_s, min(budget, st.percentile(0.95)))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "models": {
+                    name: {
+                        "calls":      st.calls,
+                        "p50_s":      st.percentile(0.50),
+                        "p95_s":      st.percentile(0.95),
+                        "error_rate": round(st.error_rate, 3),
+                        "breaker":    self._breakers[name].state,
+                    }
+                    for name, st in self._stats.items()
+                },
+                **self._counters,
+            }
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _admit(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._breaker(name).allow()
+
+    def _fall_back(self, fallback: Attempt, accept: Callable[[Any], bool], default: Any) -> Any:
+        token = self._admit(fallback[0])
+        if token is None:
+            self._bump("fallback_blocked")
+            return default
+        self._bump("fallback_used")
+        ok, value = self._run(fallback, accept, token)
+        return value if ok else default
+
+    async def _afall_back(self, fallback: AsyncAttempt, accept: Callable[[Any], bool],
+                          default: Any) -> Any:
+        token = self._admit(fallback[0])
+        if token is None:
+            self._bump("fallback_blocked")
+            return default
+        self._bump("fallback_used")
+        ok, value = await self._arun(fallback, accept, token)
+        return value if ok else default
+
+    def _run(self, attempt: Attempt, accept: Callable[[Any], bool],
+             token: str = CALL) -> Tuple[bool, Any]:
+        name, fn = attempt
+        t0 = time.monotonic()
+        try:
+            value = fn()
+            ok = bool(accept(value))
+        except Exception as exc:
+            print(f"[ModelRouter] {name} error: {exc}")
+            value, ok = None, False
+        latency = time.monotonic() - t0
+        with self._lock:
+            self._stats_for(name).record(latency, ok)
+            self._breaker(name).record(ok, token)
+        return ok, value
+
+    async def _arun(self, attempt: AsyncAttempt, accept: Callable[[Any], bool],
+                    token: str = CALL) -> Tuple[bool, Any]:
+        name, fn = attempt
+        t0 = time.monotonic()
+        try:
+            value = await fn()
+            ok = bool(accept(value))
+        except Exception as exc:
+            print(f"[ModelRouter] {name} error: {exc}")
+            value, ok = None, False
+        latency = time.monotonic() - t0
+        with self._lock:
+            self._stats_for(name).record(latency, ok)
+            self._breaker(name).record(ok, token)
+        return ok, value
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """A task that may be abandoned, like a pool thread — kept until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _stats_for(self, name: str) -> ModelStats:
+        with self._lock:
+            st = self._stats.get(name)
+            if st is None:
+                st = self._stats[name] = ModelStats(settings.route_window)
+                self._breakers[name] = CircuitBreaker(settings.route_breaker_failures,
+                                                      settings.route_breaker_cooldown_s)
+            return st
+
+    def _breaker(self, name: str) -> CircuitBreaker:
+        self._stats_for(name)
+        return self._breakers[name]
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+
+# Process-wide router — latency history is shared by every session
+router = ModelRouter()
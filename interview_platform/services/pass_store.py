@@ -0,0 +1,104 @@
+"""
+services/pass_store.py
+─────────────────────────────────────────────────────────────
+Intermediate results of the three-pass evaluation, so a failed one
+resumes instead of starting over.
+
+Pass 1 (extraction) and Pass 2 (comparison) are stored in the
+`eval_pass_results` table as each returns, under an attempt ID — a hash
+of (prompt version, model, question, normalised answer, skill,
+difficulty), the same inputs that make the passes deterministic. When
+Pass 3 fails or the deadline runs out, a re-submission of the same
+answer, a job-queue retry or a rescore run picks up after the last
+stored pass. Rows are deleted once the scorecard is complete (the
+evaluation cache takes over from there); leftovers expire after
+eval_pass_ttl_hours.
+─────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from ..config import settings
+from .eval_cache import normalise_answer
+
+
+class PassStore:
+
+    def __init__(self, version: str, session_factory=None,
+                 ttl_hours: Optional[float] = None):
+        self.version  = version
+        self.ttl      = timedelta(hours=ttl_hours or settings.eval_pass_ttl_hours)
+        self._factory = session_factory
+
+    def attempt_id(self, question: str, answer: str, skill: str,
+                   difficulty: str, model: str) -> str:
+        payload = json.dumps(
+            [self.version, model, question.strip(), normalise_answer(answer), skill, difficulty],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ── Read / write ──────────────────────────────────────────────
+
+    def load(self, attempt_id: str) -> Dict[str, dict]:
+        """Stored passes of this attempt, pass name → result ({} if none)."""
+        from ..database.models import EvalPassResult
+        db = self._session()
+        try:
+            rows = db.query(EvalPassResult).filter(
+                EvalPassResult.attempt_id == attempt_id,
+                EvalPassResult.prompt_version == self.version,
+                EvalPassResult.created_at >= datetime.utcnow() - self.ttl,
+            ).all()
+            return {r.pass_name: dict(r.result_json or {}) for r in rows if r.result_json}
+        except Exception as exc:
+            print(f"[PassStore] lookup failed: {exc}")
+            return {}
+        finally:
+            db.close()
+
+    def save(self, attempt_id: str, pass_name: str, result: dict) -> None:
+        from ..database.models import EvalPassResult
+        db = self._session()
+        try:
+            db.merge(EvalPassResult(
+                attempt_id     = attempt_id,
+                pass_name      = pass_name,
+                prompt_version = self.version,
+                result_json    = result,
+                created_at     = datetime.utcnow(),
+            ))
+            db.commit()
+        except Exception as exc:
+            print(f"[PassStore] store failed: {exc}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def clear(self, attempt_id: str) -> None:
+        """The evaluation finished — drop its passes, and any expired rows."""
+        from ..database.models import EvalPassResult
+        db = self._session()
+        try:
+            q = db.query(EvalPassResult)
+            q.filter(EvalPassResult.attempt_id == attempt_id).delete(synchronize_session=False)
+            q.filter(EvalPassResult.created_at < datetime.utcnow() - self.ttl) \
+             .delete(synchronize_session=False)
+            db.commit()
+        except Exception as exc:
+            print(f"[PassStore] clear failed: {exc}")
+            db.rollback()
+        finally:
+            db.close()
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _session(self):
+        if self._factory is None:
+            from ..database.base import SessionLocal, init_db
+            init_db()
+            self._factory = SessionLocal
+        return self._factory()
@@ -0,0 +1,70 @@
+"""
+services/prompt_cache.py
+─────────────────────────────────────────────────────────────
+Prefix accounting for the stable prompt layout.
+
+Each Prompt (prompts.py) is prefix + body: the prefix byte-identical
+for every call of its kind and always sent first, the per-call body
+last. That layout is what lets a provider that caches repeated prompt
+prefixes on its own (Gemini 2.x implicit caching) serve the prefix
+from cache; nothing here asks for it.
+
+Explicit CachedContent uploads are not used: every prefix is a few
+hundred to ~1000 tokens, far below the provider's minimum for cached
+content, so an upload would always be refused.
+
+metrics() counts calls and the prefix tokens they carried — estimated
+(~4 chars / token), never counted by the model, so the request path
+makes no extra call — and, where a reply carries usage_metadata, the
+input tokens the provider reports it served from its cache.
+─────────────────────────────────────────────────────────────
+"""
+
+import threading
+from typing import Optional
+
+
+class PrefixStats:
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._stats = {"calls": 0, "prefix_tokens_sent": 0,
+                       "usage_reported": 0, "input_tokens": 0, "cached_tokens": 0}
+
+    def record(self, prompt, resp=None) -> None:
+        """Count one call of this prompt; resp is the reply (or last stream chunk), if any."""
+        usage = _usage(resp)
+        with self._lock:
+            self._stats["calls"]              += 1
+            self._stats["prefix_tokens_sent"] += _estimate(prompt.prefix)
+            if usage is not None:
+                self._stats["usage_reported"] += 1
+                self._stats["input_tokens"]   += usage[0]
+                self._stats["cached_tokens"]  += usage[1]
+
+    def metrics(self) -> dict:
+        with self._lock:
+            s = dict(self._stats)
+        s["cached_share"] = round(s["cached_tokens"] / s["input_tokens"], 3) \
+            if s["input_tokens"] else 0.0
+        return s
+
+
+def _usage(resp) -> Optional[tuple]:
+    """(prompt tokens, of which served from cache) from a Gemini reply, else None."""
+    usage = getattr(resp, "usage_metadata", None)
+    if usage is None:
+        return None
+    try:
+        return (int(getattr(usage, "prompt_token_count", 0) or 0),
+                int(getattr(usage, "cached_content_token_count", 0) or 0))
+    except (TypeError, ValueError):
+        return None
+
+
+def _estimate(text: str) -> int:
+    return max(1, len(text) // 4)                    # ~4 chars / token
+
+
+# Process-wide instance — shared by every session
+prompt_cache = PrefixStats()
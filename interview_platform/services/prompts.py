@@ -0,0 +1,315 @@
+"""
+services/prompts.py
+─────────────────────────────────────────────────────────────
+Every prompt the platform sends, split into two parts:
+
+  prefix — static instructions, rubric, rules and output schema.
+           Byte-identical for every call of that kind and sent first,
+           so a provider's implicit prefix cache can serve it
+           (prompt_cache.py).
+  body   — the per-call variables (question, answer, …), always last.
+
+Changing any text here changes PROMPT_VERSION, which invalidates the
+evaluation cache.
+─────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+from typing import List, NamedTuple
+
+
+class Prompt(NamedTuple):
+    name:   str
+    prefix: str
+    body:   str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.body
+
+
+class PromptTemplate(NamedTuple):
+    name:   str
+    prefix: str     # sent verbatim
+    body:   str     # str.format fields
+
+    def render(self, **fields) -> Prompt:
+        return Prompt(self.name, self.prefix, self.body.format(**fields))
+
+
+# ── Scoring rubric anchors (same for every call) ──────────────────
+RUBRIC = """
+SCORING RUBRIC — apply these criteria strictly:
+
+OVERALL / CONCEPT SCORE:
+  9-10: Precise definition + correct math/derivation + production example + trade-offs discussed
+  7-8:  Correct concepts + good depth + minor gaps in math or examples
+  5-6:  Mostly correct but missing depth, equations, or real examples
+  3-4:  Partially correct, notable conceptual errors, or surface-level only
+  1-2:  Mostly wrong, buzzwords without substance, or off-topic
+  0:    No answer, single word, or complete nonsense
+
+CLARITY SCORE:
+  9-10: Perfect structure (define→explain→example→trade-off), precise language, no ambiguity
+  7-8:  Clear and well-organised with minor structure issues
+  5-6:  Understandable but rambling or lacks clear flow
+  3-4:  Hard to follow, jumps around, or contradicts itself
+  1-2:  Very unclear or incoherent
+  0:    Cannot be evaluated
+
+CONFIDENCE SCORE:
+  9-10: Decisive statements, uses technical vocabulary correctly, no unjustified hedging
+  7-8:  Mostly confident with occasional unnecessary qualification
+  5-6:  Mix of confident and uncertain statements
+  3-4:  Frequent hedging without justification ("I think maybe…")
+  1-2:  Highly uncertain or apologetic throughout
+  0:    Cannot be evaluated
+
+IMPORTANT: Do NOT round up. A 5 means average. A 7 means genuinely good.
+A 9 or 10 should be rare — only for truly exceptional answers.
+"""
+
+_SCORING_RULES = """
+SCORING ADJUSTMENT RULES:
+- difficulty=hard → be 1 point stricter (harder to earn high scores)
+- Missing all key concepts from ideal → concept_score max 4
+- No math when math is expected → concept_score max 6
+- No real example → clarity_score capped at 7
+- Has wrong statements → subtract 1-2 points from concept_score
+- Short answer (1-2 sentences) → overall max 4
+
+FOLLOW-UP LOGIC:
+  overall < 4  → ask for clarification on the weakest concept they mentioned
+  4-6          → ask them to give a concrete production example
+  7-8          → push deeper with math or edge case
+  9-10         → challenge with an adversarial scenario
+  wrong answer → null (correct it in ideal_answer instead)
+
+Return EXACTLY this JSON:
+{
+  "overall_score":      <0.0-10.0, one decimal>,
+  "concept_score":      <0.0-10.0, one decimal>,
+  "clarity_score":      <0.0-10.0, one decimal>,
+  "confidence_score":   <0.0-10.0, one decimal>,
+  "strengths":          "Specific things done well (2-3 sentences)",
+  "weaknesses":         "Specific gaps or errors (2-3 sentences, be direct)",
+  "improvement_tips":   "3 concrete actionable steps to improve",
+  "weak_skills":        ["specific sub-skill 1", "specific sub-skill 2"],
+  "ideal_answer":       "Complete 3-5 sentence expert answer to this question",
+  "follow_up_question": "Specific follow-up question or null",
+  "reasoning":          "1 sentence explaining your overall score"
+}
+"""
+
+_INPUT = "\n──────── INPUT ────────\n"
+
+
+STRATEGY = PromptTemplate("strategy", prefix="""
+You are a principal ML interview architect at a top tech company.
+Analyse the candidate profile given under INPUT and build a targeted interview strategy.
+Return ONLY valid JSON — no markdown, no explanation.
+
+CALIBRATION RULES:
+  FAANG / Big Tech → hard difficulty, deep theory, math derivations required
+  Startup          → medium, applied ML, system design, MLOps
+  Research Lab     → hard, optimisation theory, paper-level depth
+  Finance / Quant  → hard, statistics, probability, risk
+  Student/Fresher  → easy-medium, strong fundamentals, conceptual clarity
+  1-2 Years        → medium, applied knowledge, some depth
+  3-5 Years        → hard, design decisions, production experience
+  5+ Years         → hard, architecture, leadership, edge cases
+
+RULES:
+- Prioritise self-reported weak areas as focus skills
+- Pick exactly 4 focus skills, from AVAILABLE SKILLS, most relevant to their target role
+- interview_style must match the company type
+- style_reason must be 1 specific, actionable sentence
+
+Return EXACTLY:
+{
+  "focus_skills":    ["s1","s2","s3","s4"],
+  "difficulty":      "easy|medium|hard",
+  "interview_style": "conceptual|research|applied|system-design",
+  "probing_enabled": true,
+  "style_reason":    "One specific sentence explaining this strategy."
+}
+""" + _INPUT, body="""
+CANDIDATE:
+  Role target:    {role}
+  Company type:   {company_type}
+  Experience:     {experience}
+  Self-reported weak areas: {weak_areas}
+  Career goal:    {career_goal}
+
+AVAILABLE SKILLS: {skills}
+""")
+
+PASS1 = PromptTemplate("pass1_extract", prefix="""
+You are extracting factual claims from a candidate's interview answer.
+Be objective. Do not evaluate quality yet — just extract.
+
+List every distinct technical claim, definition, formula, or example the candidate mentioned.
+Be precise and literal. If they said something wrong, still list it.
+
+Return JSON:
+{
+  "claimed_facts": ["fact1", "fact2", ...],
+  "mentioned_equations": ["eq1", ...],
+  "mentioned_examples": ["ex1", ...],
+  "answer_length": "short|medium|long",
+  "has_structure": true|false
+}
+""" + _INPUT, body="""
+QUESTION: {question}
+SKILL: {skill}
+CANDIDATE ANSWER: "{answer}"
+""")
+
+PASS2 = PromptTemplate("pass2_compare", prefix="""
+You are a senior ML expert comparing a candidate's answer to the ideal answer.
+Analyse the gap between candidate and ideal.
+
+Return JSON:
+{
+  "correct_points":   ["things they got right"],
+  "missing_concepts": ["important concepts they omitted"],
+  "wrong_statements": ["factual errors if any"],
+  "depth_assessment": "surface|basic|intermediate|deep|expert",
+  "has_math":         true|false,
+  "has_real_example": true|false,
+  "covers_tradeoffs": true|false
+}
+""" + _INPUT, body="""
+QUESTION: {question}
+SKILL: {skill}
+DIFFICULTY: {difficulty}
+
+IDEAL ANSWER (expert level):
+{ideal}
+
+WHAT CANDIDATE CLAIMED:
+{extracted}
+
+FULL CANDIDATE ANSWER: "{answer}"
+""")
+
+PASS3 = PromptTemplate("pass3_score", prefix="""
+You are a strict senior ML interviewer. Score the answer under INPUT using the rubric below.
+Return ONLY valid JSON.
+""" + RUBRIC + _SCORING_RULES + _INPUT, body="""
+CONTEXT:
+  Question:   {question}
+  Skill:      {skill}
+  Difficulty: {difficulty}
+
+IDEAL ANSWER:
+{ideal}
+
+EVALUATION SUMMARY:
+  Correct points:   {correct_points}
+  Missing concepts: {missing_concepts}
+  Wrong statements: {wrong_statements}
+  Depth:            {depth_assessment}
+  Has math:         {has_math}
+  Has real example: {has_real_example}
+  Covers tradeoffs: {covers_tradeoffs}
+
+FULL CANDIDATE ANSWER: "{answer}"
+""")
+
+FUSED = PromptTemplate("fused", prefix="""
+You are a strict senior ML interviewer. Evaluate the answer under INPUT in ONE pass.
+Work through three steps internally, then return ONLY valid JSON.
+
+  Step 1 — Extraction: list to yourself every technical claim, equation and
+           example the candidate ACTUALLY stated (substance, not style).
+  Step 2 — Comparison: check those claims against the ideal answer — what is
+           correct, what key concepts are missing, what is factually wrong.
+  Step 3 — Scoring: apply the rubric and adjustment rules below.
+""" + RUBRIC + _SCORING_RULES + _INPUT, body="""
+CONTEXT:
+  Question:   {question}
+  Skill:      {skill}
+  Difficulty: {difficulty}
+
+IDEAL ANSWER:
+{ideal}
+
+FULL CANDIDATE ANSWER: "{answer}"
+""")
+
+IDEAL = PromptTemplate("ideal", prefix="""
+You are a principal ML engineer at a top company.
+Write a complete, expert-level answer to the interview question under INPUT.
+
+Requirements:
+- Start with a precise definition
+- Include the key equation or mathematical formulation if relevant
+- Give a concrete real-world example
+- Mention at least one trade-off or limitation
+- 3-5 sentences maximum, dense and precise
+
+Write ONLY the answer, no labels, no JSON.
+""" + _INPUT, body="""
+Question: "{question}"
+Skill area: {skill}
+""")
+
+# ── Batched variants (services/batcher.py) ────────────────────────
+# Many candidates' independent items in one request; same instructions
+# as the single-item template, plus the batch envelope.
+
+_BATCH = """
+BATCH MODE: INPUT holds several numbered items (### ITEM n), each a
+separate candidate. Treat every item independently, exactly as if it
+had been sent alone — never let one item influence another.
+Return ONLY:
+{"items": [{"id": n, ...the JSON object described above for item n...}, ...]}
+with exactly one entry per item and ids matching the ITEM numbers.
+"""
+
+
+class BatchTemplate(NamedTuple):
+    name:   str
+    prefix: str
+    item:   PromptTemplate
+
+    def render(self, items: List[dict]) -> Prompt:
+        body = f"\nITEMS: {len(items)}\n" + "".join(
+            f"\n### ITEM {i}\n" + self.item.body.format(**fields)
+            for i, fields in enumerate(items, start=1)
+        )
+        return Prompt(self.name, self.prefix, body)
+
+
+def _batched(name: str, template: PromptTemplate) -> BatchTemplate:
+    return BatchTemplate(name, template.prefix[:-len(_INPUT)] + _BATCH + _INPUT, template)
+
+
+PASS1_BATCH = _batched("pass1_batch", PASS1)
+PASS2_BATCH = _batched("pass2_batch", PASS2)
+
+# Appended to the original body when a reply hit max_output_tokens
+CONTINUATION = """
+
+──────── CONTINUE ────────
+Your previous reply was cut off at the output limit. It ended with:
+<<<{partial}>>>
+Continue from the exact next character. Output ONLY the missing remainder —
+do not repeat anything already written, no markdown fences.
+"""
+
+
+def continuation(prompt: Prompt, partial: str) -> Prompt:
+    """Cheap follow-up request for a truncated reply (keeps the cached prefix)."""
+    return Prompt(prompt.name + "_cont", prompt.prefix,
+                  prompt.body + CONTINUATION.format(partial=partial[-1500:]))
+
+
+TEMPLATES = (STRATEGY, PASS1, PASS2, PASS3, FUSED, IDEAL)
+BATCH_TEMPLATES = (PASS1_BATCH, PASS2_BATCH)
+
+PROMPT_VERSION = hashlib.sha256(
+    "\x00".join([t.prefix + "\x01" + t.body for t in TEMPLATES]
+                 + [t.prefix for t in BATCH_TEMPLATES] + [CONTINUATION]).encode()
+).hexdigest()[:16]
@@ -0,0 +1,214 @@
+"""
+services/rate_limiter.py
+─────────────────────────────────────────────────────────────
+Process-wide client-side rate limiting for model calls.
+
+  TokenBucket    — per-API-key request rate (rpm + burst). Callers
+                   reserve the next free slot in arrival order, so
+                   waiting is FIFO across all sessions sharing a key.
+  FifoSemaphore  — bounded number of calls in flight, granted strictly
+                   in arrival order — to threads (acquire) and asyncio
+                   tasks (acquire_async) from the same permits.
+  CallGovernor   — both of the above around every model call, plus a
+                   quota penalty: a 429 / ResourceExhausted pushes the
+                   key's bucket back by quota_backoff_s so the next
+                   callers wait instead of hammering the quota.
+                   slot() blocks the calling thread; aslot() is the
+                   same gate for coroutines and only awaits.
+
+governor.metrics() reports queue depth, in-flight count and wait times.
+─────────────────────────────────────────────────────────────
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from ..config import settings
+
+
+class TokenBucket:
+
+    def __init__(self, rpm: float, burst: int):
+        self.interval  = 60.0 / max(rpm, 1e-9)
+        self.burst     = max(1, burst)
+        self._next     = time.monotonic() - self.burst * self.interval
+        self._lock     = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next slot; returns how long the caller must wait for it."""
+        with self._lock:
+            now  = time.monotonic()
+            # Unused capacity accrues up to `burst` slots, never more
+            slot = max(self._next, now - (self.burst - 1) * self.interval)
+            self._next = slot + self.interval
+            return max(0.0, slot - now)
+
+    def penalize(self, seconds: float) -> None:
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+    def backlog(self) -> float:
+        """How long a caller reserving now would wait (without reserving)."""
+        with self._lock:
+            return max(0.0, self._next - time.monotonic())
+
+
+class FifoSemaphore:
+
+    def __init__(self, permits: int):
+        self._permits = permits
+        self._waiters = deque()
+        self._lock    = threading.Lock()
+        self.in_flight = 0
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._permits > 0 and not self._waiters:
+                self._permits -= 1
+                self.in_flight += 1
+                return
+            ev = threading.Event()
+            self._waiters.append(ev.set)
+        ev.wait()                       # permit handed over by release()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._permits > 0 and not self._waiters:
+                self._permits -= 1
+                self.in_flight += 1
+                return
+            fut  = loop.create_future()
+            wake = lambda: loop.call_soon_threadsafe(_resolve, fut)
+            self._waiters.append(wake)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                handed = wake not in self._waiters
+                if not handed:
+                    self._waiters.remove(wake)
+            if handed:
+                self.release()          # the permit arrived as we were cancelled
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft()()
+            else:
+                self._permits += 1
+                self.in_flight -= 1
+
+
+class CallGovernor:
+
+    def __init__(self, max_in_flight: int, rpm: float, burst: int):
+        self.default_rpm   = rpm
+        self.default_burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._sem     = FifoSemaphore(max_in_flight)
+        self._lock    = threading.Lock()
+        self._waits   = deque(maxlen=500)
+        self._queued  = 0
+        self._calls   = 0
+        self._quota_errors = 0
+
+    def configure_key(self, api_key: str, rpm: float, burst: Optional[int] = None) -> None:
+        with self._lock:
+            self._buckets[api_key or ""] = TokenBucket(rpm, burst or self.default_burst)
+
+    @contextmanager
+    def slot(self, api_key: Optional[str]):
+        """Wait for a rate-limit slot and an in-flight permit, then run the call."""
+        t0 = time.monotonic()
+        with self._lock:
+            self._queued += 1
+        try:
+            delay = self._bucket(api_key).reserve()
+            if delay:
+                time.sleep(delay)
+            self._sem.acquire()
+        finally:
+            with self._lock:
+                self._queued -= 1
+                self._calls  += 1
+                self._waits.append(time.monotonic() - t0)
+        try:
+            yield
+        finally:
+            self._sem.release()
+
+    @asynccontextmanager
+    async def aslot(self, api_key: Optional[str]):
+        """slot() for coroutines: the waits are awaited, not slept."""
+        t0 = time.monotonic()
+        with self._lock:
+            self._queued += 1
+        try:
+            delay = self._bucket(api_key).reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            await self._sem.acquire_async()
+        finally:
+            with self._lock:
+                self._queued -= 1
+                self._calls  += 1
+                self._waits.append(time.monotonic() - t0)
+        try:
+            yield
+        finally:
+            self._sem.release()
+
+    def penalize(self, api_key: Optional[str], seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self._quota_errors += 1
+        self._bucket(api_key).penalize(seconds or settings.quota_backoff_s)
+
+    def backlog(self, api_key: Optional[str]) -> float:
+        return self._bucket(api_key).backlog()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            pct   = lambda q: round(waits[min(len(waits) - 1, int(q * len(waits)))], 4) if waits else 0.0
+            return {
+                "queue_depth":  self._queued,
+                "in_flight":    self._sem.in_flight,
+                "calls":        self._calls,
+                "quota_errors": self._quota_errors,
+                "wait_p50_s":   pct(0.50),
+                "wait_p95_s":   pct(0.95),
+                "wait_max_s":   round(waits[-1], 4) if waits else 0.0,
+            }
+
+    def _bucket(self, api_key: Optional[str]) -> TokenBucket:
+        k = api_key or ""
+        with self._lock:
+            b = self._buckets.get(k)
+            if b is None:
+                b = self._buckets[k] = TokenBucket(self.default_rpm, self.default_burst)
+            return b
+
+
+def _resolve(fut: "asyncio.Future") -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+def is_quota_error(exc: Exception) -> bool:
+    name = type(exc).__name__
+    text = str(exc)
+    return name in ("ResourceExhausted", "TooManyRequests") or "429" in text or "quota" in text.lower()
+
+
+# Process-wide governor — every session sharing a key shares its budget
+governor = CallGovernor(
+    max_in_flight = settings.max_in_flight_calls,
+    rpm           = settings.rate_limit_rpm,
+    burst         = settings.rate_limit_burst,
+)
@@ -0,0 +1,198 @@
+"""
+services/schemas.py
+─────────────────────────────────────────────────────────────
+Typed result models for every structured model call.
+
+Each model is a dataclass; RESULT_TYPES maps a prompt name to it.
+  response_schema(cls) — Gemini response_schema derived from the
+                         dataclass (sent with application/json MIME)
+  validate(cls, data)  — coerce parsed JSON to the declared types.
+                         Returns None when a required field is missing
+                         or cannot be coerced, so the caller treats the
+                         response as failed instead of silently falling
+                         back to default scores.
+Optional fields absent from the response — or null, which the
+nullable schema allows — are left out, so callers' own defaults (e.g.
+ideal_answer → stored ideal) still apply.
+
+Batched prompts (prompts.BatchTemplate) wrap the same models:
+{"items": [{"id": n, ...}]} — batch_schema() / validate_batch().
+─────────────────────────────────────────────────────────────
+"""
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union, get_args, get_origin, get_type_hints
+
+
+def _enum(*values: str):
+    return field(default=None, metadata={"enum": list(values)})
+
+
+@dataclass
+class StrategyResult:
+    focus_skills:    List[str]
+    difficulty:      Optional[str]  = _enum("easy", "medium", "hard")
+    interview_style: Optional[str]  = _enum("conceptual", "research", "applied", "system-design")
+    probing_enabled: Optional[bool] = None
+    style_reason:    Optional[str]  = None
+
+
+@dataclass
+class ExtractionResult:
+    claimed_facts:       List[str]
+    mentioned_equations: Optional[List[str]] = None
+    mentioned_examples:  Optional[List[str]] = None
+    answer_length:       Optional[str]       = _enum("short", "medium", "long")
+    has_structure:       Optional[bool]      = None
+
+
+@dataclass
+class ComparisonResult:
+    correct_points:   List[str]
+    missing_concepts: List[str]
+    wrong_statements: Optional[List[str]] = None
+    depth_assessment: Optional[str]       = _enum("surface", "basic", "intermediate", "deep", "expert")
+    has_math:         Optional[bool]      = None
+    has_real_example: Optional[bool]      = None
+    covers_tradeoffs: Optional[bool]      = None
+
+
+@dataclass
+class ScoreResult:
+    overall_score:      float
+    concept_score:      float
+    clarity_score:      float
+    confidence_score:   float
+    strengths:          Optional[str]       = None
+    weaknesses:         Optional[str]       = None
+    improvement_tips:   Optional[str]       = None
+    weak_skills:        Optional[List[str]] = None
+    ideal_answer:       Optional[str]       = None
+    follow_up_question: Optional[str]       = None
+    reasoning:          Optional[str]       = None
+
+
+# prompt name (prompts.py) → result model
+RESULT_TYPES: Dict[str, type] = {
+    "strategy":      StrategyResult,
+    "pass1_extract": ExtractionResult,
+    "pass2_compare": ComparisonResult,
+    "pass3_score":   ScoreResult,
+    "fused":         ScoreResult,
+}
+
+
+# batched prompt name → per-item result model
+BATCH_ITEM_TYPES: Dict[str, type] = {
+    "pass1_batch": ExtractionResult,
+    "pass2_batch": ComparisonResult,
+}
+
+
+# ── Schema generation ─────────────────────────────────────────────
+
+def _unwrap(tp):
+    """Optional[X] → (X, True); X → (X, False)."""
+    if get_origin(tp) is Union:
+        args = [a for a in get_args(tp) if a is not type(None)]
+        return args[0], True
+    return tp, False
+
+
+def _type_schema(tp) -> dict:
+    if get_origin(tp) in (list, List):
+        return {"type": "ARRAY", "items": _type_schema(get_args(tp)[0])}
+    return {"type": {float: "NUMBER", int: "INTEGER", bool: "BOOLEAN"}.get(tp, "STRING")}
+
+
+def response_schema(cls) -> dict:
+    hints = get_type_hints(cls)
+    props, required = {}, []
+    for f in dataclasses.fields(cls):
+        tp, optional = _unwrap(hints[f.name])
+        prop = _type_schema(tp)
+        if "enum" in f.metadata:
+            prop["enum"] = f.metadata["enum"]
+        if optional:
+            prop["nullable"] = True
+        else:
+            required.append(f.name)
+        props[f.name] = prop
+    return {"type": "OBJECT", "properties": props, "required": required}
+
+
+def batch_schema(cls) -> dict:
+    item = response_schema(cls)
+    item = {**item,
+            "properties": {"id": {"type": "INTEGER"}, **item["properties"]},
+            "required":   ["id"] + item["required"]}
+    return {"type": "OBJECT",
+            "properties": {"items": {"type": "ARRAY", "items": item}},
+            "required":   ["items"]}
+
+
+# ── Validation ────────────────────────────────────────────────────
+
+class _Invalid(Exception):
+    pass
+
+
+def _coerce(value, tp):
+    if get_origin(tp) in (list, List):
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list):
+            raise _Invalid
+        return [_coerce(v, get_args(tp)[0]) for v in value]
+    if tp is float:
+        if isinstance(value, bool):
+            raise _Invalid
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise _Invalid
+    if tp is bool:
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "yes", "1")
+        return bool(value)
+    if isinstance(value, (dict, list)):
+        raise _Invalid
+    return str(value)
+
+
+def validate(cls, data) -> Optional[dict]:
+    if not isinstance(data, dict):
+        return None
+    hints = get_type_hints(cls)
+    out   = {}
+    for f in dataclasses.fields(cls):
+        tp, optional = _unwrap(hints[f.name])
+        if data.get(f.name) is None:
+            if not optional:
+                return None
+            continue                    # absent or null → the caller's default
+        try:
+            out[f.name] = _coerce(data[f.name], tp)
+        except _Invalid:
+            if not optional:
+                return None
+    return out
+
+
+def validate_batch(cls, data, count: int) -> Optional[List[Optional[dict]]]:
+    """Per-item results in item order (None where an item is missing or invalid)."""
+    items = data.get("items") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return None
+    out: List[Optional[dict]] = [None] * count
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            i = int(item.get("id")) - 1
+        except (TypeError, ValueError):
+            continue
+        if 0 <= i < count and out[i] is None:
+            out[i] = validate(cls, item)
+    return out if any(r is not None for r in out) else None
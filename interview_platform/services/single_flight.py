@@ -0,0 +1,86 @@
+"""
+services/single_flight.py
+─────────────────────────────────────────────────────────────
+Request coalescing for identical concurrent model calls.
+
+When a cohort starts at the same moment, many sessions ask for the
+same strategy profile or the same missing ideal answer at once.
+do(key, fn) runs fn for the first caller of a key; every caller that
+arrives while it is in flight waits for that one call and gets its
+result (or its exception) instead of firing its own. Nothing is kept
+after the call finishes — persistent reuse is the caches' job.
+
+metrics() reports leader calls, coalesced calls and keys in flight —
+including the flights AsyncAIService coalesces on its event loop, which
+report through started() / joined() / finished().
+─────────────────────────────────────────────────────────────
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+
+    def __init__(self):
+        self._lock     = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._stats    = {"leaders": 0, "coalesced": 0}
+        self._external = 0              # flights coalesced outside do(), in flight
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                fut = self._inflight[key] = Future()
+                self._stats["leaders"] += 1
+                leader = True
+
+        if not leader:
+            # Private copy — callers may mutate what they get back
+            return copy.deepcopy(fut.result())
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            fut.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[key]
+        fut.set_result(result)
+        return result
+
+    # ── Flights coalesced elsewhere ───────────────────────────────
+
+    def started(self) -> None:
+        """A leader call began."""
+        with self._lock:
+            self._stats["leaders"] += 1
+            self._external += 1
+
+    def joined(self) -> None:
+        """A caller waits on a leader's call instead of making its own."""
+        with self._lock:
+            self._stats["coalesced"] += 1
+
+    def finished(self) -> None:
+        """A leader call that started() has ended."""
+        with self._lock:
+            self._external -= 1
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._inflight) + self._external}
+
+
+# Process-wide instance — sessions in the same process share in-flight calls
+single_flight = SingleFlight()
@@ -0,0 +1,101 @@
+"""
+services/speculation.py
+─────────────────────────────────────────────────────────────
+Speculative Pass 1 on a draft answer.
+
+Pass 1 depends only on question, skill and answer text, so it can run
+while the candidate is still typing. The interview page reports each
+settled draft (the text area's on_change — Streamlit sends it on blur
+or Ctrl+Enter, which debounces keystrokes) under a draft key, one per
+session and question:
+
+  offer(key, text, start)  — start a speculative extraction unless the
+                             draft is too short or barely differs from
+                             the one already running for this key
+  take(key, text)          — on submit: (speculative Future, exact) if
+                             the final text hashes the same (exact) or
+                             changed by at most speculative_max_change
+                             (fraction of characters, difflib), else
+                             None. A near match is only good for this
+                             one scorecard: AIService does not store
+                             anything derived from it under the final
+                             text's keys (pass store, eval cache).
+
+Entries are kept per key in a bounded LRU, so abandoned drafts fall out.
+metrics() counts started, reused and discarded speculations.
+─────────────────────────────────────────────────────────────
+"""
+
+import difflib
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from ..config import settings
+
+_MAX_ENTRIES = 2000
+
+
+class _Draft(NamedTuple):
+    digest: str
+    text:   str
+    future: Future
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def change_fraction(a: str, b: str) -> float:
+    """0.0 = identical, 1.0 = nothing in common."""
+    if a == b:
+        return 0.0
+    return 1.0 - difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+class SpeculativeExtractions:
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._drafts: "OrderedDict[str, _Draft]" = OrderedDict()
+        self._lock  = threading.Lock()
+        self._stats = {"started": 0, "reused": 0, "discarded": 0}
+
+    def offer(self, key: str, text: str, start: Callable[[], Future]) -> bool:
+        """True if a new speculative extraction was started for this draft."""
+        text = text.strip()
+        if len(text) < settings.speculative_min_chars:
+            return False
+        with self._lock:
+            prev = self._drafts.get(key)
+            if prev is not None and change_fraction(prev.text, text) <= settings.speculative_max_change:
+                return False                # close enough to what is already running
+            if prev is not None:
+                self._stats["discarded"] += 1
+            self._drafts[key] = _Draft(_digest(text), text, start())
+            self._drafts.move_to_end(key)
+            while len(self._drafts) > self.max_entries:
+                self._drafts.popitem(last=False)
+            self._stats["started"] += 1
+            return True
+
+    def take(self, key: str, text: str) -> Optional[Tuple[Future, bool]]:
+        with self._lock:
+            draft = self._drafts.pop(key, None)
+        if draft is None:
+            return None
+        text  = text.strip()
+        exact = draft.digest == _digest(text)
+        if exact or change_fraction(draft.text, text) <= settings.speculative_max_change:
+            with self._lock:
+                self._stats["reused"] += 1
+            return draft.future, exact
+        with self._lock:
+            self._stats["discarded"] += 1
+        return None
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {**self._stats, "drafts": len(self._drafts)}
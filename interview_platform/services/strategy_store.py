@@ -0,0 +1,131 @@
+"""
+services/strategy_store.py
+─────────────────────────────────────────────────────────────
+Strategy cache keyed by the normalised categorical profile:
+
+    role, company_type, experience, sorted weak_areas
+
+(case and whitespace folded; weak areas outside SKILLS dropped). The
+free-text career_goal is not part of the key — keying on it would make
+every profile unique — and so it is left out of the strategy prompt
+while the cache is on: a stored strategy is served to other candidates,
+and must not carry one candidate's goal in its style_reason.
+
+Each key holds a pool of up to strategy_variants stored strategies;
+sample() returns one at random (from the rng it was given — seeded in
+tools/benchmark.py) so candidates with the same profile
+still see some diversity, and AIService tops the pool up in the
+background until it is full. Rows live in `strategy_cache` and carry
+PROMPT_VERSION, so a prompt change retires them.
+tools/precompute_strategies.py fills the pool for common profiles.
+─────────────────────────────────────────────────────────────
+"""
+
+import hashlib
+import json
+import random
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+from ..data.question_bank import SKILLS
+
+
+def _fold(value) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def normalise_profile(profile: dict) -> dict:
+    return {
+        "role":         _fold(profile.get("role")),
+        "company_type": _fold(profile.get("company_type")),
+        "experience":   _fold(profile.get("experience")),
+        "weak_areas":   sorted({w for w in profile.get("weak_areas") or [] if w in SKILLS}),
+    }
+
+
+def profile_key(profile: dict) -> str:
+    payload = json.dumps(normalise_profile(profile), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class StrategyStore:
+
+    def __init__(self, version: str, session_factory=None,
+                 pool_size: Optional[int] = None, rng: Optional[random.Random] = None):
+        self.version   = version
+        self.pool_size = pool_size or settings.strategy_variants
+        self._factory  = session_factory
+        self._rng      = rng or random
+        self._memo: Dict[str, List[dict]] = {}      # profile key → stored variants
+        self._lock = threading.Lock()
+
+    def sample(self, profile: dict) -> Tuple[Optional[dict], int]:
+        """(a stored strategy or None, number of variants stored) for this profile."""
+        key      = profile_key(profile)
+        variants = self._variants(key)
+        if not variants:
+            return None, 0
+        return dict(self._rng.choice(variants)), len(variants)
+
+    def put(self, profile: dict, strategy: dict, model: str) -> None:
+        from ..database.models import StrategyVariant
+        key = profile_key(profile)
+        db  = self._session()
+        try:
+            rows = db.query(StrategyVariant).filter(StrategyVariant.profile_key == key).all()
+            live = [r for r in rows if r.prompt_version == self.version]
+            if len(live) >= self.pool_size:
+                return
+            # Retire rows from an older prompt version, then take the next slot
+            for r in rows:
+                if r.prompt_version != self.version:
+                    db.delete(r)
+            db.flush()
+            used = {r.variant for r in live}
+            db.add(StrategyVariant(
+                profile_key    = key,
+                variant        = next(i for i in range(len(used) + 1) if i not in used),
+                prompt_version = self.version,
+                profile_json   = normalise_profile(profile),
+                strategy_json  = strategy,
+                model          = model,
+            ))
+            db.commit()
+        except Exception as exc:
+            # Lost a race for the same slot with another worker — theirs is as good
+            print(f"[StrategyStore] store failed: {exc}")
+            db.rollback()
+        finally:
+            db.close()
+        with self._lock:
+            self._memo.pop(key, None)
+
+    def _variants(self, key: str) -> List[dict]:
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+        from ..database.models import StrategyVariant
+        db = self._session()
+        try:
+            variants = [r.strategy_json for r in
+                        db.query(StrategyVariant).filter(
+                            StrategyVariant.profile_key == key,
+                            StrategyVariant.prompt_version == self.version)
+                        if r.strategy_json]
+        except Exception as exc:
+            print(f"[StrategyStore] lookup failed: {exc}")
+            return []
+        finally:
+            db.close()
+        if variants:        # misses are not memoised — a precompute may fill them
+            with self._lock:
+                self._memo[key] = variants
+        return variants
+
+    def _session(self):
+        if self._factory is None:
+            from ..database.base import SessionLocal, init_db
+            init_db()
+            self._factory = SessionLocal
+        return self._factory()
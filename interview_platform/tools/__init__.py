@@ -0,0 +1,21 @@
+"""Offline / deploy-time command-line jobs (run with python -m)."""
+
+import os
+
+from ..config import settings
+from ..config.settings import DEFAULT_DATABASE_URL
+
+
+def uses_default_database() -> bool:
+    """
+    True if settings.database_url is the deployment's default database.
+    --mock runs of the precompute jobs refuse to write there: the stores
+    serve whatever rows they hold, placeholders included.
+    """
+    return _location(settings.database_url) == _location(DEFAULT_DATABASE_URL)
+
+
+def _location(url: str) -> str:
+    if url.startswith("sqlite:///"):
+        return os.path.realpath(url[len("sqlite:///"):])
+    return url
@@ -0,0 +1,216 @@
+"""
+tools/benchmark.py
+─────────────────────────────────────────────────────────────
+Reproducible end-to-end benchmark of the interview path:
+
+    InterviewEngine → AIService (router, governor, passes) → DB
+
+Runs a fixed corpus of simulated interviews (seeded profiles, question
+picks and answers) against a record/replay cassette, so the same
+model replies come back every run and any change in wall time is the
+code's, not the provider's:
+
+    # once, against a live backend (Gemini, or the stand-in server)
+    python -m interview_platform.tools.benchmark --record bench.jsonl.gz
+    # then, offline and as often as needed
+    python -m interview_platform.tools.benchmark --replay bench.jsonl.gz
+    python -m interview_platform.tools.benchmark --replay bench.jsonl.gz --time-scale 0
+
+A replay must use the same --interviews / --questions / --seed (and
+prompt version) as the recording; prompts that were never recorded
+are reported as cassette misses. Every run uses a fresh scratch
+database unless --db is given, and the evaluation cache is off unless
+--eval-cache is passed. So that every run sends the same prompts, the
+strategy cache (whose variant pool fills in the background) and the
+per-answer deadline are always off, and the service's own random picks
+come from an rng seeded with --seed.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from ..config import settings
+from ..data.question_bank import SKILLS
+
+PROFILES = [
+    {"role": "ML Engineer",    "company_type": "FAANG / Big Tech", "experience": "3-5 Years"},
+    {"role": "Data Scientist", "company_type": "Startup",          "experience": "1-2 Years"},
+    {"role": "Research Scientist", "company_type": "Research Lab", "experience": "5+ Years"},
+    {"role": "Quant Researcher", "company_type": "Finance / Quant", "experience": "Student/Fresher"},
+]
+
+_OPENERS = [
+    "At a high level, {topic} is about",
+    "The way I think about {topic} is",
+    "In practice, {topic} comes down to",
+]
+_FILLER = [
+    "trading off bias against variance so the model generalises beyond the training set",
+    "choosing an objective that matches the business metric and validating it offline first",
+    "regularising the parameters, for example with an L2 penalty added to the loss",
+    "monitoring drift in production and retraining when the input distribution shifts",
+    "using cross-validation to pick hyperparameters without leaking the test set",
+    "keeping the feature pipeline identical between training and serving",
+]
+
+
+def synthetic_answer(question: str, skill: str, rng: random.Random) -> str:
+    """Deterministic candidate answer of varying length and quality."""
+    if rng.random() < 0.08:
+        return "Not sure."                          # exercises the short-answer gate
+    parts = [rng.choice(_OPENERS).format(topic=skill)]
+    parts += rng.sample(_FILLER, rng.randint(1, len(_FILLER)))
+    return " ".join(parts) + "."
+
+
+def run_interview(index: int, args, session_factory, ai) -> List[float]:
+    from ..engine.interview_engine import InterviewEngine
+
+    rng     = random.Random(args.seed * 1000 + index)
+    profile = {**PROFILES[index % len(PROFILES)],
+               "name":       f"Bench {index}",
+               "email":      f"bench{index}@bench.local",
+               "weak_areas": rng.sample(SKILLS, 2)}
+    db  = session_factory()
+    eng = InterviewEngine(ai, db, rng=rng)
+    latencies = []
+    try:
+        eng.setup_profile(profile)
+        follow_up = None
+        for _ in range(args.questions):
+            q = eng.next_question(follow_up)
+            if q is None:
+                break
+            skipped = rng.random() < 0.05
+            answer  = "" if skipped else synthetic_answer(q["question"], q["skill"], rng)
+            t0 = time.perf_counter()
+            ev = eng.submit_answer(answer, skipped=skipped)
+            latencies.append(time.perf_counter() - t0)
+            follow_up = ev.get("follow_up_question")
+        eng.finalize()
+    finally:
+        db.close()
+    return latencies
+
+
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return round(s[min(len(s) - 1, int(q * len(s)))], 3)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.benchmark",
+        description="Benchmark InterviewEngine → AIService → DB against a cassette.",
+    )
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", metavar="CASSETTE",
+                      help="call the live backend (settings.llm_backend) and record")
+    mode.add_argument("--replay", metavar="CASSETTE",
+                      help="replay a cassette recorded with the same corpus options")
+    ap.add_argument("--time-scale", type=float, default=1.0,
+                    help="replay latency multiplier (1 = original timings, 0 = none)")
+    ap.add_argument("--interviews", type=int, default=10)
+    ap.add_argument("--questions", type=int, default=settings.max_questions,
+                    help="answers per interview (default settings.max_questions)")
+    ap.add_argument("--concurrency", type=int, default=1,
+                    help="interviews running at once")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--db", default=None,
+                    help="database URL (default: fresh scratch SQLite file)")
+    ap.add_argument("--eval-cache", action="store_true",
+                    help="keep the evaluation cache on (off by default)")
+    ap.add_argument("--rpm", type=float, default=None,
+                    help="override settings.rate_limit_rpm for this run")
+    ap.add_argument("--api-key", default=None,
+                    help="key, or comma-separated key pool (default: GEMINI_API_KEYS)")
+    ap.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = ap.parse_args(argv)
+
+    # Configure before the database and services modules are imported
+    settings.llm_cassette            = args.record or args.replay
+    settings.llm_cassette_mode       = "record" if args.record else "replay"
+    settings.llm_cassette_time_scale = args.time_scale
+    settings.eval_cache_enabled      = args.eval_cache
+    settings.strategy_cache_enabled  = False
+    settings.eval_deadline_s         = 0
+    if args.rpm:
+        settings.rate_limit_rpm = args.rpm
+    scratch = None
+    if args.db:
+        settings.database_url = args.db
+    else:
+        fd, scratch = tempfile.mkstemp(prefix="aiip-bench-", suffix=".db")
+        os.close(fd)
+        settings.database_url = f"sqlite:///{scratch}"
+
+    from ..database.base import SessionLocal, init_db
+    from ..services.ai_service import AIService
+    from ..services.async_ai import BlockingAIService
+    from ..services.model_router import router
+    from ..services.rate_limiter import governor
+    from ..services.single_flight import single_flight
+    init_db()
+
+    service = BlockingAIService if settings.async_ai else AIService
+    ai = service(api_key=args.api_key, rng=random.Random(args.seed))
+    if ai.mock:
+        print("[benchmark] no usable backend — check the cassette path or API key")
+        return 2
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        runs = list(pool.map(lambda i: run_interview(i, args, SessionLocal, ai),
+                             range(args.interviews)))
+    wall = time.perf_counter() - t0
+
+    latencies = [x for run in runs for x in run]
+    summary = {
+        "mode":          settings.llm_cassette_mode,
+        "cassette":      settings.llm_cassette,
+        "interviews":    args.interviews,
+        "answers":       len(latencies),
+        "wall_s":        round(wall, 2),
+        "answers_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        "submit_p50_s":  _pct(latencies, 0.50),
+        "submit_p95_s":  _pct(latencies, 0.95),
+        "submit_max_s":  round(max(latencies), 3) if latencies else 0.0,
+        "cassette_stats": dict(getattr(ai.backend, "stats", {})),
+        "governor":      governor.metrics(),
+        "keys":          ai.keys.metrics(),
+        "router":        router.snapshot(),
+        "single_flight": single_flight.metrics(),
+    }
+    if hasattr(ai.backend, "close"):
+        ai.backend.close()
+    if scratch:
+        os.remove(scratch)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"[benchmark] {summary['mode']} {summary['cassette']}")
+        print(f"  {summary['answers']} answers in {summary['wall_s']}s "
+              f"({summary['answers_per_s']}/s)  submit p50 {summary['submit_p50_s']}s  "
+              f"p95 {summary['submit_p95_s']}s  max {summary['submit_max_s']}s")
+        print(f"  cassette {summary['cassette_stats']}")
+        print(f"  governor {summary['governor']}")
+        for key in summary["keys"]:
+            print(f"  key {key}")
+        print(f"  single-flight {summary['single_flight']}")
+    misses = summary["cassette_stats"].get("misses", 0)
+    return 1 if misses else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
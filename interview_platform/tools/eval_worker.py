@@ -0,0 +1,208 @@
+"""
+tools/eval_worker.py
+─────────────────────────────────────────────────────────────
+Worker pool for the durable evaluation queue (services/job_queue.py).
+With EVAL_QUEUE=1 the Streamlit app only enqueues answers; run one or
+more of these next to it, on as many cores or machines (sharing the
+database) as evaluation needs:
+
+    EVAL_QUEUE=1 streamlit run app.py
+    python -m interview_platform.tools.eval_worker --processes 4 --threads 8
+
+Each process runs --threads claim → evaluate → complete loops with its
+own AIService, key pool and rate limiter. A job is leased while it runs;
+if a worker dies, the job is re-queued when the lease runs out. Failed
+evaluations — an exception, or a scorecard marked "failed" or "degraded" —
+are retried up to eval_job_max_attempts, resuming from the passes the
+last attempt stored (services/pass_store.py). Ctrl+C finishes
+the jobs in hand and exits. --drain exits once the queue is empty.
+
+--concurrency N swaps the threads for AsyncAIService (services/async_ai.py)
+on the process's event loop: up to N jobs in flight per process, each
+waiting on the model as a coroutine instead of an OS thread, so N can
+be in the hundreds (max_in_flight_calls still caps the calls actually
+sent at once).
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+from typing import List, Optional
+
+from ..config import settings
+
+
+def _finish(queue, job: dict, name: str, ev: dict) -> bool:
+    """Store a full scorecard; give back a failed or provisional one for a retry."""
+    from ..engine.interview_engine import InterviewEngine
+    if ev.get("failed") or ev.get("degraded"):
+        reason = "no final scorecard" if ev.get("failed") else "provisional scorecard"
+        print(f"[eval_worker] {name} job {job['job_id']}: {reason} — re-queueing")
+        queue.fail(job["job_id"], name, reason)
+        return False
+    row = InterviewEngine.answer_row(job["session_id"], job["question"], job["answer_text"],
+                                     job["skipped"], ev)
+    return queue.complete(job["job_id"], name, ev, [row])
+
+
+def _loop(ai, queue, name: str, stop: threading.Event, drain: bool, counts: dict,
+          lock: threading.Lock) -> None:
+    while not stop.is_set():
+        job = queue.claim(name)
+        if job is None:
+            if drain:
+                return
+            stop.wait(settings.eval_queue_poll_s)
+            continue
+        q = job["question"]
+        try:
+            ev = ai.evaluate_answer(q.get("question", ""), job["answer_text"],
+                                    q.get("skill", ""), q.get("difficulty", "medium"),
+                                    skipped=job["skipped"], deadline_s=0)
+            ok = _finish(queue, job, name, ev)
+        except Exception as exc:
+            print(f"[eval_worker] {name} job {job['job_id']} failed: {exc}")
+            queue.fail(job["job_id"], name, str(exc))
+            ok = False
+        with lock:
+            counts["done" if ok else "failed"] += 1
+
+
+async def _serve(aio, queue, prefix: str, stop: threading.Event, drain: bool,
+                 concurrency: int, counts: dict) -> None:
+    """Claim jobs while fewer than `concurrency` are in flight; evaluate each as a task."""
+    slots   = asyncio.Semaphore(concurrency)
+    running = set()
+
+    async def _one(job: dict, name: str) -> None:
+        q = job["question"]
+        try:
+            ev = await aio.evaluate_answer(q.get("question", ""), job["answer_text"],
+                                           q.get("skill", ""), q.get("difficulty", "medium"),
+                                           skipped=job["skipped"], deadline_s=0)
+            ok = await asyncio.to_thread(_finish, queue, job, name, ev)
+        except Exception as exc:
+            print(f"[eval_worker] {name} job {job['job_id']} failed: {exc}")
+            await asyncio.to_thread(queue.fail, job["job_id"], name, str(exc))
+            ok = False
+        finally:
+            slots.release()
+        counts["done" if ok else "failed"] += 1
+
+    n = 0
+    while not stop.is_set():
+        await slots.acquire()
+        name = f"{prefix}:a{n}"         # one claimant name per job
+        job  = await asyncio.to_thread(queue.claim, name)
+        if job is None:
+            slots.release()
+            if drain:
+                break
+            await asyncio.sleep(settings.eval_queue_poll_s)
+            continue
+        n += 1
+        task = asyncio.ensure_future(_one(job, name))
+        running.add(task)
+        task.add_done_callback(running.discard)
+    if running:
+        await asyncio.gather(*running)
+
+
+def work(threads: int, api_key: Optional[str], mock: bool, drain: bool,
+         max_seconds: Optional[float] = None, concurrency: int = 0) -> dict:
+    """Run one worker process's claim loops until stopped (or drained)."""
+    from ..database.base import enable_wal, init_db
+    from ..services.ai_service import AIService
+    from ..services.async_ai import AsyncAIService, run_sync
+    from ..services.job_queue import job_queue
+    init_db()
+    enable_wal()
+
+    ai = AIService(api_key=api_key, mock=mock)
+    if ai.mock and not mock:
+        print("[eval_worker] no usable backend — pass --mock to run against the simulator")
+        return {"done": 0, "failed": 0}
+
+    stop   = threading.Event()
+    counts = {"done": 0, "failed": 0}
+    lock   = threading.Lock()
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())
+    if max_seconds:
+        threading.Timer(max_seconds, stop.set).start()
+
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    if concurrency > 0:
+        run_sync(_serve(AsyncAIService(core=ai), job_queue, prefix, stop, drain,
+                        concurrency, counts))
+        stop.set()
+        print(f"[eval_worker] {prefix} done={counts['done']} failed={counts['failed']}")
+        return counts
+
+    loops  = [threading.Thread(target=_loop, name=f"eval-worker-{i}",
+                               args=(ai, job_queue, f"{prefix}:{i}", stop, drain, counts, lock))
+              for i in range(max(1, threads))]
+    for t in loops:
+        t.start()
+    for t in loops:
+        t.join()
+    stop.set()
+    print(f"[eval_worker] {prefix} done={counts['done']} failed={counts['failed']}")
+    return counts
+
+
+def _process_main(threads, api_key, mock, drain, max_seconds, concurrency) -> None:
+    work(threads, api_key, mock, drain, max_seconds, concurrency)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.eval_worker",
+        description="Consume queued answer evaluations (EVAL_QUEUE=1).",
+    )
+    ap.add_argument("--processes", type=int, default=1,
+                    help="worker processes (default 1)")
+    ap.add_argument("--threads", type=int, default=4,
+                    help="concurrent evaluations per process (default 4)")
+    ap.add_argument("--concurrency", type=int, default=0,
+                    help="async mode: evaluations in flight per process on one event loop "
+                         "(replaces --threads; default 0 = threaded)")
+    ap.add_argument("--drain", action="store_true",
+                    help="exit once the queue is empty")
+    ap.add_argument("--max-seconds", type=float, default=None,
+                    help="stop claiming after this long")
+    ap.add_argument("--api-key", default=None,
+                    help="key or comma-separated key pool (default: GEMINI_API_KEYS)")
+    ap.add_argument("--mock", action="store_true",
+                    help="use the simulated backend instead of Gemini")
+    args = ap.parse_args(argv)
+
+    worker_args = (args.threads, args.api_key, args.mock, args.drain, args.max_seconds,
+                   args.concurrency)
+    if args.processes <= 1:
+        work(*worker_args)
+        return 0
+
+    ctx   = multiprocessing.get_context("spawn")      # no inherited DB connections
+    procs = [ctx.Process(target=_process_main, args=worker_args, name=f"eval-worker-p{i}")
+             for i in range(args.processes)]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        for p in procs:
+            p.join()            # children got the same SIGINT and are finishing up
+    return 0 if all(p.exitcode == 0 for p in procs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+tools/grade.py
+─────────────────────────────────────────────────────────────
+Headless batch grader: evaluate a file of answers with
+AIService.evaluate_answer and write one JSON result per line.
+
+    python -m interview_platform.tools.grade takehomes.csv -o graded.jsonl --workers 8
+
+Input   .jsonl / .csv (optionally .gz), one answer per row with
+        columns question, answer, skill, difficulty — plus an
+        optional id, copied to the output. "-" reads JSONL from stdin.
+Output  JSONL to -o (default stdout), in input order, one line per
+        row: {"line", "id", "skill", "difficulty", <scorecard>} or
+        {"line", "id", "error"} for rows that could not be graded.
+
+Rows are read, evaluated and written as a stream: at most
+--workers × 2 rows are held in memory at once, so multi-GB inputs
+grade in constant memory. Output is flushed per line, so a killed
+run can be resumed with --skip <lines already written>.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from ..config import settings
+
+
+def open_text(path: str, mode: str = "r"):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def read_rows(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, object]]:
+    """(line number, row dict — or an error string) for each input row, lazily."""
+    base = path[:-3] if path.endswith(".gz") else path
+    fmt  = fmt or ("csv" if base.endswith(".csv") else "jsonl")
+    fh   = open_text(path)
+    try:
+        if fmt == "csv":
+            for n, row in enumerate(csv.DictReader(fh), start=2):   # line 1 = header
+                yield n, row
+        else:
+            for n, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield n, f"invalid JSON: {exc.msg}"
+                    continue
+                yield n, row if isinstance(row, dict) else "row is not a JSON object"
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def _field(row: dict, name: str, default: Optional[str] = None) -> Optional[str]:
+    """A text field, stripped; numbers are accepted as text, anything else is an error."""
+    value = row.get(name)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"{name} must be a string, not {type(value).__name__}")
+    return str(value).strip()
+
+
+def grade_row(ai, n: int, row, default_skill: str) -> dict:
+    if isinstance(row, str):
+        return {"line": n, "error": row}
+    out = {"line": n, "id": row.get("id")}
+    try:
+        question   = _field(row, "question")
+        answer     = None if row.get("answer") is None else _field(row, "answer", "")
+        skill      = _field(row, "skill") or default_skill
+        difficulty = (_field(row, "difficulty") or "medium").lower()
+    except ValueError as exc:
+        return {**out, "error": str(exc)}
+    if not question or answer is None:
+        return {**out, "error": "question and answer are required"}
+    try:
+        # Offline — no candidate waiting, so never settle for a degraded score
+        ev = ai.evaluate_answer(question, answer, skill, difficulty,
+                                skipped=not answer, deadline_s=0)
+    except Exception as exc:
+        return {**out, "error": f"evaluation failed: {exc}"}
+    if ev.get("failed"):
+        return {**out, "error": "evaluation failed: no valid model reply"}
+    return {**out, "skill": skill, "difficulty": difficulty, **ev}
+
+
+def grade(ai, rows: Iterator[Tuple[int, object]], out, workers: int,
+          default_skill: str, skip: int = 0) -> dict:
+    """Evaluate rows on a pool, writing results in input order with a bounded window."""
+    stats  = {"graded": 0, "errors": 0}
+    window = max(1, workers) * 2
+    t0     = time.time()
+
+    def _write(result: dict) -> None:
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+        stats["errors" if "error" in result else "graded"] += 1
+        n = stats["graded"] + stats["errors"]
+        if n % 100 == 0:
+            print(f"[grade] {n} rows  {n / max(time.time() - t0, 1e-6):.2f} rows/s",
+                  file=sys.stderr)
+
+    pending: deque = deque()
+    with ThreadPoolExecutor(max_workers=max(1, workers),
+                            thread_name_prefix="aiip-grade") as pool:
+        for i, (n, row) in enumerate(rows):
+            if i < skip:
+                continue
+            if len(pending) >= window:
+                _write(pending.popleft().result())
+            pending.append(pool.submit(grade_row, ai, n, row, default_skill))
+        while pending:
+            _write(pending.popleft().result())
+
+    stats["seconds"] = round(time.time() - t0, 1)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.grade",
+        description="Grade a JSONL / CSV file of answers; write results as JSONL.",
+    )
+    ap.add_argument("input", help=".jsonl / .csv file (optionally .gz), or - for JSONL on stdin")
+    ap.add_argument("-o", "--output", default="-", help="output .jsonl[.gz] (default stdout)")
+    ap.add_argument("--format", choices=["jsonl", "csv"], default=None,
+                    help="input format (default: from the file extension)")
+    ap.add_argument("--workers", type=int, default=4, help="concurrent evaluations (default 4)")
+    ap.add_argument("--rpm", type=float, default=None,
+                    help="model calls per minute (default settings.rate_limit_rpm)")
+    ap.add_argument("--skill", default="Machine Learning",
+                    help="skill for rows without one")
+    ap.add_argument("--skip", type=int, default=0,
+                    help="skip the first N rows (resume after N written lines)")
+    ap.add_argument("--api-key", default=None,
+                    help="Gemini key (default: settings.gemini_api_key)")
+    ap.add_argument("--mock", action="store_true",
+                    help="use the simulated backend instead of Gemini")
+    args = ap.parse_args(argv)
+
+    if args.rpm:
+        settings.rate_limit_rpm = args.rpm        # before the governor is created
+
+    from ..database.base import init_db
+    from ..services.ai_service import AIService
+    init_db()
+    ai = AIService(api_key=args.api_key, mock=args.mock)
+    if ai.mock and not args.mock:
+        print("[grade] no usable backend — pass --mock to run against the simulator",
+              file=sys.stderr)
+        return 2
+
+    out = open_text(args.output, "a" if args.skip else "w")
+    try:
+        stats = grade(ai, read_rows(args.input, args.format), out,
+                      args.workers, args.skill, args.skip)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"[grade] graded={stats['graded']} errors={stats['errors']} "
+          f"in {stats['seconds']}s", file=sys.stderr)
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
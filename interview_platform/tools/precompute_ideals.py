@@ -0,0 +1,132 @@
+"""
+tools/precompute_ideals.py
+─────────────────────────────────────────────────────────────
+Generate every missing ideal answer in QUESTION_BANK ahead of time.
+
+Run at deploy time so no interactive evaluation ever waits on an
+on-demand ideal-answer call:
+
+    python -m interview_platform.tools.precompute_ideals --workers 4
+
+Resumable & idempotent: each answer is written to the ideal-answer
+store as soon as it arrives, and questions already in the store (or
+in the hand-written bank) are skipped — re-running after a crash only
+does the remaining work, re-running after success does nothing.
+
+--mock uses the simulated backend, and refuses to run against the
+default database (exit 2): point DATABASE_URL at a scratch database so
+placeholder answers never reach a real deployment.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from ..config import settings
+from ..data.question_bank import QUESTION_BANK
+from ..services.ai_service import AIService
+from ..services.ideal_store import IdealAnswerStore
+from . import uses_default_database
+
+
+def collect_missing(store: IdealAnswerStore,
+                    skills: Optional[List[str]] = None,
+                    difficulties: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+    """(skill, question) pairs with no stored ideal answer, de-duplicated."""
+    seen, todo = set(), []
+    for skill, levels in QUESTION_BANK.items():
+        if skills and skill not in skills:
+            continue
+        for diff, questions in levels.items():
+            if difficulties and diff not in difficulties:
+                continue
+            for q in questions:
+                if q in seen:
+                    continue
+                seen.add(q)
+                if not store.get(q):
+                    todo.append((skill, q))
+    return todo
+
+
+def precompute(ai: AIService, store: IdealAnswerStore,
+               todo: List[Tuple[str, str]], workers: int) -> dict:
+    model = "mock" if ai.mock else settings.gemini_model_strategy
+    done = failed = 0
+    t0 = time.time()
+
+    def _one(skill: str, question: str) -> bool:
+        text = ai.generate_ideal(question, skill)
+        if not text:
+            return False
+        store.put(question, skill, text, model)
+        return True
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_one, sk, q): q for sk, q in todo}
+        for fut in as_completed(futures):
+            try:
+                ok = fut.result()
+            except Exception as exc:
+                print(f"[precompute] error: {exc}")
+                ok = False
+            done   += ok
+            failed += not ok
+            print(f"[precompute] {done + failed}/{len(todo)}  "
+                  f"{'ok  ' if ok else 'FAIL'}  {futures[fut][:70]}")
+
+    return {"generated": done, "failed": failed,
+            "seconds": round(time.time() - t0, 1)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.precompute_ideals",
+        description="Generate missing ideal answers for the whole question bank.",
+    )
+    ap.add_argument("--workers", type=int, default=4,
+                    help="max concurrent model calls (default 4)")
+    ap.add_argument("--skill", action="append",
+                    help="limit to this skill (repeatable)")
+    ap.add_argument("--difficulty", action="append", choices=["easy", "medium", "hard"],
+                    help="limit to this difficulty (repeatable)")
+    ap.add_argument("--api-key", default=None,
+                    help="Gemini key (default: settings.gemini_api_key)")
+    ap.add_argument("--mock", action="store_true",
+                    help="use the simulated backend instead of Gemini")
+    ap.add_argument("--dry-run", action="store_true",
+                    help="only list what is missing")
+    args = ap.parse_args(argv)
+
+    if args.mock and not args.dry_run and uses_default_database():
+        print("[precompute] --mock writes placeholders — set DATABASE_URL to a scratch "
+              "database, not the default one")
+        return 2
+
+    from ..database.base import init_db
+    init_db()
+
+    store = IdealAnswerStore()
+    todo  = collect_missing(store, args.skill, args.difficulty)
+    print(f"[precompute] {len(todo)} question(s) without an ideal answer")
+    if args.dry_run or not todo:
+        for skill, q in todo:
+            print(f"  {skill:<32} {q[:80]}")
+        return 0
+
+    ai = AIService(api_key=args.api_key, mock=args.mock)
+    if ai.mock and not args.mock:
+        print("[precompute] no usable Gemini key — pass --mock to run against the simulator")
+        return 2
+
+    summary = precompute(ai, store, todo, args.workers)
+    print(f"[precompute] generated={summary['generated']} "
+          f"failed={summary['failed']} in {summary['seconds']}s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+tools/precompute_strategies.py
+─────────────────────────────────────────────────────────────
+Fill the strategy cache for every common profile ahead of time, so
+"GENERATE STRATEGY & START" is served from stored variants instead of
+a full model round trip:
+
+    python -m interview_platform.tools.precompute_strategies --workers 4
+
+Profiles are ROLES × COMPANIES × EXPERIENCE from data/profiles.py,
+with no weak areas (default) or additionally each single weak area
+(--weak single). Every profile is topped up to strategy_variants
+stored variants.
+
+Resumable & idempotent like precompute_ideals: each variant is stored
+as soon as it arrives and full pools are skipped.
+
+--mock uses the simulated backend, and refuses to run against the
+default database (exit 2): point DATABASE_URL at a scratch database so
+placeholder strategies never reach a real deployment.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+from ..config import settings
+from ..data.profiles import COMPANIES, EXPERIENCE, ROLES
+from ..data.question_bank import SKILLS
+from ..services.ai_service import AIService
+from ..services.prompts import PROMPT_VERSION
+from ..services.strategy_store import StrategyStore
+from . import uses_default_database
+
+
+def common_profiles(weak: str = "none") -> List[dict]:
+    weak_sets = [[]] + ([[s] for s in SKILLS] if weak == "single" else [])
+    return [
+        {"role": r, "company_type": c, "experience": e, "weak_areas": w}
+        for r, c, e, w in itertools.product(ROLES, COMPANIES, EXPERIENCE, weak_sets)
+    ]
+
+
+def collect_missing(store: StrategyStore, profiles: List[dict]) -> List[dict]:
+    """
+    One entry per missing variant. A profile needing several appears once
+    per round, so concurrent workers never race for the same variant slot.
+    """
+    need = [(p, store.pool_size - store.sample(p)[1]) for p in profiles]
+    return [p for rnd in range(store.pool_size) for p, n in need if n > rnd]
+
+
+def precompute(ai: AIService, store: StrategyStore, todo: List[dict], workers: int) -> dict:
+    model = "mock" if ai.mock else settings.gemini_model_strategy
+    done = failed = 0
+    t0 = time.time()
+
+    def _one(profile: dict) -> bool:
+        if ai.mock:
+            strategy, ok = ai.generate_strategy(profile), True
+        else:
+            strategy, ok = ai.fresh_strategy(profile)
+        if ok:
+            store.put(profile, strategy, model)
+        return ok
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_one, p): p for p in todo}
+        for fut in as_completed(futures):
+            try:
+                ok = fut.result()
+            except Exception as exc:
+                print(f"[precompute] error: {exc}")
+                ok = False
+            done   += ok
+            failed += not ok
+            p = futures[fut]
+            print(f"[precompute] {done + failed}/{len(todo)}  "
+                  f"{'ok  ' if ok else 'FAIL'}  {p['role']} · {p['company_type']} · "
+                  f"{p['experience']}{' · ' + p['weak_areas'][0] if p['weak_areas'] else ''}")
+
+    return {"generated": done, "failed": failed,
+            "seconds": round(time.time() - t0, 1)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.precompute_strategies",
+        description="Fill the strategy cache for every common profile.",
+    )
+    ap.add_argument("--workers", type=int, default=4,
+                    help="max concurrent model calls (default 4)")
+    ap.add_argument("--weak", choices=["none", "single"], default="none",
+                    help="weak-area sets: none only, or also each single skill")
+    ap.add_argument("--variants", type=int, default=None,
+                    help="variants per profile (default settings.strategy_variants)")
+    ap.add_argument("--api-key", default=None,
+                    help="Gemini key (default: settings.gemini_api_key)")
+    ap.add_argument("--mock", action="store_true",
+                    help="use the simulated backend instead of Gemini")
+    ap.add_argument("--dry-run", action="store_true",
+                    help="only count what is missing")
+    args = ap.parse_args(argv)
+
+    if args.mock and not args.dry_run and uses_default_database():
+        print("[precompute] --mock writes placeholders — set DATABASE_URL to a scratch "
+              "database, not the default one")
+        return 2
+
+    from ..database.base import init_db
+    init_db()
+
+    store = StrategyStore(PROMPT_VERSION, pool_size=args.variants)
+    todo  = collect_missing(store, common_profiles(args.weak))
+    print(f"[precompute] {len(todo)} strategy variant(s) missing")
+    if args.dry_run or not todo:
+        return 0
+
+    ai = AIService(api_key=args.api_key, mock=args.mock)
+    if ai.mock and not args.mock:
+        print("[precompute] no usable Gemini key — pass --mock to run against the simulator")
+        return 2
+
+    summary = precompute(ai, store, todo, args.workers)
+    print(f"[precompute] generated={summary['generated']} "
+          f"failed={summary['failed']} in {summary['seconds']}s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
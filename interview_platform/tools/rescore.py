@@ -0,0 +1,214 @@
+"""
+tools/rescore.py
+─────────────────────────────────────────────────────────────
+Re-score historical rows of `answers` after a RUBRIC, prompt or model
+change. Results go to `answer_evaluations` under an evaluation version
+(default: PROMPT_VERSION + eval model + pass count), so old and new
+scores sit side by side and the live `answers` rows are never touched:
+
+    python -m interview_platform.tools.rescore --workers 8 --rpm 30
+
+  • Rows are streamed in answer_id order through a server-side cursor
+    (yield_per / stream_results) — memory stays at one chunk.
+  • Each chunk is evaluated on a bounded worker pool, then its results
+    and the checkpoint are committed in one transaction. An interrupted
+    job resumes after the last committed chunk.
+  • Failed evaluations are counted and not written; --restart walks
+    the table again and fills in only the answers still missing.
+  • Runs as its own process with its own rate limit (--rpm), and puts
+    SQLite in WAL mode so the Streamlit app keeps reading and writing
+    while the job runs.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from ..config import settings
+
+SKIPPED_TEXT = "— skipped —"      # what InterviewEngine stores for a skipped answer
+
+Row = Tuple[int, str, str, str, str]   # answer_id, question, answer, skill, difficulty
+
+
+def default_version(passes: int) -> str:
+    from ..services.prompts import PROMPT_VERSION
+    return f"{PROMPT_VERSION}:{settings.gemini_model_eval}:p{passes}"
+
+
+def stream_answers(db, after_id: int, chunk: int) -> Iterator[List[Row]]:
+    """Answers with answer_id > after_id, in order, as lists of at most `chunk`."""
+    from ..database.models import Answer
+    q = (db.query(Answer.answer_id, Answer.question_text, Answer.answer_text,
+                  Answer.skill_tested, Answer.difficulty)
+           .filter(Answer.answer_id > after_id)
+           .order_by(Answer.answer_id)
+           .execution_options(stream_results=True)
+           .yield_per(chunk))
+    batch: List[Row] = []
+    for row in q:
+        batch.append(tuple(row))
+        if len(batch) >= chunk:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def evaluate_row(ai, row: Row) -> Optional[dict]:
+    _, question, answer, skill, difficulty = row
+    skipped = (answer or "").strip() in ("", SKIPPED_TEXT)
+    ev = ai.evaluate_answer(question or "", "" if skipped else answer,
+                            skill or "", difficulty or "medium", skipped=skipped,
+                            deadline_s=0)
+    return None if ev.get("failed") else ev
+
+
+def rescore(ai, session_factory, version: str, passes: int,
+            workers: int, chunk: int, restart: bool = False,
+            limit: Optional[int] = None) -> dict:
+    from ..database.models import Answer, AnswerEvaluation, RescoreCheckpoint
+    from ..services.prompts import PROMPT_VERSION
+
+    writer = session_factory()
+    ckpt   = writer.get(RescoreCheckpoint, version)
+    if ckpt is None:
+        ckpt = RescoreCheckpoint(eval_version=version, last_answer_id=0,
+                                 processed=0, failed=0)
+        writer.add(ckpt)
+    if restart:
+        ckpt.last_answer_id, ckpt.finished_at = 0, None
+    writer.commit()
+
+    total = writer.query(Answer).filter(Answer.answer_id > ckpt.last_answer_id).count()
+    if limit:
+        total = min(total, limit)
+    print(f"[rescore] {version}: {total} answer(s) after id {ckpt.last_answer_id}")
+
+    reader = session_factory()
+    done = failed = 0
+    t0 = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers),
+                                thread_name_prefix="aiip-rescore") as pool:
+            for batch in stream_answers(reader, ckpt.last_answer_id, chunk):
+                if limit:
+                    batch = batch[:max(0, limit - done - failed)]
+                    if not batch:
+                        break
+                have = {a for (a,) in writer.query(AnswerEvaluation.answer_id).filter(
+                    AnswerEvaluation.eval_version == version,
+                    AnswerEvaluation.answer_id.in_([r[0] for r in batch]))}
+                todo    = [r for r in batch if r[0] not in have]
+                results = list(pool.map(lambda r: _safe(ai, r), todo))
+
+                now = datetime.utcnow()
+                for row, ev in zip(todo, results):
+                    if ev is None:
+                        failed += 1
+                        continue
+                    writer.add(AnswerEvaluation(
+                        answer_id        = row[0],
+                        eval_version     = version,
+                        prompt_version   = PROMPT_VERSION,
+                        model            = settings.gemini_model_eval,
+                        passes           = passes,
+                        overall_score    = ev["overall_score"],
+                        concept_score    = ev["concept_score"],
+                        clarity_score    = ev["clarity_score"],
+                        confidence_score = ev["confidence_score"],
+                        result_json      = ev,
+                        created_at       = now,
+                    ))
+                    done += 1
+                # Results and resume point land together — or not at all
+                ckpt.last_answer_id = batch[-1][0]
+                ckpt.processed      = (ckpt.processed or 0) + len(todo) - results.count(None)
+                ckpt.failed         = (ckpt.failed or 0) + results.count(None)
+                ckpt.updated_at     = now
+                writer.commit()
+                _progress(done, failed, len(batch) - len(todo), total, t0)
+                if limit and done + failed >= limit:
+                    break
+            else:
+                ckpt.finished_at = datetime.utcnow()
+                writer.commit()
+    finally:
+        reader.close()
+        writer.close()
+
+    return {"evaluated": done, "failed": failed,
+            "seconds": round(time.time() - t0, 1)}
+
+
+def _safe(ai, row: Row) -> Optional[dict]:
+    try:
+        return evaluate_row(ai, row)
+    except Exception as exc:
+        print(f"[rescore] answer {row[0]} failed: {exc}")
+        return None
+
+
+def _progress(done: int, failed: int, skipped: int, total: int, t0: float) -> None:
+    n       = done + failed
+    elapsed = max(time.time() - t0, 1e-6)
+    rate    = n / elapsed
+    eta     = (total - n) / rate if rate and total > n else 0
+    print(f"[rescore] {n}/{total}  ok={done} failed={failed}"
+          f"{f' already-done={skipped}' if skipped else ''}  "
+          f"{rate:.2f} ans/s  eta {eta / 60:.1f} min")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m interview_platform.tools.rescore",
+        description="Re-score stored answers into the versioned answer_evaluations table.",
+    )
+    ap.add_argument("--version", default=None,
+                    help="evaluation version label (default: prompt version:model:passes)")
+    ap.add_argument("--workers", type=int, default=4,
+                    help="concurrent evaluations (default 4)")
+    ap.add_argument("--chunk", type=int, default=50,
+                    help="rows per streamed chunk / checkpoint (default 50)")
+    ap.add_argument("--rpm", type=float, default=None,
+                    help="model calls per minute for this job (default settings.rate_limit_rpm)")
+    ap.add_argument("--limit", type=int, default=None, help="stop after this many answers")
+    ap.add_argument("--restart", action="store_true",
+                    help="walk all answers again, filling in only missing evaluations")
+    ap.add_argument("--api-key", default=None,
+                    help="Gemini key (default: settings.gemini_api_key)")
+    ap.add_argument("--mock", action="store_true",
+                    help="use the simulated backend instead of Gemini")
+    args = ap.parse_args(argv)
+
+    if args.rpm:
+        settings.rate_limit_rpm = args.rpm        # before the governor is created
+
+    from ..database.base import SessionLocal, enable_wal, init_db
+    from ..services.ai_service import AIService
+    init_db()
+    enable_wal()
+
+    ai = AIService(api_key=args.api_key, mock=args.mock)
+    if ai.mock and not args.mock:
+        print("[rescore] no usable backend — pass --mock to run against the simulator")
+        return 2
+
+    passes  = ai._pass_count()
+    version = args.version or default_version(passes)
+    if args.mock:
+        version += ":mock"
+
+    summary = rescore(ai, SessionLocal, version, passes,
+                      args.workers, args.chunk, args.restart, args.limit)
+    print(f"[rescore] evaluated={summary['evaluated']} failed={summary['failed']} "
+          f"in {summary['seconds']}s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""
+tools/standin_server.py
+─────────────────────────────────────────────────────────────
+Local stand-in for the LLM provider, speaking the HTTPBackend wire
+format (services/backends.py). Lets the real network path — router,
+hedging, rate limiting, structured-output validation, continuations,
+streaming — be load-tested and benchmarked with no network access:
+
+    python -m interview_platform.tools.standin_server --port 8765 \\
+        --latency lognormal:1.5,0.4 --error-rate 0.02 --quota-rpm 120 \\
+        --truncate-rate 0.05
+    LLM_BACKEND=http streamlit run app.py
+
+Replies are canned but well-formed JSON for each prompt kind (batched
+kinds included), and deterministic per prompt body (scores vary with
+the answer). Knobs:
+
+  --latency        fixed:S | uniform:A,B | normal:MU,SD | lognormal:MEDIAN,SIGMA
+  --error-rate     fraction of calls answered 500
+  --quota-rpm      per-API-key requests/minute; over budget → 429
+  --truncate-rate  fraction of replies cut short with MAX_TOKENS
+                   (replies longer than max_output_tokens are always cut)
+  --fail-model     answer every call to this model 500 (an outage;
+                   repeatable) — exercises the router's fallback
+
+GET /v1/stats returns call, error, 429 and truncation counts.
+start() runs the server on a background thread for in-process use.
+─────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from ..data.question_bank import SKILLS
+
+_CONTINUE_MARK = "\n\n──────── CONTINUE ────────"
+
+
+# ── Knobs ─────────────────────────────────────────────────────────
+
+class Latency:
+    """Parsed --latency spec; sample() returns seconds."""
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, _, args = spec.partition(":")
+        self.kind   = kind
+        self.params = [float(a) for a in args.split(",") if a]
+        if kind not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"unknown latency distribution {spec!r}")
+        self.spec = spec
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            return p[0] if p else 0.0
+        if self.kind == "uniform":
+            return rng.uniform(p[0], p[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(p[0], p[1]))
+        return p[0] * math.exp(rng.gauss(0.0, p[1]))      # lognormal: median, sigma
+
+
+@dataclass
+class StandinConfig:
+    latency:       Latency = None
+    error_rate:    float   = 0.0
+    quota_rpm:     int     = 0          # 0 = unlimited
+    truncate_rate: float   = 0.0
+    stream_chunk:  int     = 40         # characters per streamed chunk
+    seed:          Optional[int] = None
+    fail_models:   FrozenSet[str] = frozenset()
+
+    def __post_init__(self):
+        if self.latency is None:
+            self.latency = Latency()
+
+
+# ── Canned replies ────────────────────────────────────────────────
+
+def _rng_for(body: str) -> random.Random:
+    return random.Random(int(hashlib.sha256(body.encode("utf-8")).hexdigest()[:16], 16))
+
+
+def _answer_of(body: str) -> str:
+    marker = 'ANSWER: "'
+    i = body.rfind(marker)
+    return body[i + len(marker):body.rfind('"')] if i != -1 else ""
+
+
+def _score_reply(body: str) -> dict:
+    rng    = _rng_for(body)
+    words  = len(_answer_of(body).split())
+    # Longer answers score higher on average — enough signal for dashboards
+    base   = min(8.5, 2.0 + words / 15.0) + rng.uniform(-1.5, 1.0)
+    clamp  = lambda v: round(max(0.0, min(10.0, v)), 1)
+    return {
+        "overall_score":      clamp(base),
+        "concept_score":      clamp(base + rng.uniform(-1.0, 1.0)),
+        "clarity_score":      clamp(base + rng.uniform(-1.0, 1.0)),
+        "confidence_score":   clamp(base + rng.uniform(-1.5, 0.5)),
+        "strengths":          "Identifies the core mechanism and uses the right vocabulary.",
+        "weaknesses":         "Skips the formal definition and gives no production example.",
+        "improvement_tips":   "1) State the definition first. 2) Add the key equation. "
+                              "3) Close with a trade-off from a real system.",
+        "weak_skills":        ["mathematical formulation", "production trade-offs"],
+        "ideal_answer":       "A complete answer defines the concept, gives the governing "
+                              "equation, illustrates it with a deployed system and names "
+                              "its main failure mode.",
+        "follow_up_question": "How would this change at ten times the data volume?"
+                              if base >= 4 else None,
+        "reasoning":          f"Answer of {words} words with partial depth.",
+    }
+
+
+def canned_reply(kind: str, body: str) -> str:
+    """Deterministic, well-formed reply text for a prompt kind and body."""
+    rng = _rng_for(body)
+    if kind == "strategy":
+        data = {
+            "focus_skills":    rng.sample(SKILLS, 4),
+            "difficulty":      rng.choice(["easy", "medium", "hard"]),
+            "interview_style": rng.choice(["conceptual", "research", "applied", "system-design"]),
+            "probing_enabled": True,
+            "style_reason":    "Balanced strategy weighted toward the stated weak areas.",
+        }
+    elif kind == "pass1_extract":
+        words = len(_answer_of(body).split())
+        data = {
+            "claimed_facts":       [f"claim {i + 1}" for i in range(max(1, words // 12))],
+            "mentioned_equations": [],
+            "mentioned_examples":  ["example"] if words > 40 else [],
+            "answer_length":       "short" if words < 25 else "medium" if words < 80 else "long",
+            "has_structure":       words > 40,
+        }
+    elif kind == "pass2_compare":
+        data = {
+            "correct_points":   ["core mechanism"],
+            "missing_concepts": ["formal definition", "failure modes"][:rng.randint(0, 2)],
+            "wrong_statements": [],
+            "depth_assessment": rng.choice(["basic", "intermediate", "deep"]),
+            "has_math":         rng.random() < 0.3,
+            "has_real_example": rng.random() < 0.5,
+            "covers_tradeoffs": rng.random() < 0.4,
+        }
+    elif kind in ("pass3_score", "fused"):
+        data = _score_reply(body)
+    elif kind.endswith("_batch"):
+        return _batch_reply(kind, body)
+    elif kind == "ideal":
+        return ("An expert answer states the precise definition, writes down the governing "
+                "equation, walks through a production example, and closes with the main "
+                "trade-off and when the technique fails.")
+    else:
+        data = {}
+    return json.dumps(data, indent=2)
+
+
+def _batch_reply(kind: str, body: str) -> str:
+    """{"items": [...]} with one canned reply per ### ITEM block."""
+    single = kind[:-len("_batch")].replace("pass1", "pass1_extract").replace("pass2", "pass2_compare")
+    blocks = body.split("\n### ITEM ")[1:]
+    items  = [{"id": i, **json.loads(canned_reply(single, block))}
+              for i, block in enumerate(blocks, start=1)]
+    return json.dumps({"items": items}, indent=2)
+
+
+def _continuation(kind: str, body: str) -> str:
+    """Remainder of the original reply after the partial quoted in a _cont prompt."""
+    original, _, tail = body.partition(_CONTINUE_MARK)
+    partial = tail[tail.find("<<<") + 3:tail.rfind(">>>")]
+    full = canned_reply(kind[:-len("_cont")], original)
+    i = full.find(partial) if partial else -1
+    return full[i + len(partial):] if i != -1 else full
+
+
+# ── Server ────────────────────────────────────────────────────────
+
+class StandinState:
+
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        self.rng    = random.Random(config.seed)
+        self.lock   = threading.Lock()
+        self.calls: Dict[str, deque] = {}           # api key → recent call times
+        self.stats  = {"calls": 0, "errors": 0, "quota_429": 0,
+                       "truncated": 0, "streams": 0}
+
+    def admit(self, api_key: str, model: str = "") -> Tuple[int, str, float, float, float]:
+        """(status, error, latency, truncation draw, truncation point) for one call."""
+        now = time.time()
+        with self.lock:
+            self.stats["calls"] += 1
+            latency = self.config.latency.sample(self.rng)
+            trunc, cut = self.rng.random(), self.rng.uniform(0.3, 0.8)
+            if self.config.quota_rpm:
+                window = self.calls.setdefault(api_key, deque())
+                while window and now - window[0] > 60.0:
+                    window.popleft()
+                if len(window) >= self.config.quota_rpm:
+                    self.stats["quota_429"] += 1
+                    return 429, "quota exceeded for this API key (stand-in)", 0.0, trunc, cut
+                window.append(now)
+            if self.rng.random() < self.config.error_rate:
+                self.stats["errors"] += 1
+                return 500, "injected failure (stand-in)", latency, trunc, cut
+            if model in self.config.fail_models:
+                self.stats["errors"] += 1
+                return 500, f"{model} is down (stand-in)", latency, trunc, cut
+        return 200, "", latency, trunc, cut
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.stats[name] += 1
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "aiip-standin/1"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):      # keep load tests quiet
+        pass
+
+    @property
+    def state(self) -> StandinState:
+        return self.server.state
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/v1/stats":
+            with self.state.lock:
+                self._json(200, dict(self.state.stats))
+        else:
+            self._json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/v1/generate":
+            self._json(404, {"error": "not found"})
+            return
+        try:
+            req = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except Exception:
+            self._json(400, {"error": "invalid JSON"})
+            return
+
+        status, error, latency, trunc, cut = self.state.admit(self.headers.get("x-api-key", ""),
+                                                              req.get("model", ""))
+        if status != 200:
+            time.sleep(latency)
+            self._json(status, {"error": error})
+            return
+
+        kind, body = req.get("kind", ""), req.get("body", "")
+        text = _continuation(kind, body) if kind.endswith("_cont") else canned_reply(kind, body)
+
+        finish = "STOP"
+        limit  = int(req.get("max_output_tokens") or 0) * 4           # ~4 chars / token
+        if limit and len(text) > limit:
+            text, finish = text[:limit], "MAX_TOKENS"
+        elif not kind.endswith("_cont") and trunc < self.state.config.truncate_rate:
+            text, finish = text[:int(len(text) * cut)], "MAX_TOKENS"
+        if finish == "MAX_TOKENS":
+            self.state.count("truncated")
+
+        if req.get("stream"):
+            self.state.count("streams")
+            self._stream(text, finish, latency)
+        else:
+            time.sleep(latency)
+            self._json(200, {"text": text, "finish_reason": finish})
+
+    def _stream(self, text: str, finish: str, latency: float):
+        step   = max(1, self.state.config.stream_chunk)
+        chunks = [text[i:i + step] for i in range(0, len(text), step)] or [""]
+        # ~40% of the latency to the first token, the rest spread over the chunks
+        time.sleep(latency * 0.4)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        gap = latency * 0.6 / len(chunks)
+        for chunk in chunks:
+            self.wfile.write((json.dumps({"text": chunk}) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            time.sleep(gap)
+        self.wfile.write((json.dumps({"finish_reason": finish}) + "\n").encode("utf-8"))
+        self.close_connection = True
+
+    def _json(self, status: int, data: dict):
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 1024       # async clients connect hundreds at once
+
+
+def serve(config: StandinConfig, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    server = _Server((host, port), StandinHandler)
+    server.daemon_threads = True
+    server.state = StandinState(config)
+    return server
+
+
+def start(config: StandinConfig, host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve on a background thread; port 0 picks a free port. Returns (server, url)."""
+    server = serve(config, host, port)
+    threading.Thread(target=server.serve_forever, name="aiip-standin", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv: Optional[list] = None) -> int:
+    p = argparse.ArgumentParser(description="Local LLM stand-in server for offline load tests.")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency", default="lognormal:1.0,0.4",
+                   help="fixed:S | uniform:A,B | normal:MU,SD | lognormal:MEDIAN,SIGMA")
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--quota-rpm", type=int, default=0, help="per API key; 0 = unlimited")
+    p.add_argument("--truncate-rate", type=float, default=0.0)
+    p.add_argument("--stream-chunk", type=int, default=40)
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--fail-model", action="append", default=[], metavar="MODEL",
+                   help="answer every call to MODEL with 500 (repeatable)")
+    args = p.parse_args(argv)
+
+    config = StandinConfig(
+        latency=Latency(args.latency), error_rate=args.error_rate,
+        quota_rpm=args.quota_rpm, truncate_rate=args.truncate_rate,
+        stream_chunk=args.stream_chunk, seed=args.seed,
+        fail_models=frozenset(args.fail_model),
+    )
+    server = serve(config, args.host, args.port)
+    print(f"Stand-in LLM on http://{args.host}:{args.port} — latency {args.latency}, "
+          f"errors {args.error_rate:.0%}, quota {args.quota_rpm or '∞'} rpm/key, "
+          f"truncation {args.truncate_rate:.0%}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
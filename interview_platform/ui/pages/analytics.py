@@ -76,7 +76,9 @@ def render(state):
     # ── KPI row ───────────────────────────────────────────────────
     k1, k2, k3, k4 = st.columns(4)
     k1.metric("Readiness Score", f"{readiness['score']}/10")
-    k2.metric("Avg Overall",     f"{round(sum(a['overall_score'] for a in answers)/len(answers),1)}/10")
+    scored = AnalyticsService.scored(answers)
+    k2.metric("Avg Overall",     f"{round(sum(a['overall_score'] for a in scored)/len(scored),1)}/10"
+                                 if scored else "—")
     k3.metric("Questions Done",  f"{len(answers)}/{state.engine_state.get('strategy',{}).get('max_questions',8)}")
     k4.metric("Weak Skills",     str(len(weak)))
 
@@ -1,4 +1,18 @@
-"""ui/pages/interview.py — Production interview screen"""
+"""
+ui/pages/interview.py — Production interview screen
+
+Pipelined mode (settings.pipelined_interview): when the next question
+cannot be a follow-up, it is shown at once and the previous answer is
+scored in the background (InterviewEngine.submit_answer_async). Its
+history slot shows a placeholder until collect_pending() swaps the
+scorecard in; on Streamlit versions with fragments the page polls for
+it, otherwise it appears on the next interaction.
+
+Speculative mode (settings.speculative_extraction): each settled draft
+in the answer box (on_change — blur / Ctrl+Enter) starts Pass 1 in the
+background, so a long answer's extraction is done by the time it is
+submitted.
+"""
 
 import streamlit as st
 from ..styles import (
@@ -15,7 +29,7 @@ def _rebuild_engine(state):
     from ...database.base import SessionLocal, init_db
     from ...database.models import InterviewSession
     init_db()
-    ai  = AIService(api_key=state.api_key or None, mock=state.mock_mode)
+    ai  = AIService.shared(api_key=state.api_key or None, mock=state.mock_mode)
     db  = SessionLocal()
     eng = InterviewEngine(ai, db)
     es  = state.engine_state
@@ -29,11 +43,90 @@ def _rebuild_engine(state):
     return eng, db
 
 
+def _live_scorecard_html(partial: dict) -> str:
+    """Provisional scorecard while Pass 3 streams in."""
+    boxes = "".join(
+        f"<div style='flex:1'>{score_box_html(float(partial[k]), lbl)}</div>"
+        if isinstance(partial.get(k), (int, float)) else
+        f"<div style='flex:1;border:1px dashed #DDE1E7;border-radius:6px;text-align:center;"
+        f"padding:18px 10px;font-family:IBM Plex Mono,monospace;font-size:0.55rem;"
+        f"letter-spacing:2px;color:#A0AEC0'>{lbl}<br>…</div>"
+        for lbl, k in zip(
+            ["OVERALL","CONCEPT","CLARITY","CONFIDENCE"],
+            ["overall_score","concept_score","clarity_score","confidence_score"],
+        )
+    )
+    text = "".join(
+        f"<div style='font-family:IBM Plex Mono,monospace;font-size:0.60rem;color:#718096;"
+        f"letter-spacing:2px;margin:10px 0 4px'>{lbl}</div>"
+        f"<p style='font-size:0.86rem;line-height:1.7;color:#2D3748;margin:0'>{partial[k]}</p>"
+        for lbl, k in [("STRENGTHS","strengths"),("WEAKNESSES","weaknesses"),
+                       ("HOW TO IMPROVE","improvement_tips"),("EXPERT ANSWER","ideal_answer")]
+        if isinstance(partial.get(k), str) and partial[k]
+    )
+    return f"<div style='display:flex;gap:12px'>{boxes}</div>{text}"
+
+
+def collect_pending(state) -> None:
+    """Move background scorecards that have landed into the history and answers."""
+    waiting = []
+    for p in state.pending_evals or []:
+        if not p["future"].done():
+            waiting.append(p)
+            continue
+        try:
+            ev = p["future"].result()
+        except Exception as exc:
+            print(f"[interview] background evaluation failed: {exc}")
+            state.messages[p["message"]] = {
+                "role": "eval_error",
+                "text": "This answer could not be scored. It is not counted in your results.",
+            }
+            continue
+        state.messages[p["message"]]["evaluation"] = ev
+        state.answers.append({**ev, "skill_tested": p["skill"]})
+    state.pending_evals = waiting
+
+
+def _poll_pending(state):
+    """Rerun the page as soon as a background scorecard is ready."""
+    if any(p["future"].done() for p in state.pending_evals or []):
+        st.rerun()
+
+
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+if _fragment is not None:
+    _poll_pending = _fragment(run_every=settings.pipeline_poll_s)(_poll_pending)
+
+
+def _offer_draft(state, widget_key: str, draft_key: str, q: dict) -> None:
+    """Answer box on_change: speculate Pass 1 on the settled draft."""
+    from ...services.ai_service import AIService
+    ai = AIService.shared(api_key=state.api_key or None, mock=state.mock_mode)
+    ai.speculate_extraction(draft_key, q["question"],
+                            st.session_state.get(widget_key) or "", q["skill"])
+
+
+def _pending_html() -> str:
+    return (
+        "<div style='border:1px dashed #DDE1E7;border-radius:6px;padding:14px 16px;"
+        "font-family:IBM Plex Mono,monospace;font-size:0.62rem;letter-spacing:2px;"
+        "color:#A0AEC0'>SCORING IN THE BACKGROUND…</div>"
+    )
+
+
 def render(state):
+    collect_pending(state)
+    pending    = state.pending_evals or []
     answered   = len(state.answers)
+    submitted  = sum(m["role"] == "user" for m in state.messages)
     strat      = state.engine_state.get("strategy", {})
     max_q      = state.engine_state.get("max_questions", settings.max_questions)
 
+    if state.engine_state.get("finished") and not pending:
+        # Last answers were still being scored when the interview ended
+        state.screen = "report"; st.rerun(); return
+
     # ── Sidebar ───────────────────────────────────────────────────
     with st.sidebar:
         st.markdown("""
@@ -47,18 +140,19 @@ def render(state):
         )
         st.markdown("<hr style='border-color:rgba(255,255,255,0.15);margin:0 0 12px'>", unsafe_allow_html=True)
 
-        avg = round(sum(a["overall_score"] for a in state.answers) / answered, 1) if answered else 0
+        scored = AnalyticsService.scored(state.answers)
+        avg = round(sum(a["overall_score"] for a in scored) / len(scored), 1) if scored else 0
         rd  = AnalyticsService.compute_readiness(state.answers)
         lc  = {"Interview Ready":"#4ADE80","Intermediate":"#FBB040","Beginner":"#F87171"}.get(rd["level"],"#FFFFFF")
 
         st.markdown(
-            sidebar_metric("Progress",  f"{answered}/{max_q}")
-            + sidebar_metric("Avg Score", f"{avg:.1f}/10" if answered else "—")
+            sidebar_metric("Progress",  f"{submitted}/{max_q}")
+            + sidebar_metric("Avg Score", f"{avg:.1f}/10" if scored else "—")
             + sidebar_metric("Level",     rd["level"], lc),
             unsafe_allow_html=True,
         )
 
-        if answered:
+        if scored:
             st.markdown("<br>", unsafe_allow_html=True)
             st.markdown(
                 "<p style='font-family:IBM Plex Mono,monospace;font-size:0.55rem;"
@@ -66,7 +160,7 @@ def render(state):
                 unsafe_allow_html=True,
             )
             for lbl, key in [("Concept","concept_score"),("Clarity","clarity_score"),("Confidence","confidence_score")]:
-                v   = round(sum(a[key] for a in state.answers) / answered, 1)
+                v   = round(sum(a[key] for a in scored) / len(scored), 1)
                 c_  = "#4ADE80" if v>=7 else "#FBB040" if v>=4 else "#F87171"
                 pct = v * 10
                 st.markdown(f"""
@@ -116,7 +210,7 @@ def render(state):
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("🔄 New Session", use_container_width=True):
             state.screen = "setup"
-            state.answers, state.messages = [], []
+            state.answers, state.messages, state.pending_evals = [], [], []
             state.current_question, state.engine_state = None, {}
             st.rerun()
 
@@ -139,11 +233,11 @@ def render(state):
         st.markdown(
             f"<div style='text-align:right;font-family:IBM Plex Mono,monospace;"
             f"font-size:0.88rem;color:#718096;padding-top:8px'>"
-            f"Q{answered+1 if state.current_question else answered}/{max_q}</div>",
+            f"Q{submitted+1 if state.current_question else submitted}/{max_q}</div>",
             unsafe_allow_html=True,
         )
 
-    st.progress(answered / max_q)
+    st.progress(min(1.0, submitted / max_q))
     st.markdown("<hr style='border-color:#DDE1E7;margin:8px 0 20px'>", unsafe_allow_html=True)
 
     # ── Message history ───────────────────────────────────────────
@@ -155,6 +249,10 @@ def render(state):
             )
         elif msg["role"] == "user":
             st.markdown(user_bubble(msg["text"]), unsafe_allow_html=True)
+        elif msg["role"] == "eval_error":
+            st.warning(msg["text"])
+        elif msg["role"] == "evaluation" and msg["evaluation"] is None:
+            st.markdown(_pending_html(), unsafe_allow_html=True)
         elif msg["role"] == "evaluation":
             ev = msg["evaluation"]
             c1,c2,c3,c4 = st.columns(4)
@@ -165,6 +263,10 @@ def render(state):
             ):
                 col_.markdown(score_box_html(ev[k], lbl), unsafe_allow_html=True)
 
+            if ev.get("degraded"):
+                st.caption("⏱ Provisional score — the full evaluation did not finish in time. "
+                           "It is not counted toward your readiness level.")
+
             if ev.get("reasoning"):
                 st.markdown(
                     f"<div style='background:#F7F8FA;border-left:3px solid #DDE1E7;"
@@ -218,10 +320,16 @@ def render(state):
                     )
             st.markdown("<br>", unsafe_allow_html=True)
 
+    if pending:
+        _poll_pending(state)
+
     # ── Active question ───────────────────────────────────────────
     q = state.current_question
     if not q:
-        st.info("Session complete — view your full report in the sidebar.")
+        if pending:
+            st.info("Scoring your last answers — the report opens when they are ready.")
+        else:
+            st.info("Session complete — view your full report in the sidebar.")
         return
 
     st.markdown(
@@ -229,6 +337,10 @@ def render(state):
         unsafe_allow_html=True,
     )
 
+    from ...engine.interview_engine import InterviewEngine
+    widget_key = f"ans_{submitted}"
+    draft_key  = InterviewEngine.draft_key(state.engine_state.get("session_id"),
+                                           state.engine_state.get("question_count", 0))
     answer_text = st.text_area(
         "",
         height=170,
@@ -237,8 +349,10 @@ def render(state):
             "Tip: Strong answers include — a precise definition, the key equation or "
             "algorithm, a real-world example, and at least one trade-off or limitation."
         ),
-        key=f"ans_{answered}",
+        key=widget_key,
         label_visibility="collapsed",
+        on_change=_offer_draft if settings.speculative_extraction else None,
+        args=(state, widget_key, draft_key, q),
     )
 
     sc1, sc2, sc3 = st.columns([2, 1, 4])
@@ -265,26 +379,43 @@ def render(state):
         state.messages.append({"role": "user", "text": display})
 
         eng, db = _rebuild_engine(state)
-        spinner_msg = "Analysing your answer with Gemini 2.5 Pro..." if not is_skipped else "Logging skip..."
-        with st.spinner(spinner_msg):
-            ev = eng.submit_answer(answer_body, skipped=is_skipped)
-
-        state.messages.append({"role": "evaluation", "evaluation": ev})
-        state.answers.append({**ev, "skill_tested": q["skill"]})
-        answered += 1
+        if settings.pipelined_interview and (is_skipped or eng.can_pipeline()):
+            # Nothing below waits on this scorecard — score it in the background
+            ev = None
+            state.messages.append({"role": "evaluation", "evaluation": None})
+            state.pending_evals = pending + [{
+                "future":  eng.submit_answer_async(answer_body, skipped=is_skipped),
+                "message": len(state.messages) - 1,
+                "skill":   q["skill"],
+            }]
+        else:
+            spinner_msg = "Analysing your answer with Gemini 2.5 Pro..." if not is_skipped else "Logging skip..."
+            live = st.empty()
+            with st.spinner(spinner_msg):
+                ev = eng.submit_answer(
+                    answer_body, skipped=is_skipped,
+                    on_partial=lambda p: live.markdown(_live_scorecard_html(p), unsafe_allow_html=True),
+                )
+            state.messages.append({"role": "evaluation", "evaluation": ev})
+            state.answers.append({**ev, "skill_tested": q["skill"]})
+        submitted += 1
 
         state.engine_state["used_skills"]     = eng.used_skills.copy()
         state.engine_state["question_count"]  = eng.question_count
         state.engine_state["follow_up_count"] = eng.follow_up_count.copy()
 
-        if answered >= max_q:
+        if submitted >= max_q:
             state.current_question = None
-            state.screen = "report"
+            if state.pending_evals:
+                state.engine_state["finished"] = True
+            else:
+                state.screen = "report"
             db.close(); st.rerun(); return
 
         follow_up = None
         if (
-            not is_skipped
+            ev is not None
+            and not is_skipped
             and strat.get("probing_enabled")
             and ev.get("follow_up_question")
             and not q.get("is_follow_up")
@@ -7,9 +7,11 @@ import streamlit as st
 
 from ..styles import badge, score_box_html, progress_bar_html, score_color_hex
 from ...services.analytics_service import AnalyticsService
+from .interview import collect_pending
 
 
 def render(state):
+    collect_pending(state)      # scorecards still finishing from pipelined turns
     answers  = state.answers
     profile  = state.profile
     strategy = state.engine_state.get("strategy", {})
@@ -51,7 +53,7 @@ def render(state):
             state.screen = "analytics"; st.rerun()
         if st.button("🔄 New Interview",        use_container_width=True):
             state.screen = "setup"
-            state.answers, state.messages = [], []
+            state.answers, state.messages, state.pending_evals = [], [], []
             state.current_question, state.engine_state = None, {}
             st.rerun()
 
@@ -77,8 +79,8 @@ def render(state):
     """, unsafe_allow_html=True)
 
     # ── Four score boxes ──────────────────────────────────────────
-    answered = len(answers)
-    def avg(k): return round(sum(a[k] for a in answers) / answered, 1)
+    scored = AnalyticsService.scored(answers)
+    def avg(k): return round(sum(a[k] for a in scored) / len(scored), 1) if scored else 0.0
 
     c1, c2, c3, c4 = st.columns(4)
     for col_, lbl, k in zip(
@@ -160,7 +162,7 @@ def render(state):
             ov    = a.get("overall_score", 0)
             color = score_color_hex(ov)
             skipped = a.get("answer_text","") == "— skipped —" or ov == 0
-            tag   = " · SKIPPED" if skipped else ""
+            tag   = " · SKIPPED" if skipped else " · PROVISIONAL" if a.get("degraded") else ""
             st.markdown(f"""
             <div style='border-bottom:1px solid #DDE1E7;padding:14px 0'>
               <div style='display:flex;justify-content:space-between;align-items:center;margin-bottom:6px'>
@@ -2,16 +2,9 @@
 
 import streamlit as st
 from ..styles import badge
+from ...data.profiles import COMPANIES, EXPERIENCE, ROLES
 from ...data.question_bank import SKILLS
 
-ROLES = [
-    "ML Engineer", "Data Scientist", "AI Researcher",
-    "Deep Learning Engineer", "MLOps Engineer", "NLP Engineer",
-    "Computer Vision Engineer", "Data Engineer", "AI Product Manager",
-]
-COMPANIES  = ["FAANG / Big Tech", "Startup", "Research Lab", "Mid-size Tech", "Finance / Quant"]
-EXPERIENCE = ["Student", "Fresher / New Grad", "1-2 Years", "3-5 Years", "5+ Years"]
-
 
 def render(state):
     # ── Sidebar — Settings (API key lives here) ───────────────────
@@ -155,9 +148,12 @@ def render(state):
         from ...engine.interview_engine import InterviewEngine
         from ...database.base import SessionLocal, init_db
 
-        mock = not bool(state.api_key)
-        ai   = AIService(api_key=state.api_key or None, mock=mock)
-        state.mock_mode = mock
+        from ...config import settings
+
+        # The HTTP backend (local stand-in) needs no Gemini key
+        mock = not (state.api_key or settings.llm_backend != "gemini")
+        ai   = AIService.shared(api_key=state.api_key or None, mock=mock)
+        state.mock_mode = ai.mock
         init_db()
         db  = SessionLocal()
         eng = InterviewEngine(ai, db)
@@ -180,7 +176,7 @@ def render(state):
             "max_questions":   max_q,
         }
         state.current_question = first_q
-        state.answers, state.messages = [], []
+        state.answers, state.messages, state.pending_evals = [], [], []
         state.screen = "interview"
         db.close()
         st.rerun()
@@ -0,0 +1,68 @@
+"""
+Shared fixtures: a scratch SQLite database for the whole run, and the
+LLM stand-in (tools/standin_server.py) served in-process, so the real
+HTTP backend, router, governor and key pool are exercised offline.
+"""
+
+import os
+import tempfile
+import uuid
+
+# Before interview_platform is imported — database/base.py binds its engine at import
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(
+    tempfile.mkdtemp(prefix="aiip-tests-"), "aiip_test.db")
+
+import pytest
+
+from interview_platform.config import settings
+from interview_platform.database.base import engine, init_db
+from interview_platform.tools.standin_server import Latency, StandinConfig, start
+
+# Never let a test touch the repository's aiip_sessions.db
+if str(engine.url) != os.environ["DATABASE_URL"]:
+    raise RuntimeError(f"tests must run on the scratch database, not {engine.url}")
+init_db()
+
+QUESTION = "Explain the bias-variance trade-off."
+ANSWER = ("Bias is error from wrong assumptions, variance is error from sensitivity to the "
+          "training set. Regularisation and more data move a model along the trade-off; "
+          "cross-validation picks the point that generalises best.")
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    """Fresh model names per test: router windows and breakers are process-wide."""
+    tag = uuid.uuid4().hex[:8]
+    monkeypatch.setattr(settings, "gemini_model_eval",      f"eval-{tag}")
+    monkeypatch.setattr(settings, "gemini_model_strategy",  f"eval-{tag}")
+    monkeypatch.setattr(settings, "gemini_model_fallback",  f"fallback-{tag}")
+    monkeypatch.setattr(settings, "rate_limit_rpm",         10000.0)
+    monkeypatch.setattr(settings, "eval_cache_enabled",     False)
+    monkeypatch.setattr(settings, "strategy_cache_enabled", False)
+    monkeypatch.setattr(settings, "eval_deadline_s",        0)
+    monkeypatch.setattr(settings, "llm_cassette",           None)
+
+
+@pytest.fixture
+def key():
+    """An API key no other test has used (key pool state is process-wide)."""
+    return f"test-key-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """standin(**knobs) → a running stand-in server the http backend points at."""
+    servers = []
+
+    def _start(**knobs):
+        knobs.setdefault("latency", Latency("fixed:0.01"))
+        server, url = start(StandinConfig(seed=1, **knobs))
+        servers.append(server)
+        monkeypatch.setattr(settings, "llm_backend",     "http")
+        monkeypatch.setattr(settings, "llm_backend_url", url)
+        return server
+
+    yield _start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,53 @@
+"""AsyncAIService against the stand-in, and a shared batch under asyncio timeouts."""
+
+import asyncio
+import time
+
+import pytest
+
+from interview_platform.services.async_ai import AsyncAIService, BlockingAIService, run_sync
+from interview_platform.services.batcher import MicroBatcher
+
+from conftest import ANSWER, QUESTION
+
+
+def test_concurrent_evaluations_on_one_loop(standin, key):
+    server = standin()
+    aio    = AsyncAIService(api_key=key)
+
+    async def _all():
+        return await asyncio.gather(*(
+            aio.evaluate_answer(QUESTION, ANSWER, "Machine Learning", "medium")
+            for _ in range(3)))
+
+    for ev in run_sync(_all()):
+        assert not ev.get("failed") and 0.0 <= ev["overall_score"] <= 10.0
+    assert server.state.stats["calls"] >= 3
+
+
+def test_blocking_wrapper_matches_the_async_result(standin, key):
+    standin()
+    ev = BlockingAIService(api_key=key).evaluate_answer(QUESTION, ANSWER, "Machine Learning",
+                                                        "medium")
+    assert not ev.get("failed") and ev["ideal_answer"]
+
+
+def _slow_echo(items):
+    time.sleep(0.3)
+    return items
+
+
+def test_timed_out_waiter_does_not_cancel_the_shared_batch():
+    batcher = MicroBatcher(_slow_echo, 0.05, 8)
+    first, second = batcher.submit("a"), batcher.submit("b")
+
+    async def give_up():
+        # Unshielded on purpose: wait_for cancels what it wraps on timeout
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.wrap_future(first), 0.1)
+
+    asyncio.run(give_up())
+
+    assert not first.cancelled()
+    assert second.result(timeout=2) == "b"
+    assert first.result(timeout=2) == "a"
@@ -0,0 +1,44 @@
+"""The HTTP backend against the stand-in server (tools/standin_server.py)."""
+
+import json
+
+from interview_platform.config import settings
+from interview_platform.services.ai_service import AIService
+from interview_platform.services.backends import HTTPBackend
+from interview_platform.services.prompts import PASS1
+
+from conftest import ANSWER, QUESTION
+
+
+def test_http_backend_is_selected(standin, key):
+    standin()
+    assert isinstance(AIService(api_key=key).backend, HTTPBackend)
+
+
+def test_three_pass_evaluation(standin, key):
+    server = standin()
+    ev = AIService(api_key=key).evaluate_answer(QUESTION, ANSWER, "Machine Learning", "medium")
+
+    assert not ev.get("failed") and not ev.get("degraded")
+    for field in ("overall_score", "concept_score", "clarity_score", "confidence_score"):
+        assert 0.0 <= ev[field] <= 10.0
+    assert ev["ideal_answer"]
+    assert server.state.stats["calls"] >= 3            # Pass 1, 2 and 3 (+ ideal)
+
+
+def test_short_answer_is_gated_without_a_model_call(standin, key):
+    server = standin()
+    ev = AIService(api_key=key).evaluate_answer(QUESTION, "Not sure.", "Machine Learning",
+                                                "medium")
+    assert ev["reasoning"] == "Too short to evaluate."
+    assert server.state.stats["calls"] <= 1            # the ideal answer at most
+
+
+def test_backend_streams_in_chunks(standin, key):
+    standin(stream_chunk=16)
+    ai     = AIService(api_key=key)
+    prompt = PASS1.render(question=QUESTION, skill="Machine Learning", answer=ANSWER)
+    chunks = list(ai.backend.stream("eval", settings.gemini_model_eval, prompt))
+
+    assert len(chunks) > 1
+    assert "claimed_facts" in json.loads("".join(chunks))
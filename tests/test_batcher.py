@@ -0,0 +1,29 @@
+"""MicroBatcher: windows, batch size and per-item results."""
+
+import pytest
+
+from interview_platform.services.batcher import MicroBatcher
+
+
+def test_items_are_returned_in_order():
+    batcher = MicroBatcher(lambda items: [i * 2 for i in items], 0.01, 4)
+    futures = [batcher.submit(i) for i in range(10)]
+    assert [f.result(timeout=2) for f in futures] == [i * 2 for i in range(10)]
+
+
+def test_a_full_window_is_sent_without_waiting():
+    sizes   = []
+    batcher = MicroBatcher(lambda items: sizes.append(len(items)) or items, 60.0, 3)
+    futures = [batcher.submit(i) for i in range(6)]
+
+    assert [f.result(timeout=1) for f in futures] == list(range(6))
+    assert sizes == [3, 3]
+    assert batcher.metrics()["largest"] == 3 and batcher.metrics()["pending"] == 0
+
+
+def test_a_short_reply_fails_every_item_in_the_batch():
+    batcher = MicroBatcher(lambda items: items[:-1], 0.01, 2)
+    futures = [batcher.submit(i) for i in range(2)]
+    for fut in futures:
+        with pytest.raises(RuntimeError):
+            fut.result(timeout=2)
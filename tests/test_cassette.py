@@ -0,0 +1,46 @@
+"""Record / replay cassette (services/cassette.py) over the stand-in."""
+
+import asyncio
+
+from interview_platform.config import settings
+from interview_platform.services.backends import HTTPBackend
+from interview_platform.services.cassette import open_cassette
+from interview_platform.services.prompts import PASS1
+
+from conftest import ANSWER, QUESTION
+
+_PROMPT = PASS1.render(question=QUESTION, skill="Machine Learning", answer=ANSWER)
+
+
+def test_streams_keep_their_truncation_flag(standin, key, tmp_path):
+    standin(truncate_rate=1.0, stream_chunk=16)
+    path     = str(tmp_path / "tape.jsonl.gz")
+    recorder = open_cassette(path, "record", HTTPBackend(key))
+
+    finish = {}
+    text   = "".join(recorder.stream("eval", settings.gemini_model_eval, _PROMPT, None, finish))
+    assert finish == {"truncated": True}
+
+    async def _arecord():
+        end = {}
+        async for _ in recorder.astream("eval", settings.gemini_model_eval, _PROMPT, None, end):
+            pass
+        return end
+
+    assert asyncio.run(_arecord()) == {"truncated": True}
+    recorder.close()
+
+    replay = open_cassette(path, "replay", time_scale=0)
+    finish = {}
+    assert "".join(replay.stream("eval", settings.gemini_model_eval, _PROMPT, None, finish)) == text
+    assert finish == {"truncated": True}
+    assert replay.generate("eval", settings.gemini_model_eval, _PROMPT).truncated
+
+
+def test_time_scale_is_part_of_the_cassette_key(tmp_path):
+    path = str(tmp_path / "empty.jsonl.gz")
+    fast = open_cassette(path, "replay", time_scale=0)
+    real = open_cassette(path, "replay", time_scale=1.0)
+    assert fast is not real
+    assert (fast.time_scale, real.time_scale) == (0, 1.0)
+    assert fast.tape is real.tape
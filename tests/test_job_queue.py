@@ -0,0 +1,102 @@
+"""Durable evaluation queue (eval_jobs) and the eval_worker that drains it."""
+
+import random
+
+import pytest
+
+from interview_platform.config import settings
+from interview_platform.database.base import SessionLocal
+from interview_platform.database.models import Answer, EvalJob
+from interview_platform.services.job_queue import JobFailed, JobQueue
+from interview_platform.tools import eval_worker
+
+from conftest import ANSWER, QUESTION
+
+_QUESTION = {"question": QUESTION, "skill": "Machine Learning", "difficulty": "medium"}
+
+
+@pytest.fixture
+def queue():
+    """An empty queue — jobs left by an earlier test would be claimed first."""
+    db = SessionLocal()
+    try:
+        db.query(EvalJob).delete()
+        db.commit()
+    finally:
+        db.close()
+    return JobQueue()
+
+
+@pytest.fixture
+def session_id():
+    return random.randint(10 ** 6, 10 ** 9)
+
+
+def _answers(session_id: int) -> int:
+    db = SessionLocal()
+    try:
+        return db.query(Answer).filter(Answer.session_id == session_id).count()
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("concurrency", [0, 4])
+def test_worker_scores_and_stores_a_job(standin, key, queue, session_id, concurrency):
+    standin()
+    job_id = queue.enqueue(session_id, _QUESTION, ANSWER)
+
+    counts = eval_worker.work(threads=1, api_key=key, mock=False, drain=True,
+                              concurrency=concurrency)
+
+    assert counts == {"done": 1, "failed": 0}
+    ev = queue.handle(job_id).result(timeout=1)
+    assert 0.0 <= ev["overall_score"] <= 10.0
+    assert _answers(session_id) == 1
+
+
+@pytest.mark.parametrize("ev", [{"failed": True}, {"degraded": True, "overall_score": 4.0}])
+def test_unusable_scorecard_is_requeued_not_stored(queue, session_id, ev):
+    job_id = queue.enqueue(session_id, _QUESTION, ANSWER)
+    job    = queue.claim("w1")
+    assert job["job_id"] == job_id
+
+    assert eval_worker._finish(queue, job, "w1", ev) is False
+    assert queue.status(job_id)[0] == "queued"
+    assert _answers(session_id) == 0
+
+
+def test_fail_only_applies_to_the_claiming_worker(queue, session_id):
+    job_id = queue.enqueue(session_id, _QUESTION, ANSWER)
+    queue.claim("w1")
+
+    assert queue.fail(job_id, "w2", "not mine") is False
+    assert queue.status(job_id)[0] == "running"
+    assert queue.fail(job_id, "w1", "mine") is True
+    assert queue.status(job_id)[0] == "queued"
+
+
+def test_withdrawn_running_job_cannot_complete(queue, session_id):
+    job_id = queue.enqueue(session_id, _QUESTION, ANSWER)
+    queue.claim("w1")
+
+    assert queue.cancel(job_id) is False               # running — not without running=True
+    assert queue.cancel(job_id, running=True) is True
+    assert queue.complete(job_id, "w1", {"overall_score": 5.0}, []) is False
+
+
+def test_handle_of_unknown_job_finishes_failed(queue):
+    with pytest.raises(JobFailed):
+        queue.handle(-1).result(timeout=1)
+
+
+def test_worker_gives_up_on_a_dead_backend_without_storing(standin, key, queue, session_id,
+                                                           monkeypatch):
+    monkeypatch.setattr(settings, "eval_job_max_attempts", 2)
+    standin(error_rate=1.0)
+    job_id = queue.enqueue(session_id, _QUESTION, ANSWER)
+
+    counts = eval_worker.work(threads=1, api_key=key, mock=False, drain=True)
+
+    assert counts["done"] == 0 and counts["failed"] >= 2
+    assert queue.status(job_id)[0] == "failed"
+    assert _answers(session_id) == 0
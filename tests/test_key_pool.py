@@ -0,0 +1,29 @@
+"""Key rotation (services/key_pool.py)."""
+
+import uuid
+
+from interview_platform.config import settings
+from interview_platform.services.ai_service import AIService
+from interview_platform.services.key_pool import parse_keys
+
+
+def test_parse_keys():
+    assert parse_keys(" k1, k2:30 ,, k1:5") == [("k1", None), ("k2", 30.0)]
+    for bad in ("k:0", "k:-1", "k:abc", "k:inf", "k:nan"):
+        assert parse_keys(bad) == [("k", None)]
+    assert parse_keys(None) == []
+
+
+def test_quota_error_rotates_to_the_next_key(standin, monkeypatch):
+    monkeypatch.setattr(settings, "single_flight_enabled", False)
+    standin(quota_rpm=3)
+    tag     = uuid.uuid4().hex[:8]
+    ai      = AIService(api_key=f"first-{tag},second-{tag}")
+    profile = {"role": "ML Engineer", "company_type": "Startup", "experience": "1-2 Years"}
+
+    results = [ai.fresh_strategy(profile) for _ in range(5)]
+
+    assert all(ok for _, ok in results)                # the 429 was absorbed
+    first, second = ai.keys.metrics()
+    assert first["quota_errors"] == 1 and first["cooling_s"] > 0
+    assert second["calls"] >= 2 and second["quota_errors"] == 0
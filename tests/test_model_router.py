@@ -0,0 +1,48 @@
+"""Routing and the circuit breaker (services/model_router.py)."""
+
+import time
+
+from interview_platform.config import settings
+from interview_platform.services.ai_service import AIService
+from interview_platform.services.model_router import CALL, PROBE, CircuitBreaker, router
+
+from conftest import ANSWER, QUESTION
+
+
+def _half_open() -> CircuitBreaker:
+    breaker = CircuitBreaker(failures=1, cooldown_s=0.01)
+    breaker.record(False)
+    time.sleep(0.02)
+    assert breaker.state == "half-open"
+    return breaker
+
+
+def test_only_one_probe_while_half_open():
+    breaker = _half_open()
+    assert breaker.allow() == PROBE
+    assert breaker.allow() is None
+    breaker.record(True, PROBE)
+    assert breaker.state == "closed" and breaker.allow() == CALL
+
+
+def test_a_stale_call_does_not_end_the_probe():
+    breaker = _half_open()
+    assert breaker.allow() == PROBE
+    breaker.record(False, CALL)        # admitted before the breaker opened
+    time.sleep(0.02)
+    assert breaker.probing and breaker.allow() is None
+
+    breaker.record(False, PROBE)
+    assert breaker.state == "open" and not breaker.probing
+
+
+def test_router_falls_back_when_the_primary_is_down(standin, key):
+    standin(fail_models=frozenset({settings.gemini_model_eval}))
+    used = router.snapshot()["fallback_used"]
+    ev   = AIService(api_key=key).evaluate_answer(QUESTION, ANSWER, "Machine Learning", "medium")
+
+    assert not ev.get("failed")
+    snap = router.snapshot()
+    assert snap["fallback_used"] > used
+    assert snap["models"][settings.gemini_model_eval]["error_rate"] == 1.0
+    assert snap["models"][settings.gemini_model_fallback]["error_rate"] == 0.0
@@ -0,0 +1,37 @@
+"""tools/precompute_ideals.py against the stand-in."""
+
+from interview_platform.config import settings
+from interview_platform.config.settings import DEFAULT_DATABASE_URL
+from interview_platform.data.question_bank import question_hash
+from interview_platform.database.base import SessionLocal
+from interview_platform.database.models import IdealAnswer
+from interview_platform.tools import precompute_ideals
+
+_SKILL = "Bias-Variance Tradeoff"
+_ARGS  = ["--skill", _SKILL, "--difficulty", "easy", "--workers", "2"]
+
+
+def test_fills_missing_ideals_once(standin, key):
+    server = standin()
+    todo   = precompute_ideals.collect_missing(precompute_ideals.IdealAnswerStore(),
+                                               [_SKILL], ["easy"])
+    assert todo
+
+    assert precompute_ideals.main(_ARGS + ["--api-key", key]) == 0
+    db = SessionLocal()
+    try:
+        rows = {r.question_hash: r for r in db.query(IdealAnswer).all()}
+    finally:
+        db.close()
+    for _, question in todo:
+        row = rows[question_hash(question)]
+        assert row.answer_text and row.model == settings.gemini_model_strategy
+
+    calls = server.state.stats["calls"]
+    assert precompute_ideals.main(_ARGS + ["--api-key", key]) == 0     # nothing left
+    assert server.state.stats["calls"] == calls
+
+
+def test_mock_run_refuses_the_default_database(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", DEFAULT_DATABASE_URL)
+    assert precompute_ideals.main(["--mock"]) == 2
@@ -0,0 +1,29 @@
+"""tools/precompute_strategies.py against the stand-in."""
+
+import uuid
+
+from interview_platform.config import settings
+from interview_platform.config.settings import DEFAULT_DATABASE_URL
+from interview_platform.services.ai_service import AIService
+from interview_platform.tools import precompute_strategies
+
+_PROFILE = precompute_strategies.common_profiles()[0]
+
+
+def test_fills_missing_variants_once(standin, key):
+    server = standin()
+    store  = precompute_strategies.StrategyStore(f"test-{uuid.uuid4().hex[:8]}", pool_size=2)
+    todo   = precompute_strategies.collect_missing(store, [_PROFILE])
+    assert len(todo) == 2
+
+    summary = precompute_strategies.precompute(AIService(api_key=key), store, todo, 1)
+    assert summary["generated"] == 2 and not summary["failed"]
+    strategy, stored = store.sample(_PROFILE)
+    assert strategy and stored == 2
+    assert precompute_strategies.collect_missing(store, [_PROFILE]) == []
+    assert server.state.stats["calls"] >= 2
+
+
+def test_mock_run_refuses_the_default_database(monkeypatch):
+    monkeypatch.setattr(settings, "database_url", DEFAULT_DATABASE_URL)
+    assert precompute_strategies.main(["--mock"]) == 2
@@ -0,0 +1,28 @@
+"""Prefix accounting (services/prompt_cache.py)."""
+
+from types import SimpleNamespace
+
+from interview_platform.services.prompt_cache import PrefixStats
+from interview_platform.services.prompts import PASS1
+
+from conftest import ANSWER, QUESTION
+
+
+def test_prefix_is_estimated_and_provider_usage_counted():
+    stats  = PrefixStats()
+    prompt = PASS1.render(question=QUESTION, skill="Machine Learning", answer=ANSWER)
+    usage  = SimpleNamespace(prompt_token_count=400, cached_content_token_count=300)
+
+    stats.record(prompt)                                           # no usage reported
+    stats.record(prompt, SimpleNamespace(usage_metadata=usage))
+
+    m = stats.metrics()
+    assert m["calls"] == 2
+    assert m["prefix_tokens_sent"] == 2 * (len(prompt.prefix) // 4)
+    assert m["usage_reported"] == 1 and m["cached_share"] == 0.75
+
+
+def test_prompts_of_a_kind_share_the_prefix_byte_for_byte():
+    a = PASS1.render(question=QUESTION, skill="Machine Learning", answer=ANSWER)
+    b = PASS1.render(question="What is overfitting?", skill="Statistics", answer="It is …")
+    assert a.prefix == b.prefix and a.text.startswith(a.prefix)
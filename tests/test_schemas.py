@@ -0,0 +1,27 @@
+"""Structured-output validation (services/schemas.py)."""
+
+from interview_platform.services.ai_service import AIService
+from interview_platform.services.schemas import ScoreResult, validate
+
+_SCORES = {"overall_score": 6, "concept_score": "7.5", "clarity_score": 5, "confidence_score": 6}
+
+
+def test_null_optional_fields_are_dropped():
+    out = validate(ScoreResult, {**_SCORES, "strengths": None, "weak_skills": None,
+                                 "ideal_answer": None, "follow_up_question": None})
+    assert out == {"overall_score": 6.0, "concept_score": 7.5,
+                   "clarity_score": 5.0, "confidence_score": 6.0}
+
+
+def test_missing_required_field_fails_validation():
+    assert validate(ScoreResult, {**_SCORES, "overall_score": None}) is None
+
+
+def test_scorecard_applies_defaults_for_null_fields():
+    result = validate(ScoreResult, {**_SCORES, "strengths": None, "weak_skills": None,
+                                    "ideal_answer": None})
+    ev = AIService(mock=True)._scorecard(result, "Statistics", "The stored ideal.", None)
+
+    assert ev["strengths"] == "Attempted the question."
+    assert ev["weak_skills"] == ["Statistics"]
+    assert ev["ideal_answer"] == "The stored ideal."
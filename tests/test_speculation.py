@@ -0,0 +1,80 @@
+"""Speculative Pass 1 on the draft answer, reused at submit."""
+
+import json
+import time
+
+import pytest
+
+from interview_platform.config import settings
+from interview_platform.services.ai_service import AIService
+from interview_platform.services.pass_store import PassStore
+
+from conftest import ANSWER, QUESTION
+
+
+@pytest.fixture
+def speculating(standin, key, monkeypatch):
+    """An AIService with speculation on; records Pass 2 inputs and stored passes."""
+    monkeypatch.setattr(settings, "speculative_extraction", True)
+    monkeypatch.setattr(settings, "speculative_min_chars", 50)
+    standin()
+    ai = AIService(api_key=key)
+    seen = {"pass2": [], "stored": []}
+
+    eval_pass = ai._eval_pass
+
+    def _spy(name, template, fields, deadline=None):
+        if name == "pass2":
+            seen["pass2"].append(fields)
+        return eval_pass(name, template, fields, deadline)
+
+    save = PassStore.save
+
+    def _save(store, attempt_id, pass_name, result):
+        seen["stored"].append((pass_name, result))
+        save(store, attempt_id, pass_name, result)
+
+    monkeypatch.setattr(ai, "_eval_pass", _spy)
+    monkeypatch.setattr(PassStore, "save", _save)
+    return ai, seen
+
+
+def _speculate_then_submit(ai, key: str, final: str) -> dict:
+    assert ai.speculate_extraction(key, QUESTION, ANSWER, "Machine Learning")
+    time.sleep(0.3)                                     # let the draft's Pass 1 land
+    return ai.evaluate_answer(QUESTION, final, "Machine Learning", "medium", draft_key=key)
+
+
+def test_identical_draft_is_reused_and_stored_as_a_dict(speculating):
+    ai, seen = speculating
+    ev = _speculate_then_submit(ai, "s:1", ANSWER)
+
+    assert not ev.get("failed")
+    assert ai._speculative.metrics()["reused"] == 1
+    extracted = json.loads(seen["pass2"][0]["extracted"])
+    assert isinstance(extracted, dict) and "claimed_facts" in extracted
+    stored = dict(seen["stored"])
+    assert isinstance(stored["pass1"], dict) and "claimed_facts" in stored["pass1"]
+
+
+def test_near_match_draft_is_used_but_not_stored(speculating):
+    ai, seen = speculating
+    ev = _speculate_then_submit(ai, "s:2", ANSWER + " Done.")
+
+    assert not ev.get("failed")
+    assert ai._speculative.metrics()["reused"] == 1
+    assert isinstance(json.loads(seen["pass2"][0]["extracted"]), dict)
+    assert seen["stored"] == []
+
+
+def test_async_path_reuses_the_draft_as_a_dict(speculating):
+    from interview_platform.services.async_ai import AsyncAIService, run_sync
+    ai, seen = speculating
+    assert ai.speculate_extraction("s:3", QUESTION, ANSWER, "Machine Learning")
+    time.sleep(0.3)
+    ev = run_sync(AsyncAIService(core=ai).evaluate_answer(
+        QUESTION, ANSWER, "Machine Learning", "medium", draft_key="s:3"))
+
+    assert not ev.get("failed")
+    stored = dict(seen["stored"])
+    assert isinstance(stored["pass1"], dict) and "claimed_facts" in stored["pass1"]
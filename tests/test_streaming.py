@@ -0,0 +1,28 @@
+"""Streamed Pass 3 (stream_evaluation) against the stand-in."""
+
+from interview_platform.config import settings
+from interview_platform.services.ai_service import AIService
+
+from conftest import ANSWER, QUESTION
+
+
+def test_streamed_scorecard_reports_partials(standin, key, monkeypatch):
+    monkeypatch.setattr(settings, "stream_evaluation", True)
+    server   = standin(stream_chunk=16)
+    partials = []
+    ev = AIService(api_key=key).evaluate_answer(QUESTION, ANSWER, "Machine Learning", "medium",
+                                                on_partial=partials.append)
+
+    assert not ev.get("failed")
+    assert server.state.stats["streams"] == 1          # Pass 3 only
+    assert partials and all(isinstance(p, dict) for p in partials)
+
+
+def test_stream_off_makes_no_streaming_call(standin, key, monkeypatch):
+    monkeypatch.setattr(settings, "stream_evaluation", False)
+    server = standin(stream_chunk=16)
+    ev = AIService(api_key=key).evaluate_answer(QUESTION, ANSWER, "Machine Learning", "medium",
+                                                on_partial=lambda p: None)
+
+    assert not ev.get("failed")
+    assert server.state.stats["streams"] == 0